@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks
+==========
+
+Defines the *Airspeed Velocity* (asv) benchmarks suite, run with the
+*invoke benchmarks* task.
+"""
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Processing Benchmarks
+=========================
+
+Defines the *LUT* processing related benchmarks:
+
+-   :class:`benchmarks.luts.ReadWriteLUT1D`
+-   :class:`benchmarks.luts.ReadWriteLUT3D`
+-   :class:`benchmarks.luts.ApplyLUT1D`
+-   :class:`benchmarks.luts.ApplyLUT3D`
+-   :class:`benchmarks.luts.ApplyLUTSequence`
+
+The benchmarks use reproducible synthetic *LUTs* and images: the *LUT* tables
+are analytical and the images are generated with a seeded pseudo-random
+number generator.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+from abc import ABCMeta, abstractmethod
+from six import add_metaclass
+
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+from colour.io import LUT1D, LUT2D, LUT3D, LUTSequence, read_LUT, write_LUT
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'RANDOM_STATE_SEED', 'RESOLUTIONS', 'LUT_FORMAT_EXTENSIONS',
+    'TABLE_INTERPOLATORS', 'synthetic_LUT1D', 'synthetic_LUT3D',
+    'synthetic_image', 'ReadWriteLUT1D', 'ReadWriteLUT3D', 'ApplyLUT1D',
+    'ApplyLUT3D', 'ApplyLUTSequence'
+]
+
+RANDOM_STATE_SEED = 4
+"""
+Seed of the pseudo-random number generator used for the synthetic images.
+
+RANDOM_STATE_SEED : int
+"""
+
+RESOLUTIONS = {'HD': (1080, 1920), '4K': (2160, 3840)}
+"""
+Synthetic images resolutions.
+
+RESOLUTIONS : dict
+    **{'HD', '4K'}**
+"""
+
+LUT_FORMAT_EXTENSIONS = {
+    'Iridas Cube': '.cube',
+    'Resolve Cube': '.cube',
+    'Sony SPI1D': '.spi1d',
+    'Sony SPI3D': '.spi3d',
+    'Colour Binary': '.clb',
+}
+"""
+*LUT* formats extensions.
+
+LUT_FORMAT_EXTENSIONS : dict
+"""
+
+TABLE_INTERPOLATORS = {
+    'Trilinear': table_interpolation_trilinear,
+    'Tetrahedral': table_interpolation_tetrahedral,
+}
+"""
+Table interpolators.
+
+TABLE_INTERPOLATORS : dict
+    **{'Trilinear', 'Tetrahedral'}**
+"""
+
+
+def synthetic_LUT1D(size):
+    """
+    Returns a synthetic :class:`colour.LUT1D` class instance with given size,
+    its table is a gamma function.
+    """
+
+    return LUT1D(LUT1D.linear_table(size) ** (1 / 2.2), 'Synthetic 1D')
+
+
+def synthetic_LUT3D(size):
+    """
+    Returns a synthetic :class:`colour.LUT3D` class instance with given size,
+    its table is a gamma function of a channels mixing matrix so that the
+    channels are not independent, the matrix rows sum to 1 so that the table
+    stays within [0, 1].
+    """
+
+    M = np.array([[0.90, 0.07, 0.03], [0.05, 0.92, 0.03], [0.02, 0.08, 0.90]])
+
+    table = np.einsum('...ij,...j->...i', M, LUT3D.linear_table(size))
+
+    return LUT3D(table ** (1 / 2.2), 'Synthetic 3D')
+
+
+def synthetic_image(resolution):
+    """
+    Returns a reproducible synthetic *RGB* image with given resolution.
+    """
+
+    random_state = np.random.RandomState(RANDOM_STATE_SEED)
+
+    return random_state.random_sample(list(RESOLUTIONS[resolution]) + [3])
+
+
+@add_metaclass(ABCMeta)
+class _ReadWriteLUT:
+    """
+    Defines the base class for the *LUT* reading and writing benchmarks.
+
+    This is an :class:`ABCMeta` abstract class that must be inherited by
+    sub-classes.
+    """
+
+    def setup(self, method, size):
+        """
+        Writes the *LUT* to read to a temporary directory.
+        """
+
+        self._directory = tempfile.mkdtemp()
+        self._LUT = self.synthetic_LUT(method, size)
+
+        extension = LUT_FORMAT_EXTENSIONS[method]
+        self._read_path = os.path.join(self._directory,
+                                       'Read{0}'.format(extension))
+        self._write_path = os.path.join(self._directory,
+                                        'Write{0}'.format(extension))
+
+        write_LUT(self._LUT, self._read_path, method=method)
+
+    def teardown(self, method, size):
+        """
+        Removes the temporary directory.
+        """
+
+        shutil.rmtree(self._directory)
+
+    @abstractmethod
+    def synthetic_LUT(self, method, size):
+        """
+        Returns the synthetic *LUT* to read and write.
+        """
+
+        pass
+
+    def time_read(self, method, size):
+        """
+        Benchmarks :func:`colour.read_LUT` definition, note that the
+        *Colour Binary* format tables are mapped in memory and only read on
+        access.
+        """
+
+        read_LUT(self._read_path, method)
+
+    def time_write(self, method, size):
+        """
+        Benchmarks :func:`colour.write_LUT` definition.
+        """
+
+        write_LUT(self._LUT, self._write_path, method=method)
+
+
+class ReadWriteLUT1D(_ReadWriteLUT):
+    """
+    Defines the 1D and 2D *LUT* formats reading and writing benchmarks.
+
+    The sizes are typical of 1D *LUTs* which are significantly larger than
+    3D *LUTs*.
+    """
+
+    params = (['Iridas Cube', 'Sony SPI1D', 'Colour Binary'],
+              [1024, 4096, 65536])
+    param_names = ('method', 'size')
+
+    def synthetic_LUT(self, method, size):
+        """
+        Returns the synthetic :class:`colour.LUT1D` class instance, converted
+        to a :class:`colour.LUT2D` class instance for the *Iridas Cube*
+        format.
+        """
+
+        LUT = synthetic_LUT1D(size)
+
+        return LUT.as_LUT(LUT2D) if method == 'Iridas Cube' else LUT
+
+
+class ReadWriteLUT3D(_ReadWriteLUT):
+    """
+    Defines the 3D *LUT* formats reading and writing benchmarks.
+    """
+
+    params = (['Iridas Cube', 'Resolve Cube', 'Sony SPI3D', 'Colour Binary'],
+              [17, 33, 65])
+    param_names = ('method', 'size')
+
+    def synthetic_LUT(self, method, size):
+        """
+        Returns the synthetic :class:`colour.LUT3D` class instance.
+        """
+
+        return synthetic_LUT3D(size)
+
+
+class ApplyLUT1D(object):
+    """
+    Defines the :class:`colour.LUT1D` class application benchmarks.
+    """
+
+    params = (['HD', '4K'], )
+    param_names = ('resolution', )
+
+    def setup(self, resolution):
+        """
+        Creates the synthetic *LUT* and image.
+        """
+
+        self._LUT = synthetic_LUT1D(4096)
+        self._prepared_LUT = self._LUT.prepare()
+        self._RGB = synthetic_image(resolution)
+
+    def time_apply(self, resolution):
+        """
+        Benchmarks :meth:`colour.LUT1D.apply` method.
+        """
+
+        self._LUT.apply(self._RGB)
+
+    def time_apply_prepared(self, resolution):
+        """
+        Benchmarks :class:`colour.io.PreparedLUT` class application.
+        """
+
+        self._prepared_LUT(self._RGB)
+
+
+class ApplyLUT3D(object):
+    """
+    Defines the :class:`colour.LUT3D` class application benchmarks.
+    """
+
+    params = (['Trilinear', 'Tetrahedral'], ['HD', '4K'], [33, 65])
+    param_names = ('interpolator', 'resolution', 'size')
+    timeout = 240
+
+    def setup(self, interpolator, resolution, size):
+        """
+        Creates the synthetic *LUT* and image.
+        """
+
+        self._LUT = synthetic_LUT3D(size)
+        self._prepared_LUT = self._LUT.prepare(interpolator)
+        self._interpolator = TABLE_INTERPOLATORS[interpolator]
+        self._RGB = synthetic_image(resolution)
+
+    def time_apply(self, interpolator, resolution, size):
+        """
+        Benchmarks :meth:`colour.LUT3D.apply` method.
+        """
+
+        self._LUT.apply(self._RGB, self._interpolator)
+
+    def time_apply_tiled(self, interpolator, resolution, size):
+        """
+        Benchmarks :meth:`colour.LUT3D.apply` method tiled processing.
+        """
+
+        self._LUT.apply(self._RGB, self._interpolator, tile_size=2 ** 16)
+
+    def time_apply_prepared(self, interpolator, resolution, size):
+        """
+        Benchmarks :class:`colour.io.PreparedLUT` class application.
+        """
+
+        self._prepared_LUT(self._RGB)
+
+    def peakmem_apply(self, interpolator, resolution, size):
+        """
+        Benchmarks :meth:`colour.LUT3D.apply` method peak memory usage.
+        """
+
+        self._LUT.apply(self._RGB, self._interpolator)
+
+    def peakmem_apply_tiled(self, interpolator, resolution, size):
+        """
+        Benchmarks :meth:`colour.LUT3D.apply` method tiled processing peak
+        memory usage.
+        """
+
+        self._LUT.apply(self._RGB, self._interpolator, tile_size=2 ** 16)
+
+
+class ApplyLUTSequence(object):
+    """
+    Defines the :class:`colour.LUTSequence` class application benchmarks.
+    """
+
+    params = (['HD', '4K'], )
+    param_names = ('resolution', )
+    timeout = 240
+
+    def setup(self, resolution):
+        """
+        Creates the synthetic *LUT* sequence and image.
+        """
+
+        self._LUT_sequence = LUTSequence(
+            synthetic_LUT1D(4096),
+            synthetic_LUT3D(33),
+            synthetic_LUT1D(4096).as_LUT(LUT2D),
+        )
+        self._RGB = synthetic_image(resolution)
+
+    def time_apply(self, resolution):
+        """
+        Benchmarks :meth:`colour.LUTSequence.apply` method.
+        """
+
+        self._LUT_sequence.apply(self._RGB)
@@ -41,8 +41,9 @@ import sys
 from .utilities.deprecation import (FutureAccessChange, FutureAccessRemove,
                                     ModuleAPI, Removed, Renamed)
 from .utilities.documentation import is_documentation_building
-from .utilities.common import (domain_range_scale, get_domain_range_scale,
-                               set_domain_range_scale)
+from .utilities.common import (
+    domain_range_scale, get_domain_range_scale, set_domain_range_scale,
+    default_float_dtype, get_default_float_dtype, set_default_float_dtype)
 
 from .adaptation import (CHROMATIC_ADAPTATION_METHODS,
                          CHROMATIC_ADAPTATION_TRANSFORMS,
@@ -96,8 +97,8 @@ from .models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
     CAM16UCS_to_JMh_CAM16, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB, CV_range,
-    DECODING_CCTFS, DIN99_to_Lab, ENCODING_CCTFS, EOTFS, EOTFS_REVERSE,
-    HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB, HSV_to_RGB,
+    CV_table, DECODING_CCTFS, DIN99_to_Lab, ENCODING_CCTFS, EOTFS,
+    EOTFS_REVERSE, HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB, HSV_to_RGB,
     Hunter_Lab_to_XYZ, Hunter_Rdab_to_XYZ, ICTCP_to_RGB, IPT_hue_angle,
     IPT_to_XYZ, JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD,
     JMh_CAM16_to_CAM16UCS, JMh_CIECAM02_to_CAM02LCD, JMh_CIECAM02_to_CAM02SCD,
@@ -106,15 +107,15 @@ from .models import (
     Lab_to_XYZ, Luv_to_LCHuv, Luv_to_XYZ, Luv_to_uv, Luv_uv_to_xy, OETFS,
     OETFS_REVERSE, OOTFS, OOTFS_REVERSE, OSA_UCS_to_XYZ,
     POINTER_GAMUT_BOUNDARIES, POINTER_GAMUT_DATA, POINTER_GAMUT_ILLUMINANT,
-    Prismatic_to_RGB, RGB_COLOURSPACES, RGB_Colourspace, RGB_luminance,
-    RGB_luminance_equation, RGB_to_CMY, RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP,
-    RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr,
-    RGB_to_YcCbcCrc, RGB_to_YCoCg, UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy,
-    UVW_to_XYZ, XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab, XYZ_to_IPT,
-    XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab, XYZ_to_Luv,
-    XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW, XYZ_to_hdr_CIELab,
-    XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY, YCBCR_WEIGHTS,
-    YCbCr_to_RGB, YcCbcCrc_to_RGB, YCoCg_to_RGB,
+    Prismatic_to_RGB, RGB_COLOURSPACES, RGB_Colourspace, RGB_Transform,
+    RGB_luminance, RGB_luminance_equation, RGB_to_CMY, RGB_to_HSL, RGB_to_HSV,
+    RGB_to_ICTCP, RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_matrix, RGB_to_XYZ,
+    RGB_to_YCbCr, RGB_to_YcCbcCrc, RGB_to_YCoCg, TransferFunctionApproximation,
+    UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ, XYZ_to_Hunter_Lab,
+    XYZ_to_Hunter_Rdab, XYZ_to_IPT, XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966,
+    XYZ_to_Lab, XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW,
+    XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY,
+    YCBCR_WEIGHTS, YCbCr_to_RGB, YcCbcCrc_to_RGB, YCoCg_to_RGB,
     chromatically_adapted_primaries, decoding_cctf, encoding_cctf, eotf,
     eotf_reverse, full_to_legal, function_gamma, function_linear,
     hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ, legal_to_full, log_decoding_curve,
@@ -152,7 +153,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'domain_range_scale', 'get_domain_range_scale', 'set_domain_range_scale'
+    'domain_range_scale', 'get_domain_range_scale', 'set_domain_range_scale',
+    'default_float_dtype', 'get_default_float_dtype', 'set_default_float_dtype'
 ]
 __all__ += [
     'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
@@ -217,30 +219,31 @@ __all__ += [
     'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
     'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
     'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
-    'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'DECODING_CCTFS', 'DIN99_to_Lab',
-    'ENCODING_CCTFS', 'EOTFS', 'EOTFS_REVERSE', 'HDR_CIELAB_METHODS',
-    'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB', 'Hunter_Lab_to_XYZ',
-    'Hunter_Rdab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle', 'IPT_to_XYZ',
-    'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
-    'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
-    'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ', 'LCHab_to_Lab',
-    'LCHuv_to_Luv', 'LOG_DECODING_CURVES', 'LOG_ENCODING_CURVES',
-    'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ', 'Luv_to_LCHuv', 'Luv_to_XYZ',
-    'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS', 'OETFS_REVERSE', 'OOTFS',
-    'OOTFS_REVERSE', 'OSA_UCS_to_XYZ', 'POINTER_GAMUT_BOUNDARIES',
-    'POINTER_GAMUT_DATA', 'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB',
-    'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_luminance',
+    'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'CV_table', 'DECODING_CCTFS',
+    'DIN99_to_Lab', 'ENCODING_CCTFS', 'EOTFS', 'EOTFS_REVERSE',
+    'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
+    'Hunter_Lab_to_XYZ', 'Hunter_Rdab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle',
+    'IPT_to_XYZ', 'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD',
+    'JMh_CAM16_to_CAM16UCS', 'JMh_CIECAM02_to_CAM02LCD',
+    'JMh_CIECAM02_to_CAM02SCD', 'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ',
+    'LCHab_to_Lab', 'LCHuv_to_Luv', 'LOG_DECODING_CURVES',
+    'LOG_ENCODING_CURVES', 'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ',
+    'Luv_to_LCHuv', 'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS',
+    'OETFS_REVERSE', 'OOTFS', 'OOTFS_REVERSE', 'OSA_UCS_to_XYZ',
+    'POINTER_GAMUT_BOUNDARIES', 'POINTER_GAMUT_DATA',
+    'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB', 'RGB_COLOURSPACES',
+    'RGB_Colourspace', 'RGB_Transform', 'RGB_luminance',
     'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
     'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_matrix',
     'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc', 'RGB_to_YCoCg',
-    'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy', 'UVW_to_XYZ',
-    'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT', 'XYZ_to_JzAzBz',
-    'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_OSA_UCS',
-    'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab',
-    'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY',
-    'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB', 'YCoCg_to_RGB',
-    'chromatically_adapted_primaries', 'decoding_cctf', 'encoding_cctf',
-    'eotf', 'eotf_reverse', 'full_to_legal', 'function_gamma',
+    'TransferFunctionApproximation', 'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy',
+    'UVW_to_XYZ', 'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT',
+    'XYZ_to_JzAzBz', 'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv',
+    'XYZ_to_OSA_UCS', 'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW',
+    'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy',
+    'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB',
+    'YCoCg_to_RGB', 'chromatically_adapted_primaries', 'decoding_cctf',
+    'encoding_cctf', 'eotf', 'eotf_reverse', 'full_to_legal', 'function_gamma',
     'function_linear', 'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ', 'legal_to_full',
     'log_decoding_curve', 'log_encoding_curve', 'normalised_primary_matrix',
     'oetf', 'oetf_reverse', 'ootf', 'ootf_reverse', 'primaries_whitepoint',
@@ -28,7 +28,8 @@ from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
 
 from .dataset import *  # noqa
 from . import dataset
-from .vonkries import (chromatic_adaptation_matrix_VonKries,
+from .vonkries import (CHROMATIC_ADAPTATION_MATRICES_CACHE,
+                       chromatic_adaptation_matrix_VonKries,
                        chromatic_adaptation_VonKries)
 from .fairchild1990 import chromatic_adaptation_Fairchild1990
 from .cmccat2000 import (
@@ -40,6 +41,7 @@ from .cie1994 import chromatic_adaptation_CIE1994
 __all__ = []
 __all__ += dataset.__all__
 __all__ += [
+    'CHROMATIC_ADAPTATION_MATRICES_CACHE',
     'chromatic_adaptation_matrix_VonKries', 'chromatic_adaptation_VonKries'
 ]
 __all__ += ['chromatic_adaptation_Fairchild1990']
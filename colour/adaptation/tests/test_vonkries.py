@@ -10,7 +10,8 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.adaptation import (chromatic_adaptation_matrix_VonKries,
+from colour.adaptation import (CHROMATIC_ADAPTATION_MATRICES_CACHE,
+                               chromatic_adaptation_matrix_VonKries,
                                chromatic_adaptation_VonKries)
 from colour.utilities import domain_range_scale, ignore_numpy_errors
 
@@ -134,6 +135,80 @@ chromatic_adaptation_matrix_VonKries` definition n-dimensional arrays support.
         np.testing.assert_almost_equal(
             chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr), M, decimal=7)
 
+    def test_batched_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition arrays of distinct whitepoints
+        support.
+        """
+
+        XYZ_w = np.array([
+            [0.95045593, 1.00000000, 1.08905775],
+            [1.09846607, 1.00000000, 0.35582280],
+            [0.96429568, 1.00000000, 0.82510460],
+            [0.94972420, 1.00000000, 1.22638000],
+        ])
+        XYZ_wr = XYZ_w[::-1]
+
+        for transform in ('CAT02', 'Bradford', 'XYZ Scaling'):
+            M = [
+                chromatic_adaptation_matrix_VonKries(XYZ_w[i], XYZ_wr[i],
+                                                     transform)
+                for i in range(len(XYZ_w))
+            ]
+            np.testing.assert_almost_equal(
+                chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform),
+                M,
+                decimal=15)
+
+            M = [
+                chromatic_adaptation_matrix_VonKries(XYZ_w[i], XYZ_wr[0],
+                                                     transform)
+                for i in range(len(XYZ_w))
+            ]
+            np.testing.assert_almost_equal(
+                chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr[0],
+                                                     transform),
+                M,
+                decimal=15)
+
+    def test_cache_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition cache.
+        """
+
+        CHROMATIC_ADAPTATION_MATRICES_CACHE.clear()
+
+        XYZ_w = np.array([0.95045593, 1.00000000, 1.08905775])
+        XYZ_wr = np.array([0.96429568, 1.00000000, 0.82510460])
+        M = chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr)
+
+        np.testing.assert_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr), M)
+        self.assertEqual(CHROMATIC_ADAPTATION_MATRICES_CACHE.hits, 1)
+        self.assertEqual(CHROMATIC_ADAPTATION_MATRICES_CACHE.misses, 1)
+
+        # Distinct transforms must not collide.
+        self.assertFalse(
+            np.allclose(
+                chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr,
+                                                     'Bradford'), M))
+        self.assertEqual(len(CHROMATIC_ADAPTATION_MATRICES_CACHE), 2)
+
+        # Returned matrices must not alias the cached matrices.
+        chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr)[...] = 0
+        np.testing.assert_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr), M)
+
+        # Arrays of whitepoints are not cached.
+        chromatic_adaptation_matrix_VonKries(
+            np.tile(XYZ_w, (6, 1)), np.tile(XYZ_wr, (6, 1)))
+        self.assertEqual(len(CHROMATIC_ADAPTATION_MATRICES_CACHE), 2)
+
+        CHROMATIC_ADAPTATION_MATRICES_CACHE.clear()
+        self.assertEqual(len(CHROMATIC_ADAPTATION_MATRICES_CACHE), 0)
+
     def test_domain_range_scale_chromatic_adaptation_VonKries(self):
         """
         Tests :func:`colour.adaptation.vonkries.\
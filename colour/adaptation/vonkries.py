@@ -5,6 +5,7 @@ Von Kries Chromatic Adaptation Model
 
 Defines *Von Kries* chromatic adaptation model objects:
 
+-   :attr:`colour.adaptation.CHROMATIC_ADAPTATION_MATRICES_CACHE`
 -   :func:`colour.adaptation.chromatic_adaptation_matrix_VonKries`
 -   :func:`colour.adaptation.chromatic_adaptation_VonKries`
 
@@ -26,8 +27,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
-from colour.utilities import (dot_matrix, dot_vector, from_range_1,
-                              row_as_diagonal, to_domain_1)
+from colour.utilities import (LRUCache, dot_matrix, dot_vector, from_range_1,
+                              to_domain_1)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -37,9 +38,52 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
+    'CHROMATIC_ADAPTATION_MATRICES_CACHE',
+    'CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS',
     'chromatic_adaptation_matrix_VonKries', 'chromatic_adaptation_VonKries'
 ]
 
+CHROMATIC_ADAPTATION_MATRICES_CACHE = LRUCache(maximum_size=256)
+CHROMATIC_ADAPTATION_MATRICES_CACHE.__doc__ = """
+*Chromatic adaptation* matrices cache used by
+:func:`colour.adaptation.chromatic_adaptation_matrix_VonKries` definition.
+
+The matrices are keyed by the test and reference viewing conditions
+whitepoints rounded to
+:attr:`colour.adaptation.vonkries.CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS`
+decimals and the chromatic adaptation transform matrix, thus transforms
+sharing a name but with a different matrix do not collide, the least recently
+used matrices are discarded when the cache holds more than 256 matrices. The
+:attr:`colour.utilities.LRUCache.statistics` attribute and
+:meth:`colour.utilities.LRUCache.clear` method allow inspecting and clearing
+the cache.
+
+CHROMATIC_ADAPTATION_MATRICES_CACHE : LRUCache
+"""
+
+CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS = 12
+"""
+Decimals the whitepoints are rounded to when building the
+:attr:`colour.adaptation.CHROMATIC_ADAPTATION_MATRICES_CACHE` attribute keys.
+
+CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS : int
+"""
+
+
+def _chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, M):
+    """
+    Computes the *chromatic adaptation* matrices from test viewing conditions
+    to reference viewing conditions using given chromatic adaptation transform
+    matrix.
+
+    The diagonal gain matrices are never built: the transform matrix rows are
+    scaled by the cone responses ratios instead.
+    """
+
+    D = dot_vector(M, XYZ_wr) / dot_vector(M, XYZ_w)
+
+    return dot_matrix(np.linalg.inv(M), D[..., np.newaxis] * M)
+
 
 def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     """
@@ -61,7 +105,9 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     Returns
     -------
     ndarray
-        Chromatic adaptation matrix :math:`M_{cat}`.
+        Chromatic adaptation matrix :math:`M_{cat}`, an array of matrices with
+        shape (..., 3, 3) if the whitepoints are arrays of *CIE XYZ*
+        tristimulus values.
 
     Raises
     ------
@@ -70,6 +116,10 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
 
     Notes
     -----
+    -   The matrices computed for a single pair of whitepoints are memoised in
+        :attr:`colour.adaptation.CHROMATIC_ADAPTATION_MATRICES_CACHE`
+        attribute, arrays of whitepoints are processed at once and are not
+        memoised.
 
     +------------+-----------------------+---------------+
     | **Domain** | **Scale - Reference** | **Scale - 1** |
@@ -103,6 +153,13 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     array([[ 1.0479297...,  0.0229468..., -0.0501922...],
            [ 0.0296278...,  0.9904344..., -0.0170738...],
            [-0.0092430...,  0.0150551...,  0.7518742...]])
+
+    Using arrays of whitepoints:
+
+    >>> XYZ_w = np.array([[0.95045593, 1.00000000, 1.08905775],
+    ...                   [1.09846607, 1.00000000, 0.35582280]])
+    >>> chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr).shape
+    (2, 3, 3)
     """
 
     XYZ_w = to_domain_1(XYZ_w)
@@ -116,17 +173,23 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
             'methods: "{1}".'.format(transform,
                                      CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
 
-    rgb_w = np.einsum('...i,...ij->...j', XYZ_w, np.transpose(M))
-    rgb_wr = np.einsum('...i,...ij->...j', XYZ_wr, np.transpose(M))
+    if XYZ_w.ndim > 1 or XYZ_wr.ndim > 1:
+        return _chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, M)
 
-    D = rgb_wr / rgb_w
+    # :func:`np.rint` definition is significantly faster than
+    # :func:`np.round` definition on small arrays.
+    scale = 10 ** CHROMATIC_ADAPTATION_MATRICES_CACHE_DECIMALS
+    key = (np.rint(XYZ_w * scale).astype(np.float64).tobytes(),
+           np.rint(XYZ_wr * scale).astype(np.float64).tobytes(),
+           np.asarray(M, np.float64).tobytes())
 
-    D = row_as_diagonal(D)
+    M_CAT = CHROMATIC_ADAPTATION_MATRICES_CACHE.get(key)
+    if M_CAT is None:
+        M_CAT = _chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, M)
 
-    M_CAT = dot_matrix(np.linalg.inv(M), D)
-    M_CAT = dot_matrix(M_CAT, M)
+        CHROMATIC_ADAPTATION_MATRICES_CACHE[key] = M_CAT
 
-    return M_CAT
+    return np.copy(M_CAT)
 
 
 def chromatic_adaptation_VonKries(XYZ, XYZ_w, XYZ_wr, transform='CAT02'):
@@ -64,9 +64,9 @@ from collections import OrderedDict, Mapping
 from six.moves import reduce
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              as_float, interval, is_integer, is_numeric,
-                              closest_indexes, tsplit, warning)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
+                              get_default_float_dtype, interval, is_integer,
+                              is_numeric, closest_indexes, tsplit, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -717,7 +717,8 @@ class LinearInterpolator(object):
         Dependent and already known :math:`y` variable values to
         interpolate.
     dtype : type
-        Data type used for internal conversions.
+        Data type used for internal conversions, default to the current
+        *Colour* default floating point number dtype.
 
     Attributes
     ----------
@@ -731,6 +732,9 @@ class LinearInterpolator(object):
     Notes
     -----
     -   This class is a wrapper around *numpy.interp* definition.
+    -   *numpy.interp* definition computes in double precision, the
+        interpolated values are converted back to the current *Colour* default
+        floating point number dtype.
 
     Examples
     --------
@@ -750,10 +754,10 @@ class LinearInterpolator(object):
     array([ 6.7825,  8.5075])
     """
 
-    def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
+    def __init__(self, x, y, dtype=None):
         self._x = None
         self._y = None
-        self._dtype = dtype
+        self._dtype = get_default_float_dtype() if dtype is None else dtype
 
         self.x = x
         self.y = y
@@ -1553,6 +1557,44 @@ def lagrange_coefficients(r, n=4):
     return np.array(L_n)
 
 
+def _table_indexes_and_relative_coordinates(V_xyz, table):
+    """
+    Computes the floor and ceiling indexes encompassing given :math:`V_{xyz}`
+    values in given interpolation table and the indexes relative
+    :math:`V_{xyzr}` coordinates.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to transform to indexes relative
+        :math:`V_{xyzr}` values.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    tuple
+        Floor indexes, ceiling indexes and indexes relative :math:`V_{xyzr}`
+        coordinates, reshaped to (-1, 3).
+    """
+
+    V_xyz = np.reshape(np.clip(V_xyz, 0, 1), (-1, 3))
+
+    # Indexes computations where ``i_m`` is the maximum index value on a given
+    # table axis, ``i_f`` and ``i_c`` respectively the floor and ceiling
+    # indexes encompassing a given V_xyz value.
+    i_m = np.array(np.shape(table)[0:-1]) - 1
+    i_f = np.floor(V_xyz * i_m).astype(DEFAULT_INT_DTYPE)
+    i_c = np.clip(i_f + 1, 0, i_m)
+
+    # Relative to indexes ``V_xyz`` values, computed in-place so that they
+    # keep ``V_xyz`` dtype.
+    V_xyzr = V_xyz * i_m.astype(V_xyz.dtype)
+    V_xyzr -= i_f
+
+    return i_f, i_c, V_xyzr
+
+
 def vertices_and_relative_coordinates(V_xyz, table):
     """
     Computes the vertices coordinates and indexes relative :math:`V_{xyzr}`
@@ -1626,20 +1668,9 @@ def vertices_and_relative_coordinates(V_xyz, table):
      [ 0.9288233...  0.0186907...  0.7589470...]]
     """
 
-    V_xyz = np.clip(V_xyz, 0, 1)
     table = as_float_array(table)
 
-    V_xyz = np.reshape(V_xyz, (-1, 3))
-
-    # Indexes computations where ``i_m`` is the maximum index value on a given
-    # table axis, ``i_f`` and ``i_c`` respectively the floor and ceiling
-    # indexes encompassing a given V_xyz value.
-    i_m = np.array(table.shape[0:-1]) - 1
-    i_f = np.floor(V_xyz * i_m).astype(DEFAULT_INT_DTYPE)
-    i_c = np.clip(i_f + 1, 0, i_m)
-
-    # Relative to indexes ``V_xyz`` values.
-    V_xyzr = i_m * V_xyz - i_f
+    i_f, i_c, V_xyzr = _table_indexes_and_relative_coordinates(V_xyz, table)
 
     i_f_c = i_f, i_c
 
@@ -1732,6 +1763,16 @@ def table_interpolation_tetrahedral(V_xyz, table):
     ndarray
         Interpolated :math:`V_{xyz}` values.
 
+    Notes
+    -----
+    -   Only the 4 vertices of the simplex encompassing each :math:`V_{xyz}`
+        value are gathered from the table and a single tetrahedron formula is
+        evaluated.
+    -   The peak memory usage is bounded by about 136 bytes per
+        :math:`V_{xyz}` value, i.e. about 136MiB per megapixel
+        (:math:`2^{20}` values) with *float64* data, output included and
+        independently of the table size.
+
     References
     ----------
     :cite:`Kirk2006`
@@ -1759,28 +1800,45 @@ def table_interpolation_tetrahedral(V_xyz, table):
     """
 
     V_xyz = as_float_array(V_xyz)
+    table = as_float_array(table)
 
-    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
-
-    vertices = np.moveaxis(vertices, 0, -1)
-    V000, V001, V010, V011, V100, V101, V110, V111 = tsplit(vertices)
-    x, y, z = [r[:, np.newaxis] for r in tsplit(V_xyzr)]
-
-    xyz_o = np.select([
-        np.logical_and(x > y, y > z),
-        np.logical_and(x > y, x > z),
-        np.logical_and(x > y, np.logical_and(y <= z, x <= z)),
-        np.logical_and(x <= y, z > y),
-        np.logical_and(x <= y, z > x),
-        np.logical_and(x <= y, np.logical_and(z <= y, z <= x)),
-    ], [
-        (1 - x) * V000 + (x - y) * V100 + (y - z) * V110 + z * V111,
-        (1 - x) * V000 + (x - z) * V100 + (z - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - x) * V001 + (x - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - y) * V001 + (y - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - z) * V010 + (z - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
-    ])
+    i_f, i_c, V_xyzr = _table_indexes_and_relative_coordinates(V_xyz, table)
+
+    # The table is flattened so that a vertex is gathered with a single index,
+    # ``i_s`` being the flat index step along each axis from the floor to the
+    # ceiling vertex, i.e. null where a ``V_xyz`` value lies on the table
+    # upper boundary.
+    strides = np.array([table.shape[1] * table.shape[2], table.shape[2], 1])
+    table = np.reshape(table, (-1, table.shape[-1]))
+    i_0 = np.dot(i_f, strides)
+    i_s = (i_c - i_f) * strides
+    del i_f, i_c
+
+    # The simplex containing a ``V_xyz`` value is indexed by its relative
+    # coordinates ordering and defined by the axes sorted by decreasing
+    # relative coordinates: its vertices are reached by successively stepping
+    # along those axes from the floor vertex to the ceiling vertex. Orderings
+    # 1 and 6 are impossible and simply repeat their neighbours.
+    x, y, z = [V_xyzr[..., i] for i in range(3)]
+    simplex = 4 * (x > y) + 2 * (y > z) + (x > z)
+    del x, y, z
+
+    axes = np.array([[2, 1, 0], [2, 1, 0], [1, 2, 0], [1, 0, 2], [2, 0, 1],
+                     [0, 2, 1], [0, 1, 2], [0, 1, 2]])[simplex]
+    axes += 3 * np.arange(V_xyzr.shape[0])[..., np.newaxis]
+    del simplex
+
+    r_1, r_2, r_3 = tsplit(np.take(V_xyzr, axes))
+    i_s = np.take(i_s, axes)
+    i_1 = i_0 + i_s[..., 0]
+    i_2 = i_1 + i_s[..., 1]
+    i_3 = i_2 + i_s[..., 2]
+    del V_xyzr, axes, i_s
+
+    xyz_o = (1 - r_1)[..., np.newaxis] * np.take(table, i_0, axis=0)
+    xyz_o += (r_1 - r_2)[..., np.newaxis] * np.take(table, i_1, axis=0)
+    xyz_o += (r_2 - r_3)[..., np.newaxis] * np.take(table, i_2, axis=0)
+    xyz_o += r_3[..., np.newaxis] * np.take(table, i_3, axis=0)
 
     xyz_o = np.reshape(xyz_o, V_xyz.shape)
 
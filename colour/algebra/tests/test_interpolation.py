@@ -25,7 +25,7 @@ from colour.algebra import (
     table_interpolation_tetrahedral)
 from colour.algebra import random_triplet_generator
 from colour.io import read_LUT
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -870,6 +870,33 @@ table_interpolation_tetrahedral` definition.
                 [0.47688455, 0.67128537, 0.28398836],
             ]))
 
+    def test_n_dimensional_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition n-dimensional arrays support.
+        """
+
+        samples = np.linspace(0, 1, 5)
+        table = tstack(np.meshgrid(samples, samples, samples, indexing='ij'))
+
+        V_xyz = np.array([
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0],
+            [0.2, 0.2, 0.7],
+            [0.5, 0.1, 0.5],
+            [0.9, 1.0, 0.3],
+            [1.5, -0.5, 0.6],
+        ])
+        V_xyz_o = np.clip(V_xyz, 0, 1)
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, table), V_xyz_o)
+
+        V_xyz = np.reshape(V_xyz, (2, 3, 3))
+        V_xyz_o = np.reshape(V_xyz_o, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, table), V_xyz_o)
+
 
 if __name__ == '__main__':
     unittest.main()
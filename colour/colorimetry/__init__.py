@@ -21,13 +21,16 @@ from .tristimulus import (SPECTRAL_TO_XYZ_METHODS,
                           MULTI_SPECTRAL_TO_XYZ_METHODS)
 from .tristimulus import spectral_to_XYZ, multi_spectral_to_XYZ
 from .tristimulus import (
-    ASTME30815_PRACTISE_SHAPE, lagrange_coefficients_ASTME202211,
+    ASTME30815_PRACTISE_SHAPE, TRISTIMULUS_WEIGHTING_FACTORS_CACHE,
+    lagrange_coefficients_ASTME202211,
     tristimulus_weighting_factors_ASTME202211,
+    multi_tristimulus_weighting_factors_ASTME202211,
     adjust_tristimulus_weighting_factors_ASTME30815,
     spectral_to_XYZ_integration,
     spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
-    spectral_to_XYZ_ASTME30815, multi_spectral_to_XYZ_integration,
-    wavelength_to_XYZ)
+    interpolate_20nm_ASTME30815, spectral_to_XYZ_ASTME30815,
+    multi_spectral_to_XYZ_integration, multi_spectral_to_XYZ_ASTME30815,
+    chunked_multi_spectral_to_XYZ, wavelength_to_XYZ)
 from .correction import BANDPASS_CORRECTION_METHODS
 from .correction import bandpass_correction
 from .correction import bandpass_correction_Stearns1988
@@ -82,13 +85,16 @@ __all__ += ['multi_led_spd', 'multi_led_spd_Ohno2005']
 __all__ += ['SPECTRAL_TO_XYZ_METHODS', 'MULTI_SPECTRAL_TO_XYZ_METHODS']
 __all__ += ['spectral_to_XYZ', 'multi_spectral_to_XYZ']
 __all__ += [
-    'ASTME30815_PRACTISE_SHAPE', 'lagrange_coefficients_ASTME202211',
+    'ASTME30815_PRACTISE_SHAPE', 'TRISTIMULUS_WEIGHTING_FACTORS_CACHE',
+    'lagrange_coefficients_ASTME202211',
     'tristimulus_weighting_factors_ASTME202211',
+    'multi_tristimulus_weighting_factors_ASTME202211',
     'adjust_tristimulus_weighting_factors_ASTME30815',
     'spectral_to_XYZ_integration',
     'spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
-    'spectral_to_XYZ_ASTME30815', 'multi_spectral_to_XYZ_integration',
-    'wavelength_to_XYZ'
+    'interpolate_20nm_ASTME30815', 'spectral_to_XYZ_ASTME30815',
+    'multi_spectral_to_XYZ_integration', 'multi_spectral_to_XYZ_ASTME30815',
+    'chunked_multi_spectral_to_XYZ', 'wavelength_to_XYZ'
 ]
 __all__ += ['BANDPASS_CORRECTION_METHODS']
 __all__ += ['bandpass_correction']
@@ -12,20 +12,26 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 
 from colour.algebra import LinearInterpolator
-from colour.colorimetry import (CMFS, CIE_standard_illuminant_A_function,
-                                ILLUMINANTS_SPDS, SpectralPowerDistribution,
-                                SpectralShape)
+from colour.colorimetry import (
+    CMFS, CIE_standard_illuminant_A_function, ILLUMINANTS_SPDS,
+    MultiSpectralPowerDistribution, SpectralPowerDistribution, SpectralShape,
+    TRISTIMULUS_WEIGHTING_FACTORS_CACHE)
 from colour.colorimetry import (
     lagrange_coefficients_ASTME202211,
     tristimulus_weighting_factors_ASTME202211,
+    multi_tristimulus_weighting_factors_ASTME202211,
     adjust_tristimulus_weighting_factors_ASTME30815,
     spectral_to_XYZ_integration,
     spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
-    spectral_to_XYZ_ASTME30815, multi_spectral_to_XYZ_integration,
-    wavelength_to_XYZ)
+    interpolate_20nm_ASTME30815, spectral_to_XYZ_ASTME30815,
+    multi_spectral_to_XYZ_integration, multi_spectral_to_XYZ_ASTME30815,
+    multi_spectral_to_XYZ, chunked_multi_spectral_to_XYZ, wavelength_to_XYZ)
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -41,9 +47,13 @@ __all__ = [
     'D65_CIE_1931_2_20_ATWF', 'MSA', 'XYZ_D65',
     'TestLagrangeCoefficientsASTME202211',
     'TestTristimulusWeightingFactorsASTME202211',
+    'TestMultiTristimulusWeightingFactorsASTME202211',
     'TestAdjustTristimulusWeightingFactorsASTME30815',
-    'TestSpectral_to_XYZ_integration', 'TestSpectral_to_XYZ_ASTME30815',
-    'TestMultiSpectral_to_XYZ_integration', 'TestWavelength_to_XYZ'
+    'TestSpectral_to_XYZ_integration', 'TestInterpolate20nmASTME30815',
+    'TestSpectral_to_XYZ_ASTME30815',
+    'TestMultiSpectral_to_XYZ_integration',
+    'TestMultiSpectral_to_XYZ_ASTME30815',
+    'TestChunkedMultiSpectral_to_XYZ', 'TestWavelength_to_XYZ'
 ]
 
 SAMPLE_SPD = SpectralPowerDistribution({
@@ -400,6 +410,93 @@ tristimulus_weighting_factors_ASTME202211` definition.
         np.testing.assert_almost_equal(
             np.round(twf, 3), D65_CIE_1931_2_20_TWF, decimal=3)
 
+    def test_cache_tristimulus_weighting_factors_ASTME202211(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME202211` definition cache.
+        """
+
+        TRISTIMULUS_WEIGHTING_FACTORS_CACHE.clear()
+
+        cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(360, 830, 20)
+        D65 = ILLUMINANTS_SPDS['D65'].copy().align(cmfs.shape)
+        twf = tristimulus_weighting_factors_ASTME202211(cmfs, D65, shape)
+
+        np.testing.assert_equal(
+            tristimulus_weighting_factors_ASTME202211(cmfs, D65, shape), twf)
+        self.assertEqual(TRISTIMULUS_WEIGHTING_FACTORS_CACHE.hits, 1)
+        self.assertEqual(TRISTIMULUS_WEIGHTING_FACTORS_CACHE.misses, 1)
+
+        # Distinct spectral data sharing the same name must not collide.
+        A = ILLUMINANTS_SPDS['A'].copy().align(cmfs.shape)
+        A.name = D65.name
+        self.assertFalse(
+            np.allclose(
+                tristimulus_weighting_factors_ASTME202211(cmfs, A, shape),
+                twf))
+        self.assertEqual(len(TRISTIMULUS_WEIGHTING_FACTORS_CACHE), 2)
+
+        # Returned tables must not alias the cached tables.
+        tristimulus_weighting_factors_ASTME202211(cmfs, D65, shape)[...] = 0
+        np.testing.assert_equal(
+            tristimulus_weighting_factors_ASTME202211(cmfs, D65, shape), twf)
+
+        TRISTIMULUS_WEIGHTING_FACTORS_CACHE.clear()
+        self.assertEqual(len(TRISTIMULUS_WEIGHTING_FACTORS_CACHE), 0)
+        self.assertEqual(TRISTIMULUS_WEIGHTING_FACTORS_CACHE.nbytes, 0)
+
+
+class TestMultiTristimulusWeightingFactorsASTME202211(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_tristimulus_weighting_factors_ASTME202211` definition unit tests methods.
+    """
+
+    def test_multi_tristimulus_weighting_factors_ASTME202211(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_tristimulus_weighting_factors_ASTME202211` definition.
+        """
+
+        cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        illuminants = [
+            ILLUMINANTS_SPDS[illuminant].copy().align(cmfs.shape)
+            for illuminant in ('A', 'D65', 'F2')
+        ]
+        msa = MultiSpectralPowerDistribution(
+            np.transpose([illuminant.values for illuminant in illuminants]),
+            cmfs.wavelengths)
+
+        for interval in (5, 10, 20):
+            shape = SpectralShape(360, 830, interval)
+            W = multi_tristimulus_weighting_factors_ASTME202211(
+                cmfs, msa, shape)
+            for i, illuminant in enumerate(illuminants):
+                np.testing.assert_almost_equal(
+                    W[i],
+                    tristimulus_weighting_factors_ASTME202211(
+                        cmfs, illuminant, shape),
+                    decimal=7)
+
+            np.testing.assert_almost_equal(
+                multi_tristimulus_weighting_factors_ASTME202211(
+                    cmfs, np.transpose(msa.values), shape),
+                W,
+                decimal=7)
+
+    def test_raise_exception_multi_tristimulus_weighting_factors_ASTME202211(
+            self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_tristimulus_weighting_factors_ASTME202211` definition raised exception.
+        """
+
+        cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        self.assertRaises(
+            ValueError, multi_tristimulus_weighting_factors_ASTME202211, cmfs,
+            np.ones([2, 10]), SpectralShape(360, 830, 10))
+
 
 class TestAdjustTristimulusWeightingFactorsASTME30815(unittest.TestCase):
     """
@@ -551,6 +648,48 @@ range scale support.
                     decimal=7)
 
 
+class TestInterpolate20nmASTME30815(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.interpolate_20nm_ASTME30815`
+    definition unit tests methods.
+    """
+
+    def test_interpolate_20nm_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+interpolate_20nm_ASTME30815` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            interpolate_20nm_ASTME30815(
+                np.array([0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651])),
+            np.array([
+                0.06410000, 0.06538750, 0.06450000, 0.06053125, 0.05620000,
+                0.05429375, 0.05370000, 0.05406875, 0.05590000, 0.05962500,
+                0.06510000
+            ]),
+            decimal=7)
+
+    def test_n_dimensional_interpolate_20nm_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+interpolate_20nm_ASTME30815` definition n-dimensional arrays support.
+        """
+
+        R = np.array([0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651])
+        R_i = interpolate_20nm_ASTME30815(R)
+
+        R = np.tile(R, (6, 1))
+        R_i = np.tile(R_i, (6, 1))
+        np.testing.assert_almost_equal(
+            interpolate_20nm_ASTME30815(R), R_i, decimal=7)
+
+        R = np.reshape(R, (2, 3, 6))
+        R_i = np.reshape(R_i, (2, 3, 11))
+        np.testing.assert_almost_equal(
+            interpolate_20nm_ASTME30815(R), R_i, decimal=7)
+
+
 class TestSpectral_to_XYZ_ASTME30815(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.tristimulus.spectral_to_XYZ_ASTME30815`
@@ -830,6 +969,274 @@ multi_spectral_to_XYZ_integration` definition domain and range scale support.
                     decimal=7)
 
 
+    def test_multi_spectral_power_distribution_multi_spectral_to_XYZ_integration(  # noqa
+            self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition with
+        :class:`colour.MultiSpectralPowerDistribution` class instance input.
+        """
+
+        cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        msa = np.reshape(MSA, (-1, 6))
+        msd = MultiSpectralPowerDistribution(
+            np.transpose(msa),
+            SpectralShape(400, 700, 60).range())
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(msd, None, cmfs,
+                                              ILLUMINANTS_SPDS['D65']),
+            np.reshape(XYZ_D65, (-1, 3)),
+            decimal=7)
+
+
+class TestMultiSpectral_to_XYZ_ASTME30815(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        wl = self._cmfs.shape.range()
+        self._A = SpectralPowerDistribution(
+            dict(zip(wl, CIE_standard_illuminant_A_function(wl))),
+            name='A (360, 830, 1)')
+
+    def test_multi_spectral_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition.
+        """
+
+        spd = SAMPLE_SPD.copy()
+        spds = [spd, spd * 0.5, spd ** 2]
+
+        for shape in (SpectralShape(360, 780, 1), SpectralShape(400, 700, 5),
+                      SpectralShape(340, 830, 5), SpectralShape(360, 780, 10),
+                      SpectralShape(400, 700, 10), SpectralShape(
+                          360, 820, 20), SpectralShape(400, 700, 20)):
+            aligned_spds = [spd.copy().align(shape) for spd in spds]
+            msa = [aligned_spd.values for aligned_spd in aligned_spds]
+
+            for use_practice_range in (True, False):
+                for method in (True, False):
+                    np.testing.assert_almost_equal(
+                        multi_spectral_to_XYZ_ASTME30815(
+                            msa, shape, self._cmfs, self._A,
+                            use_practice_range, method, method),
+                        [
+                            spectral_to_XYZ_ASTME30815(
+                                aligned_spd, self._cmfs, self._A,
+                                use_practice_range, method, method)
+                            for aligned_spd in aligned_spds
+                        ],
+                        decimal=7)
+
+    def test_n_dimensional_multi_spectral_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition n-dimensional arrays support.
+        """
+
+        shape = SpectralShape(400, 700, 20)
+        msa = SAMPLE_SPD.copy().align(shape).values
+        XYZ = multi_spectral_to_XYZ_ASTME30815(msa, shape, self._cmfs,
+                                               self._A)
+
+        msa = np.tile(msa, (6, 1))
+        XYZ = np.tile(XYZ, (6, 1))
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_ASTME30815(msa, shape, self._cmfs,
+                                             self._A),
+            XYZ,
+            decimal=7)
+
+        msa = np.reshape(msa, (2, 3, -1))
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_ASTME30815(msa, shape, self._cmfs,
+                                             self._A),
+            XYZ,
+            decimal=7)
+
+    def test_domain_range_scale_multi_spectral_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition domain and range scale support.
+        """
+
+        shape = SpectralShape(400, 700, 10)
+        msa = SAMPLE_SPD.copy().align(shape).values
+        XYZ = multi_spectral_to_XYZ_ASTME30815(msa, shape, self._cmfs,
+                                               self._A)
+
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    multi_spectral_to_XYZ_ASTME30815(msa, shape, self._cmfs,
+                                                     self._A),
+                    XYZ * factor,
+                    decimal=7)
+
+    def test_raise_exception_multi_spectral_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, multi_spectral_to_XYZ_ASTME30815,
+                          np.ones(11), SpectralShape(400, 700, 30))
+
+
+class TestChunkedMultiSpectral_to_XYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+chunked_multi_spectral_to_XYZ` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        self._shape = SpectralShape(400, 700, 20)
+        self._msa = np.reshape(
+            np.random.RandomState(4).random_sample(
+                7 * 11 * len(self._shape.range())), (7, 11, -1))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_chunked_multi_spectral_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+chunked_multi_spectral_to_XYZ` definition.
+        """
+
+        for method in ('Integration', 'ASTM E308-15'):
+            XYZ = multi_spectral_to_XYZ(
+                self._msa, self._shape, self._cmfs, method=method)
+
+            for chunk_size, processes in ((1, 1), (13, 1), (13, 3),
+                                          (2 ** 14, 2)):
+                np.testing.assert_almost_equal(
+                    chunked_multi_spectral_to_XYZ(
+                        self._msa,
+                        self._shape,
+                        self._cmfs,
+                        method=method,
+                        chunk_size=chunk_size,
+                        processes=processes),
+                    XYZ,
+                    decimal=7)
+
+        XYZ = multi_spectral_to_XYZ(
+            self._msa, self._shape, self._cmfs, method='ASTM E308-15',
+            mi_20nm_interpolation_method=False)
+        np.testing.assert_almost_equal(
+            chunked_multi_spectral_to_XYZ(
+                self._msa, self._shape, self._cmfs, method='ASTM E308-15',
+                mi_20nm_interpolation_method=False),
+            XYZ,
+            decimal=7)
+
+    def test_memmap_chunked_multi_spectral_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+chunked_multi_spectral_to_XYZ` definition memory-mapped arrays support.
+        """
+
+        msa = np.memmap(
+            os.path.join(self._temporary_directory, 'msa.bin'),
+            dtype=np.float32,
+            mode='w+',
+            shape=self._msa.shape)
+        msa[:] = self._msa
+        msa.flush()
+
+        out = np.memmap(
+            os.path.join(self._temporary_directory, 'XYZ.bin'),
+            dtype=np.float64,
+            mode='w+',
+            shape=self._msa.shape[:-1] + (3, ))
+
+        XYZ = chunked_multi_spectral_to_XYZ(
+            msa, self._shape, self._cmfs, out=out, chunk_size=10, processes=2)
+
+        self.assertIs(XYZ, out)
+        np.testing.assert_almost_equal(
+            out,
+            multi_spectral_to_XYZ(np.asarray(msa), self._shape, self._cmfs),
+            decimal=7)
+
+    def test_iterator_chunked_multi_spectral_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+chunked_multi_spectral_to_XYZ` definition iterators support.
+        """
+
+        XYZ = multi_spectral_to_XYZ(self._msa, self._shape, self._cmfs)
+
+        for processes in (1, 3):
+            np.testing.assert_almost_equal(
+                list(
+                    chunked_multi_spectral_to_XYZ(
+                        iter(self._msa),
+                        self._shape,
+                        self._cmfs,
+                        processes=processes)),
+                XYZ,
+                decimal=7)
+
+            out = np.zeros(XYZ.shape)
+            chunked_multi_spectral_to_XYZ(
+                (scanline for scanline in self._msa),
+                self._shape,
+                self._cmfs,
+                out=out,
+                processes=processes)
+            np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+    def test_raise_exception_chunked_multi_spectral_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+chunked_multi_spectral_to_XYZ` definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            chunked_multi_spectral_to_XYZ,
+            self._msa,
+            self._shape,
+            out=np.zeros([7, 3]))
+
+        self.assertRaises(
+            ValueError,
+            chunked_multi_spectral_to_XYZ,
+            self._msa,
+            self._shape,
+            out=np.zeros([11, 7, 3]).transpose([1, 0, 2]))
+
+        self.assertRaises(
+            ValueError,
+            chunked_multi_spectral_to_XYZ,
+            iter(self._msa),
+            self._shape,
+            out=np.zeros([6, 11, 3]))
+
+
 class TestWavelength_to_XYZ(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.tristimulus.wavelength_to_XYZ` definition
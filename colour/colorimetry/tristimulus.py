@@ -6,13 +6,17 @@ Tristimulus Values
 Defines objects for tristimulus values computation from spectral data:
 
 -   :func:`colour.colorimetry.tristimulus_weighting_factors_ASTME202211`
+-   :func:`colour.colorimetry.multi_tristimulus_weighting_factors_ASTME202211`
 -   :func:`colour.colorimetry.spectral_to_XYZ_integration`
 -   :func:`colour.colorimetry.\
 spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815`
+-   :func:`colour.colorimetry.interpolate_20nm_ASTME30815`
 -   :func:`colour.colorimetry.spectral_to_XYZ_ASTME30815`
 -   :func:`colour.spectral_to_XYZ`
 -   :func:`colour.colorimetry.multi_spectral_to_XYZ_integration`
+-   :func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`
 -   :func:`colour.multi_spectral_to_XYZ`
+-   :func:`colour.colorimetry.chunked_multi_spectral_to_XYZ`
 -   :func:`colour.wavelength_to_XYZ`
 
 The default implementation is based on practise *ASTM E308-15* method.
@@ -32,14 +36,20 @@ References
 
 from __future__ import division, unicode_literals
 
+import hashlib
+import itertools
 import numpy as np
+from multiprocessing.pool import ThreadPool
 
 from colour.algebra import lagrange_coefficients
-from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE, SpectralShape,
-                                STANDARD_OBSERVERS_CMFS, ones_spd)
+from colour.colorimetry import (
+    DEFAULT_SPECTRAL_SHAPE, MultiSpectralPowerDistribution,
+    SpectralPowerDistribution, SpectralShape, STANDARD_OBSERVERS_CMFS,
+    ones_spd)
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100, tsplit, warning)
+from colour.utilities import (CaseInsensitiveMapping, LRUCache,
+                              as_float_array, filter_kwargs, from_range_100,
+                              tsplit, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -49,14 +59,18 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'ASTME30815_PRACTISE_SHAPE', 'lagrange_coefficients_ASTME202211',
+    'ASTME30815_PRACTISE_SHAPE', 'TRISTIMULUS_WEIGHTING_FACTORS_CACHE',
+    'lagrange_coefficients_ASTME202211',
     'tristimulus_weighting_factors_ASTME202211',
+    'multi_tristimulus_weighting_factors_ASTME202211',
     'adjust_tristimulus_weighting_factors_ASTME30815',
     'spectral_to_XYZ_integration',
     'spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
-    'spectral_to_XYZ_ASTME30815', 'SPECTRAL_TO_XYZ_METHODS', 'spectral_to_XYZ',
-    'multi_spectral_to_XYZ_integration', 'MULTI_SPECTRAL_TO_XYZ_METHODS',
-    'multi_spectral_to_XYZ', 'wavelength_to_XYZ'
+    'interpolate_20nm_ASTME30815', 'spectral_to_XYZ_ASTME30815',
+    'SPECTRAL_TO_XYZ_METHODS', 'spectral_to_XYZ',
+    'multi_spectral_to_XYZ_integration', 'multi_spectral_to_XYZ_ASTME30815',
+    'MULTI_SPECTRAL_TO_XYZ_METHODS', 'multi_spectral_to_XYZ',
+    'chunked_multi_spectral_to_XYZ', 'wavelength_to_XYZ'
 ]
 
 ASTME30815_PRACTISE_SHAPE = DEFAULT_SPECTRAL_SHAPE
@@ -72,7 +86,22 @@ ASTME30815_PRACTISE_SHAPE : SpectralShape
 
 _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = None
 
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE = None
+TRISTIMULUS_WEIGHTING_FACTORS_CACHE = LRUCache(maximum_bytes=2 ** 24)
+TRISTIMULUS_WEIGHTING_FACTORS_CACHE.__doc__ = """
+Tables of tristimulus weighting factors cache used by
+:func:`colour.colorimetry.tristimulus_weighting_factors_ASTME202211`
+definition.
+
+The tables are keyed by a digest of the colour matching functions and
+illuminant spectral data along the shape interval, the least recently used
+tables are discarded when the cache bytes size exceeds its
+:attr:`colour.utilities.LRUCache.maximum_bytes` attribute value, 16 MiB by
+default. The :attr:`colour.utilities.LRUCache.statistics` attribute and
+:meth:`colour.utilities.LRUCache.clear` method allow inspecting and clearing
+the cache.
+
+TRISTIMULUS_WEIGHTING_FACTORS_CACHE : LRUCache
+"""
 
 
 def lagrange_coefficients_ASTME202211(interval=10, interval_type='inner'):
@@ -144,6 +173,84 @@ def lagrange_coefficients_ASTME202211(interval=10, interval_type='inner'):
     return lica
 
 
+def _tristimulus_weighting_factors_ASTME202211(Y, S, interval):
+    """
+    Computes the tristimulus weighting factors table(s) for given colour
+    matching functions and illuminant(s) values using practise
+    *ASTM E2022-11* method.
+
+    The computation is expressed with matrix products of the *Lagrange
+    Coefficients* with the measurement intervals of the product of the
+    illuminant(s) and colour matching functions, it is vectorised over the
+    leading axes of the illuminant(s) values.
+
+    Parameters
+    ----------
+    Y : array_like, (bins, 3)
+        Colour matching functions values at 1 nm interval.
+    S : array_like, (..., bins)
+        Illuminant(s) values at 1 nm interval.
+    interval : numeric
+        Measurement interval in nm.
+
+    Returns
+    -------
+    ndarray, (..., intervals, 3)
+        Tristimulus weighting factors table(s).
+    """
+
+    Y = as_float_array(Y)
+    S = as_float_array(S)
+
+    interval_i = DEFAULT_INT_DTYPE(interval)
+
+    P = S[..., np.newaxis] * Y
+    W = np.copy(P[..., ::interval_i, :])
+
+    # Total wavelengths count.
+    w_c = Y.shape[0]
+    # Measurement interval interpolated values count.
+    r_c = interval_i - 1
+    # Last interval first interpolated wavelength.
+    w_lif = w_c - (w_c - 1) % interval_i - 1 - r_c
+
+    # Intervals count.
+    i_c = W.shape[-2]
+    i_cm = i_c - 1
+
+    if r_c > 0:
+        # First and last measurement intervals *Lagrange Coefficients*.
+        c_c = lagrange_coefficients_ASTME202211(interval_i, 'boundary')
+        # Intermediate measurement intervals *Lagrange Coefficients*.
+        c_b = lagrange_coefficients_ASTME202211(interval_i, 'inner')
+
+        # First interval.
+        W[..., :3, :] += np.einsum('jk,...ji->...ki', c_c,
+                                   P[..., 1:r_c + 1, :])
+
+        # Last interval.
+        W[..., i_cm - 2:, :] += np.einsum(
+            'jk,...ji->...ki', c_c[::-1],
+            P[..., w_lif:w_lif + r_c, :])[..., ::-1, :]
+
+        # Intermediate intervals, the contribution of the interpolated values
+        # of any given interval is distributed over 4 consecutive intervals.
+        w_i = (interval_i * np.arange(1, i_c - 2)[:, np.newaxis] + 1 +
+               np.arange(r_c))
+        W_i = np.einsum('km,...jki->...mji', c_b, P[..., w_i, :])
+        for i in range(4):
+            W[..., i:i + i_c - 3, :] += W_i[..., i, :, :]
+
+    # Extrapolation of potential incomplete interval.
+    W[..., i_cm, :] += np.sum(
+        P[..., DEFAULT_INT_DTYPE(w_c - ((w_c - 1) % interval_i)):, :],
+        axis=-2)
+
+    W *= (100 / np.sum(W, axis=-2)[..., 1])[..., np.newaxis, np.newaxis]
+
+    return W
+
+
 def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
     """
     Returns a table of tristimulus weighting factors for given colour matching
@@ -172,20 +279,14 @@ def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
         If the colour matching functions or illuminant intervals are not equal
         to 1 nm.
 
-    Warning
-    -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
-
     Notes
     -----
+    -   The tables of tristimulus weighting factors are cached in
+        :attr:`colour.colorimetry.TRISTIMULUS_WEIGHTING_FACTORS_CACHE`
+        attribute. Their identifier key is a digest of the colour matching
+        functions and illuminant spectral data along the current shape
+        interval, thus distinct spectral data sharing the same name do not
+        collide.
     -   Input colour matching functions and illuminant intervals are expected
         to be equal to 1 nm. If the illuminant data is not available at 1 nm
         interval, it needs to be interpolated using *CIE* recommendations:
@@ -244,67 +345,95 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _TRISTIMULUS_WEIGHTING_FACTORS_CACHE
-    if _TRISTIMULUS_WEIGHTING_FACTORS_CACHE is None:
-        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = CaseInsensitiveMapping()
+    digest_twf = hashlib.sha1()
+    for array in (cmfs.wavelengths, cmfs.values, illuminant.wavelengths,
+                  illuminant.values, shape.interval):
+        digest_twf.update(np.ascontiguousarray(array, np.float64).tobytes())
+    key_twf = digest_twf.hexdigest()
 
-    name_twf = ', '.join((cmfs.name, illuminant.name, str(shape)))
-    if name_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
-        return _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf]
+    W = TRISTIMULUS_WEIGHTING_FACTORS_CACHE.get(key_twf)
+    if W is None:
+        W = _tristimulus_weighting_factors_ASTME202211(
+            cmfs.values, illuminant.values, shape.interval)
 
-    Y = cmfs.values
-    S = illuminant.values
+        TRISTIMULUS_WEIGHTING_FACTORS_CACHE[key_twf] = W
 
-    interval_i = DEFAULT_INT_DTYPE(shape.interval)
-    W = S[::interval_i, np.newaxis] * Y[::interval_i, :]
+    return np.copy(W)
 
-    # First and last measurement intervals *Lagrange Coefficients*.
-    c_c = lagrange_coefficients_ASTME202211(interval_i, 'boundary')
-    # Intermediate measurement intervals *Lagrange Coefficients*.
-    c_b = lagrange_coefficients_ASTME202211(interval_i, 'inner')
 
-    # Total wavelengths count.
-    w_c = len(Y)
-    # Measurement interval interpolated values count.
-    r_c = c_b.shape[0]
-    # Last interval first interpolated wavelength.
-    w_lif = w_c - (w_c - 1) % interval_i - 1 - r_c
+def multi_tristimulus_weighting_factors_ASTME202211(cmfs, illuminants, shape):
+    """
+    Returns the tables of tristimulus weighting factors for given colour
+    matching functions and multiple illuminants using practise
+    *ASTM E2022-11* method.
 
-    # Intervals count.
-    i_c = W.shape[0]
-    i_cm = i_c - 1
+    The tables are built simultaneously for all the illuminants and are not
+    cached.
 
-    for i in range(3):
-        # First interval.
-        for j in range(r_c):
-            for k in range(3):
-                W[k, i] = W[k, i] + c_c[j, k] * S[j + 1] * Y[j + 1, i]
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminants : MultiSpectralPowerDistribution or array_like
+        Illuminants multi-spectral power distribution or array of illuminants
+        values with the wavelengths in the last axis, e.g. an array with shape
+        (N, bins). The illuminants are expected to be sampled with the same
+        spectral shape than the colour matching functions.
+    shape : SpectralShape
+        Shape used to build the tables, only the interval is needed.
 
-        # Last interval.
-        for j in range(r_c):
-            for k in range(i_cm, i_cm - 3, -1):
-                W[k, i] = (W[k, i] + c_c[r_c - j - 1, i_cm - k] * S[j + w_lif]
-                           * Y[j + w_lif, i])
+    Returns
+    -------
+    ndarray, (N, intervals, 3)
+        Tristimulus weighting factors tables.
 
-        # Intermediate intervals.
-        for j in range(i_c - 3):
-            for k in range(r_c):
-                w_i = (r_c + 1) * (j + 1) + 1 + k
-                W[j, i] = W[j, i] + c_b[k, 0] * S[w_i] * Y[w_i, i]
-                W[j + 1, i] = W[j + 1, i] + c_b[k, 1] * S[w_i] * Y[w_i, i]
-                W[j + 2, i] = W[j + 2, i] + c_b[k, 2] * S[w_i] * Y[w_i, i]
-                W[j + 3, i] = W[j + 3, i] + c_b[k, 3] * S[w_i] * Y[w_i, i]
+    Raises
+    ------
+    ValueError
+        If the colour matching functions or illuminants intervals are not
+        equal to 1 nm or if the illuminants values are not matching the colour
+        matching functions wavelengths count.
 
-        # Extrapolation of potential incomplete interval.
-        for j in range(
-                DEFAULT_INT_DTYPE(w_c - ((w_c - 1) % interval_i)), w_c, 1):
-            W[i_cm, i] = W[i_cm, i] + S[j] * Y[j, i]
+    References
+    ----------
+    :cite:`ASTMInternational2011a`
 
-    W *= 100 / np.sum(W, axis=0)[1]
+    Examples
+    --------
+    >>> from colour import (CMFS, CIE_standard_illuminant_A_function,
+    ...     MultiSpectralPowerDistribution, SpectralShape, ones_spd)
+    >>> cmfs = CMFS['CIE 1964 10 Degree Standard Observer']
+    >>> wl = cmfs.shape.range()
+    >>> illuminants = MultiSpectralPowerDistribution(
+    ...     np.transpose([CIE_standard_illuminant_A_function(wl),
+    ...                   ones_spd(cmfs.shape).values]), wl)
+    >>> W = multi_tristimulus_weighting_factors_ASTME202211(
+    ...     cmfs, illuminants, SpectralShape(360, 830, 20))
+    >>> W.shape
+    (2, 24, 3)
+    >>> W[0, 9]  # doctest: +ELLIPSIS
+    array([  5.6770329...,  14.4609708...,   0.1958194...])
+    """
+
+    if cmfs.shape.interval != 1:
+        raise ValueError('"{0}" shape "interval" must be 1!'.format(cmfs))
 
-    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf] = W
+    if isinstance(illuminants, MultiSpectralPowerDistribution):
+        if illuminants.shape.interval != 1:
+            raise ValueError(
+                '"{0}" shape "interval" must be 1!'.format(illuminants))
 
-    return W
+        illuminants = np.transpose(illuminants.values)
+
+    S = np.atleast_2d(as_float_array(illuminants))
+    if S.shape[-1] != len(cmfs.wavelengths):
+        raise ValueError(
+            'Illuminants values count "{0}" is not matching "{1}" colour '
+            'matching functions wavelengths count "{2}"!'.format(
+                S.shape[-1], cmfs.name, len(cmfs.wavelengths)))
+
+    return _tristimulus_weighting_factors_ASTME202211(cmfs.values, S,
+                                                      shape.interval)
 
 
 def adjust_tristimulus_weighting_factors_ASTME30815(W, shape_r, shape_t):
@@ -383,6 +512,57 @@ def adjust_tristimulus_weighting_factors_ASTME30815(W, shape_r, shape_t):
     return W[start_index:-end_index or None, ...]
 
 
+def _integration_kernel(cmfs, illuminant):
+    """
+    Returns the normalised integration kernel, i.e. the product of the colour
+    matching functions, the illuminant and the measurement interval, for given
+    colour matching functions and illuminant sharing the same spectral shape.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (bins, 3)
+        Integration kernel.
+    """
+
+    K = cmfs.values * illuminant.values[..., np.newaxis] * cmfs.shape.interval
+    K *= 100 / np.sum(K[..., 1])
+
+    return K
+
+
+def _unpack_multi_spectral_array(msa, shape):
+    """
+    Unpacks given multi-spectral array :math:`msa` and spectral shape: if a
+    multi-spectral power distribution is given, its values are transposed so
+    that the wavelengths are in the last axis and its spectral shape is
+    returned.
+
+    Parameters
+    ----------
+    msa : array_like or MultiSpectralPowerDistribution
+        Multi-spectral array :math:`msa`.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array :math:`msa`.
+
+    Returns
+    -------
+    tuple
+        Multi-spectral array :math:`msa` and spectral shape.
+    """
+
+    if isinstance(msa, MultiSpectralPowerDistribution):
+        return np.transpose(msa.values), msa.shape
+
+    return as_float_array(msa), shape
+
+
 def spectral_to_XYZ_integration(
         spd,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
@@ -568,6 +748,57 @@ def spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
     return from_range_100(XYZ)
 
 
+def interpolate_20nm_ASTME30815(R):
+    """
+    Interpolates given 20 nm measurement intervals spectral data to 10 nm
+    measurement intervals using practise *ASTM E308-15* method: the spectral
+    data is padded with an additional 20 nm interval at each end using
+    *Lagrange* extrapolation and the intermediate values are computed with
+    a third-degree *Lagrange* interpolation.
+
+    Parameters
+    ----------
+    R : array_like
+        Spectral data with 20 nm measurement intervals, the wavelengths are
+        expected to be in the last axis, e.g. for 1000 spectral distributions
+        with 16 bins, ``R`` shape should be (1000, 16).
+
+    Returns
+    -------
+    ndarray
+        Spectral data with 10 nm measurement intervals, for 1000 spectral
+        distributions with 16 bins, the output shape will be (1000, 31).
+
+    References
+    ----------
+    :cite:`ASTMInternational2015b`
+
+    Examples
+    --------
+    >>> R = np.array([0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651])
+    >>> interpolate_20nm_ASTME30815(R)  # doctest: +ELLIPSIS
+    array([ 0.0641    ,  0.0653875 ,  0.0645    ,  0.06053125,  0.0562    ,
+            0.05429375,  0.0537    ,  0.05406875,  0.0559    ,  0.059625  ,
+            0.0651    ])
+    """
+
+    R = as_float_array(R)
+
+    # Extrapolation of additional 20nm padding intervals.
+    R_s = 3 * R[..., 0] - 3 * R[..., 1] + R[..., 2]
+    R_e = R[..., -3] - 3 * R[..., -2] + 3 * R[..., -1]
+    R_p = np.concatenate([R_s[..., np.newaxis], R, R_e[..., np.newaxis]],
+                         axis=-1)
+
+    R_i = np.zeros(R.shape[:-1] + (R.shape[-1] * 2 - 1, ))
+    R_i[..., ::2] = R
+    # Interpolating every odd numbered values.
+    R_i[..., 1::2] = (-0.0625 * R_p[..., :-3] + 0.5625 * R_p[..., 1:-2] +
+                      0.5625 * R_p[..., 2:-1] - 0.0625 * R_p[..., 3:])
+
+    return R_i
+
+
 def spectral_to_XYZ_ASTME30815(
         spd,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
@@ -606,20 +837,11 @@ def spectral_to_XYZ_ASTME30815(
     ndarray, (3,)
         *CIE XYZ* tristimulus values.
 
-    Warning
-    -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
-
     Notes
     -----
+    -   The tables of tristimulus weighting factors are cached in
+        :attr:`colour.colorimetry.TRISTIMULUS_WEIGHTING_FACTORS_CACHE`
+        attribute.
 
     +-----------+-----------------------+---------------+
     | **Range** | **Scale - Reference** | **Scale - 1** |
@@ -686,26 +908,10 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
                     illuminant.name, cmfs.name))
             spd.trim(cmfs.shape)
 
-        # Extrapolation of additional 20nm padding intervals.
-        spd.align(SpectralShape(spd.shape.start - 20, spd.shape.end + 20, 10))
-        for i in range(2):
-            spd[spd.wavelengths[i]] = (
-                3 * spd.values[i + 2] -
-                3 * spd.values[i + 4] + spd.values[i + 6])  # yapf: disable
-            i_e = len(spd.domain) - 1 - i
-            spd[spd.wavelengths[i_e]] = (
-                spd.values[i_e - 6] - 3 * spd.values[i_e - 4] +
-                3 * spd.values[i_e - 2])
-
-        # Interpolating every odd numbered values.
-        # TODO: Investigate code vectorisation.
-        for i in range(3, len(spd.domain) - 3, 2):
-            spd[spd.wavelengths[i]] = (
-                -0.0625 * spd.values[i - 3] + 0.5625 * spd.values[i - 1] +
-                0.5625 * spd.values[i + 1] - 0.0625 * spd.values[i + 3])
-
-        # Discarding the additional 20nm padding intervals.
-        spd.trim(SpectralShape(spd.shape.start + 20, spd.shape.end - 20, 10))
+        spd = SpectralPowerDistribution(
+            interpolate_20nm_ASTME30815(spd.values),
+            SpectralShape(spd.shape.start, spd.shape.end, 10).range(),
+            name=spd.name)
 
     XYZ = method(spd, cmfs, illuminant)
 
@@ -835,6 +1041,140 @@ def spectral_to_XYZ(
     return function(spd, cmfs, illuminant, **filter_kwargs(function, **kwargs))
 
 
+def _multi_spectral_to_XYZ_kernel_integration(shape, cmfs, illuminant):
+    """
+    Returns the kernel converting multi-spectral arrays with given spectral
+    shape to *CIE XYZ* tristimulus values with a single matrix product
+    according to classical integration method.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the multi-spectral arrays, ``cmfs`` and
+        ``illuminant`` will be aligned with it.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (bins, 3)
+        Kernel.
+    """
+
+    if cmfs.shape != shape:
+        warning('Aligning "{0}" cmfs shape to "{1}".'.format(cmfs.name, shape))
+        cmfs = cmfs.copy().align(shape)
+
+    if illuminant.shape != shape:
+        warning('Aligning "{0}" illuminant shape to "{1}".'.format(
+            illuminant.name, shape))
+        illuminant = illuminant.copy().align(shape)
+
+    return _integration_kernel(cmfs, illuminant)
+
+
+def _multi_spectral_to_XYZ_kernel_ASTME30815(
+        shape,
+        cmfs,
+        illuminant,
+        use_practice_range=True,
+        mi_5nm_omission_method=True,
+        mi_20nm_interpolation_method=True):
+    """
+    Returns the kernel converting multi-spectral arrays with given spectral
+    shape to *CIE XYZ* tristimulus values with a single matrix product
+    according to practise *ASTM E308-15* method.
+
+    The trimming of the wavelengths outside the colour matching functions
+    range and the 20 nm measurement intervals interpolation are linear, they
+    are thus folded into the kernel.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the multi-spectral arrays.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+    use_practice_range : bool, optional
+        Whether to trim the colour matching functions to practise
+        *ASTM E308-15* working wavelengths range.
+    mi_5nm_omission_method : bool, optional
+        Whether to use a 5 nm version of the colour matching functions for
+        5 nm measurement intervals.
+    mi_20nm_interpolation_method : bool, optional
+        Whether to use the dedicated interpolation method for 20 nm
+        measurement intervals.
+
+    Returns
+    -------
+    ndarray, (bins, 3)
+        Kernel.
+
+    Raises
+    ------
+    ValueError
+        If the measurement interval is not 1, 5, 10 or 20 nm.
+    """
+
+    if shape.interval not in (1, 5, 10, 20):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data according to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1, 5, 10 or 20nm!')
+
+    if use_practice_range:
+        cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+
+    wavelengths = shape.range()
+    mask = np.logical_and(wavelengths >= cmfs.shape.start,
+                          wavelengths <= cmfs.shape.end)
+    shape_t = SpectralShape(wavelengths[mask][0], wavelengths[mask][-1],
+                            shape.interval)
+
+    interpolation = shape.interval == 20 and mi_20nm_interpolation_method
+    if interpolation:
+        shape_t = SpectralShape(shape_t.start, shape_t.end, 10)
+
+    integration = shape_t.interval == 1 or (shape_t.interval == 5 and
+                                            mi_5nm_omission_method)
+
+    if integration and cmfs.shape.interval != shape_t.interval:
+        cmfs = cmfs.copy().interpolate(
+            SpectralShape(interval=shape_t.interval))
+
+    if illuminant.shape != cmfs.shape:
+        warning('Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    if integration:
+        W = _integration_kernel(cmfs, illuminant)
+        shape_r = cmfs.shape
+    else:
+        W = tristimulus_weighting_factors_ASTME202211(
+            cmfs, illuminant,
+            SpectralShape(cmfs.shape.start, cmfs.shape.end, shape_t.interval))
+        shape_r = SpectralShape(
+            cmfs.shape.start,
+            cmfs.shape.start + shape_t.interval * (W.shape[0] - 1),
+            shape_t.interval)
+
+    W = adjust_tristimulus_weighting_factors_ASTME30815(W, shape_r, shape_t)
+
+    if interpolation:
+        W = np.dot(
+            interpolate_20nm_ASTME30815(np.identity(np.sum(mask))), W)
+
+    K = np.zeros([len(wavelengths), 3])
+    K[mask] = W
+
+    return K
+
+
 def multi_spectral_to_XYZ_integration(
         msa,
         shape,
@@ -848,10 +1188,12 @@ def multi_spectral_to_XYZ_integration(
 
     Parameters
     ----------
-    msa : array_like
+    msa : array_like or MultiSpectralPowerDistribution
         Multi-spectral array :math:`msa`, the wavelengths are expected to be
         in the last axis, e.g. for a 512x384 multi-spectral image with 77 bins,
-        ``msa`` shape should be (384, 512, 77).
+        ``msa`` shape should be (384, 512, 77). If a multi-spectral power
+        distribution with :math:`N` labels is given, its spectral shape is
+        used instead of ``shape`` and the output shape will be (N, 3).
     shape : SpectralShape, optional
         Spectral shape of the multi-spectral array :math:`msa`, ``cmfs`` and
         ``illuminant`` will be aligned with it.
@@ -919,33 +1261,118 @@ def multi_spectral_to_XYZ_integration(
             [ 24.7830551...,  26.2221584...,  36.4430633...]]])
     """
 
-    msa = as_float_array(msa)
+    msa, shape = _unpack_multi_spectral_array(msa, shape)
 
-    if cmfs.shape != shape:
-        warning('Aligning "{0}" cmfs shape to "{1}".'.format(cmfs.name, shape))
-        cmfs = cmfs.copy().align(shape)
+    XYZ = np.dot(msa,
+                 _multi_spectral_to_XYZ_kernel_integration(
+                     shape, cmfs, illuminant))
 
-    if illuminant.shape != shape:
-        warning('Aligning "{0}" illuminant shape to "{1}".'.format(
-            illuminant.name, shape))
-        illuminant = illuminant.copy().align(shape)
+    return from_range_100(XYZ)
 
-    S = illuminant.values
-    x_bar, y_bar, z_bar = tsplit(cmfs.values)
-    dw = cmfs.shape.interval
 
-    k = 100 / (np.sum(y_bar * S) * dw)
+def multi_spectral_to_XYZ_ASTME30815(
+        msa,
+        shape,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=ones_spd(ASTME30815_PRACTISE_SHAPE),
+        use_practice_range=True,
+        mi_5nm_omission_method=True,
+        mi_20nm_interpolation_method=True):
+    """
+    Converts given multi-spectral array :math:`msa` with given spectral shape
+    to *CIE XYZ* tristimulus values using given colour matching functions and
+    illuminant according to practise *ASTM E308-15* method.
 
-    X_p = msa * x_bar * S * dw
-    Y_p = msa * y_bar * S * dw
-    Z_p = msa * z_bar * S * dw
+    The weighting kernel, i.e. the table of tristimulus weighting factors or
+    the product of the illuminant and colour matching functions, is computed
+    once and applied to all the spectral distributions with a single matrix
+    product.
 
-    XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+    Parameters
+    ----------
+    msa : array_like or MultiSpectralPowerDistribution
+        Multi-spectral array :math:`msa`, the wavelengths are expected to be
+        in the last axis, e.g. for 1000 spectral distributions with 16 bins,
+        ``msa`` shape should be (1000, 16). If a multi-spectral power
+        distribution with :math:`N` labels is given, its spectral shape is
+        used instead of ``shape`` and the output shape will be (N, 3).
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array :math:`msa`.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    use_practice_range : bool, optional
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        5 nm measurement intervals spectral power distribution conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        20 nm measurement intervals spectral power distribution conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values, for 1000 spectral distributions with 16
+        bins, the output shape will be (1000, 3).
+
+    Notes
+    -----
+    -   With 1 or 5 nm measurement intervals, the
+        :func:`colour.colorimetry.spectral_to_XYZ_ASTME30815` definition
+        aligns the spectral power distribution to the colour matching
+        functions shape. This definition discards instead the wavelengths
+        outside the colour matching functions range and adds the weights at
+        the wavelengths for which data are not available to the weights at the
+        shortest and longest wavelength for which spectral data are available.
+        Both are equivalent when the multi-spectral array :math:`msa`
+        wavelengths are a subset of the colour matching functions wavelengths.
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    References
+    ----------
+    :cite:`ASTMInternational2015b`
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_SPDS
+    >>> cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.1913, 0.2134, 0.2374, 0.2705, 0.3120, 0.3587, 0.4076, 0.4557,
+    ...      0.5019, 0.5423, 0.5778, 0.6052, 0.6282, 0.6454, 0.6563, 0.6622],
+    ... ])
+    >>> illuminant = ILLUMINANTS_SPDS['D65']
+    >>> multi_spectral_to_XYZ_ASTME30815(
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    ... # doctest: +ELLIPSIS
+    array([[ 10.8399031...,   9.6840375...,   6.2164159...],
+           [ 47.7195838...,  48.6094832...,  29.1536259...]])
+    """
+
+    msa, shape = _unpack_multi_spectral_array(msa, shape)
 
-    return from_range_100(np.rollaxis(XYZ, 0, msa.ndim))
+    XYZ = np.dot(msa,
+                 _multi_spectral_to_XYZ_kernel_ASTME30815(
+                     shape, cmfs, illuminant, use_practice_range,
+                     mi_5nm_omission_method, mi_20nm_interpolation_method))
+
+    return from_range_100(XYZ)
 
 
 MULTI_SPECTRAL_TO_XYZ_METHODS = CaseInsensitiveMapping({
+    'ASTM E308-15': multi_spectral_to_XYZ_ASTME30815,
     'Integration': multi_spectral_to_XYZ_integration
 })
 MULTI_SPECTRAL_TO_XYZ_METHODS.__doc__ = """
@@ -954,11 +1381,24 @@ methods.
 
 References
 ----------
-:cite:`Wyszecki2000bf`
+:cite:`ASTMInternational2015b`, :cite:`Wyszecki2000bf`
 
 MULTI_SPECTRAL_TO_XYZ_METHODS : CaseInsensitiveMapping
-    **{'Integration'}**
+    **{'ASTM E308-15', 'Integration'}**
+
+Aliases:
+
+-   'astm2015': 'ASTM E308-15'
 """
+MULTI_SPECTRAL_TO_XYZ_METHODS['astm2015'] = (
+    MULTI_SPECTRAL_TO_XYZ_METHODS['ASTM E308-15'])
+
+_MULTI_SPECTRAL_TO_XYZ_KERNELS = CaseInsensitiveMapping({
+    'ASTM E308-15': _multi_spectral_to_XYZ_kernel_ASTME30815,
+    'Integration': _multi_spectral_to_XYZ_kernel_integration
+})
+_MULTI_SPECTRAL_TO_XYZ_KERNELS['astm2015'] = (
+    _MULTI_SPECTRAL_TO_XYZ_KERNELS['ASTM E308-15'])
 
 
 def multi_spectral_to_XYZ(
@@ -966,7 +1406,8 @@ def multi_spectral_to_XYZ(
         shape=DEFAULT_SPECTRAL_SHAPE,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
         illuminant=ones_spd(ASTME30815_PRACTISE_SHAPE),
-        method='Integration'):
+        method='Integration',
+        **kwargs):
     """
     Converts given multi-spectral array :math:`msa` with given spectral shape
     to *CIE XYZ* tristimulus values using given colour matching functions and
@@ -974,10 +1415,12 @@ def multi_spectral_to_XYZ(
 
     Parameters
     ----------
-    msa : array_like
+    msa : array_like or MultiSpectralPowerDistribution
         Multi-spectral array :math:`msa`, the wavelengths are expected to be
         in the last axis, e.g. for a 512x384 multi-spectral image with 77 bins,
-        ``msa`` shape should be (384, 512, 77).
+        ``msa`` shape should be (384, 512, 77). If a multi-spectral power
+        distribution with :math:`N` labels is given, its spectral shape is
+        used instead of ``shape`` and the output shape will be (N, 3).
     shape : SpectralShape, optional
         Spectral shape of the multi-spectral array :math:`msa`, ``cmfs`` and
         ``illuminant`` will be aligned with it.
@@ -986,9 +1429,27 @@ def multi_spectral_to_XYZ(
     illuminant : SpectralPowerDistribution, optional
         Illuminant spectral power distribution.
     method : unicode, optional
-        **{'Integration'}**,
+        **{'Integration', 'ASTM E308-15'}**,
         Computation method.
 
+    Other Parameters
+    ----------------
+    mi_5nm_omission_method : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        5 nm measurement intervals spectral power distribution conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        20 nm measurement intervals spectral power distribution conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+    use_practice_range : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+
     Returns
     -------
     array_like
@@ -1006,7 +1467,7 @@ def multi_spectral_to_XYZ(
 
     References
     ----------
-    :cite:`Wyszecki2000bf`
+    :cite:`ASTMInternational2015b`, :cite:`Wyszecki2000bf`
 
     Examples
     --------
@@ -1047,7 +1508,246 @@ def multi_spectral_to_XYZ(
 
     function = MULTI_SPECTRAL_TO_XYZ_METHODS[method]
 
-    return function(msa, shape, cmfs, illuminant)
+    return function(msa, shape, cmfs, illuminant,
+                    **filter_kwargs(function, **kwargs))
+
+
+def _chunked_tiles_to_XYZ(tiles, K, processes):
+    """
+    Yields the *CIE XYZ* tristimulus values of given multi-spectral array tiles
+    using given kernel, the tiles are converted by windows of ``processes``
+    tiles.
+
+    Parameters
+    ----------
+    tiles : iterator
+        Multi-spectral array tiles.
+    K : ndarray, (bins, 3)
+        Kernel.
+    processes : integer
+        Threads count.
+
+    Returns
+    -------
+    generator
+        *CIE XYZ* tristimulus values tiles generator.
+    """
+
+    def convert(tile):
+        """
+        Converts given tile to *CIE XYZ* tristimulus values.
+        """
+
+        return np.dot(as_float_array(tile), K)
+
+    tiles = iter(tiles)
+    pool = ThreadPool(processes) if processes > 1 else None
+    try:
+        while True:
+            window = list(itertools.islice(tiles, processes))
+            if not window:
+                break
+
+            XYZ = (pool.map(convert, window)
+                   if pool is not None else [convert(window[0])])
+
+            for XYZ_t in XYZ:
+                yield XYZ_t
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def chunked_multi_spectral_to_XYZ(
+        msa,
+        shape=DEFAULT_SPECTRAL_SHAPE,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=ones_spd(ASTME30815_PRACTISE_SHAPE),
+        method='Integration',
+        out=None,
+        chunk_size=2 ** 14,
+        processes=1,
+        **kwargs):
+    """
+    Converts given multi-spectral array :math:`msa` with given spectral shape
+    to *CIE XYZ* tristimulus values using given colour matching functions and
+    illuminant by chunks of bounded size.
+
+    This definition is intended for large hyperspectral cubes, e.g.
+    :class:`numpy.memmap` instances or tiles and scanlines read from disk,
+    that do not fit in memory as a whole.
+
+    Parameters
+    ----------
+    msa : array_like or iterator
+        Multi-spectral array :math:`msa`, the wavelengths are expected to be
+        in the last axis. If an iterator is given, it is expected to yield
+        multi-spectral array tiles, e.g. scanlines, that are converted
+        sequentially.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array :math:`msa`, ``cmfs`` and
+        ``illuminant`` will be aligned with it.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    method : unicode, optional
+        **{'Integration', 'ASTM E308-15'}**,
+        Computation method.
+    out : ndarray, optional
+        C-contiguous array, e.g. a :class:`numpy.memmap` instance, the *CIE
+        XYZ* tristimulus values are written to. Its shape must be the
+        multi-spectral array :math:`msa` shape with the last axis replaced by
+        3, or (N, 3) with :math:`N` the total samples count of the tiles if
+        an iterator is given.
+    chunk_size : integer, optional
+        Samples count of the chunks the multi-spectral array :math:`msa` is
+        converted by, it bounds the transient memory used by the conversion.
+    processes : integer, optional
+        Threads count, the chunks or tiles are converted concurrently if
+        greater than 1.
+
+    Other Parameters
+    ----------------
+    mi_5nm_omission_method : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        5 nm measurement intervals spectral power distribution conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        20 nm measurement intervals spectral power distribution conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+    use_practice_range : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+
+    Returns
+    -------
+    ndarray or generator
+        *CIE XYZ* tristimulus values. If an iterator is given and ``out`` is
+        *None*, a generator yielding the *CIE XYZ* tristimulus values of each
+        tile is returned.
+
+    Raises
+    ------
+    ValueError
+        If ``out`` shape is not compatible with the multi-spectral array
+        :math:`msa` or if it is not C-contiguous.
+
+    Notes
+    -----
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The conversion is linear in the multi-spectral array :math:`msa`, thus
+        it is reduced to a single (bins, 3) kernel computed once and applied
+        to every chunk with a matrix product that releases the *GIL*,
+        allowing the threads to run concurrently.
+    -   The chunks are cast to *DEFAULT_FLOAT_DTYPE* individually, a
+        :class:`numpy.memmap` instance is never loaded as a whole.
+
+    References
+    ----------
+    :cite:`ASTMInternational2015b`, :cite:`Wyszecki2000bf`
+
+    Examples
+    --------
+    >>> msa = np.array([
+    ...     [0.0137, 0.0913, 0.0152, 0.0281, 0.1918, 0.0430],
+    ...     [0.0159, 0.3145, 0.0842, 0.0907, 0.7103, 0.0437],
+    ...     [0.0096, 0.2582, 0.4139, 0.2228, 0.0041, 0.3744],
+    ... ])
+    >>> chunked_multi_spectral_to_XYZ(
+    ...     msa, SpectralShape(400, 700, 60), chunk_size=2)
+    ... # doctest: +ELLIPSIS
+    array([[  7.6862675...,   4.0925470...,   8.4950412...],
+           [ 27.4119366...,  15.5014764...,  29.2825122...],
+           [ 17.1283666...,  27.7798651...,  25.5232032...]])
+    >>> XYZ = chunked_multi_spectral_to_XYZ(
+    ...     iter(msa), SpectralShape(400, 700, 60))
+    >>> next(XYZ)  # doctest: +ELLIPSIS
+    array([ 7.6862675...,  4.0925470...,  8.4950412...])
+    """
+
+    function = _MULTI_SPECTRAL_TO_XYZ_KERNELS[method]
+
+    if isinstance(msa, MultiSpectralPowerDistribution):
+        msa, shape = _unpack_multi_spectral_array(msa, shape)
+
+    K = from_range_100(
+        function(shape, cmfs, illuminant, **filter_kwargs(function, **kwargs)))
+
+    processes = max(int(processes), 1)
+
+    if isinstance(msa, (list, tuple)):
+        msa = as_float_array(msa)
+
+    if not isinstance(msa, np.ndarray):
+        tiles = _chunked_tiles_to_XYZ(msa, K, processes)
+
+        if out is None:
+            return tiles
+
+        if not out.flags.c_contiguous:
+            raise ValueError('"out" array must be C-contiguous!')
+
+        out_f = out.reshape([-1, 3])
+        i = 0
+        for XYZ in tiles:
+            XYZ = np.reshape(XYZ, [-1, 3])
+            if i + XYZ.shape[0] > out_f.shape[0]:
+                raise ValueError(
+                    '"out" array is too small for the multi-spectral array '
+                    'tiles!')
+            out_f[i:i + XYZ.shape[0]] = XYZ
+            i += XYZ.shape[0]
+
+        return out
+
+    shape_o = msa.shape[:-1] + (3, )
+    if out is None:
+        out = np.empty(shape_o)
+    elif out.shape != shape_o:
+        raise ValueError('"out" array shape must be "{0}", got "{1}"!'.format(
+            shape_o, out.shape))
+    elif not out.flags.c_contiguous:
+        raise ValueError('"out" array must be C-contiguous!')
+
+    msa_f = msa.reshape([-1, msa.shape[-1]])
+    out_f = out.reshape([-1, 3])
+
+    chunk_size = max(int(chunk_size), 1)
+
+    def convert(i):
+        """
+        Converts the chunk starting at given sample index.
+        """
+
+        out_f[i:i + chunk_size] = np.dot(
+            as_float_array(msa_f[i:i + chunk_size]), K)
+
+    indexes = range(0, msa_f.shape[0], chunk_size)
+    if processes > 1:
+        pool = ThreadPool(processes)
+        try:
+            pool.map(convert, indexes)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for i in indexes:
+            convert(i)
+
+    return out
 
 
 def wavelength_to_XYZ(
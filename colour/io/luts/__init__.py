@@ -16,31 +16,35 @@ import os
 
 from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 from .lut import (AbstractLUTSequenceOperator, LUT1D, LUT2D, LUT3D,
-                  LUTSequence, LUT_to_LUT)
+                  LUTSequence, LUT_to_LUT, PreparedLUT)
 from .iridas_cube import read_LUT_IridasCube, write_LUT_IridasCube
 from .resolve_cube import read_LUT_ResolveCube, write_LUT_ResolveCube
 from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
 from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
+from .colour_binary import (read_LUT_ColourBinary, write_LUT_ColourBinary,
+                            read_LUT_cache, write_LUT_cache)
 
 __all__ = [
     'AbstractLUTSequenceOperator', 'LUT1D', 'LUT2D', 'LUT3D', 'LUTSequence',
-    'LUT_to_LUT'
+    'LUT_to_LUT', 'PreparedLUT'
 ]
 __all__ += ['read_LUT_IridasCube', 'write_LUT_IridasCube']
 __all__ += ['read_LUT_ResolveCube', 'write_LUT_ResolveCube']
 __all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
 __all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
+__all__ += ['read_LUT_ColourBinary', 'write_LUT_ColourBinary']
 
 EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
     '.cube': 'Iridas Cube',
     '.spi1d': 'Sony SPI1D',
-    '.spi3d': 'Sony SPI3D'
+    '.spi3d': 'Sony SPI3D',
+    '.clb': 'Colour Binary'
 })
 """
 Extension to *LUT* format.
 
 EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
-    **{'.cube', '.spi1d'}**
+    **{'.cube', '.spi1d', '.spi3d', '.clb'}**
 """
 
 LUT_READ_METHODS = CaseInsensitiveMapping({
@@ -48,6 +52,7 @@ LUT_READ_METHODS = CaseInsensitiveMapping({
     'Resolve Cube': read_LUT_ResolveCube,
     'Sony SPI1D': read_LUT_SonySPI1D,
     'Sony SPI3D': read_LUT_SonySPI3D,
+    'Colour Binary': read_LUT_ColourBinary,
 })
 LUT_READ_METHODS.__doc__ = """
 Supported *LUT* reading methods.
@@ -57,11 +62,12 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_READ_METHODS : CaseInsensitiveMapping
-    **{'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D'}**
+    **{'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D',
+    'Colour Binary'}**
 """
 
 
-def read_LUT(path, method=None, **kwargs):
+def read_LUT(path, method=None, cache=False, **kwargs):
     """
     Reads given *LUT* file using given method.
 
@@ -70,9 +76,17 @@ def read_LUT(path, method=None, **kwargs):
     path : unicode
         *LUT* path.
     method : unicode, optional
-        **{None, 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D'}**,
+        **{None, 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D',
+        'Colour Binary'}**,
         Reading method, if *None*, the method will be auto-detected according
         to extension.
+    cache : bool or unicode, optional
+        Whether to cache the *LUT* as a *Colour* *Binary* *.clb* file so that
+        the *LUT* file is only parsed once: if *True*, the cache is a sidecar
+        file stored next to the *LUT* file, if a directory, the cache is
+        stored in that directory. The cache is invalidated when the *LUT* file
+        content changes, see
+        :func:`colour.io.luts.colour_binary.read_LUT_cache` definition.
 
     Returns
     -------
@@ -135,7 +149,15 @@ def read_LUT(path, method=None, **kwargs):
 
     function = LUT_READ_METHODS[method]
 
-    return function(path, **filter_kwargs(function, **kwargs))
+    if not cache or method == 'Colour Binary':
+        return function(path, **filter_kwargs(function, **kwargs))
+
+    LUT = read_LUT_cache(path, method, cache)
+    if LUT is None:
+        LUT = function(path, **filter_kwargs(function, **kwargs))
+        write_LUT_cache(LUT, path, method, cache)
+
+    return LUT
 
 
 LUT_WRITE_METHODS = CaseInsensitiveMapping({
@@ -143,6 +165,7 @@ LUT_WRITE_METHODS = CaseInsensitiveMapping({
     'Resolve Cube': write_LUT_ResolveCube,
     'Sony SPI1D': write_LUT_SonySPI1D,
     'Sony SPI3D': write_LUT_SonySPI3D,
+    'Colour Binary': write_LUT_ColourBinary,
 })
 LUT_WRITE_METHODS.__doc__ = """
 Supported *LUT* reading methods.
@@ -152,7 +175,8 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_WRITE_METHODS : CaseInsensitiveMapping
-    **{'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D'}**
+    **{'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D',
+    'Colour Binary'}**
 """
 
 
@@ -170,7 +194,8 @@ def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
     decimals : int, optional
         Formatting decimals.
     method : unicode, optional
-        **{None, 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D'}**,
+        **{None, 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D', 'Sony SPI3D',
+        'Colour Binary'}**,
         Writing method, if *None*, the method will be auto-detected according
         to extension.
 
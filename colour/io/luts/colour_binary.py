@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Binary .clb LUT Format Input / Output Utilities
+======================================================
+
+Defines *Colour* *Binary* *.clb* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_ColourBinary`
+-   :func:`colour.io.write_LUT_ColourBinary`
+
+The *Colour* *Binary* *.clb* *LUT* Format is a native, compact serialisation
+of the :class:`colour.LUT1D`, :class:`colour.LUT2D`, :class:`colour.LUT3D` and
+:class:`colour.LUTSequence` classes that can be read with zero copy:
+
+-   A fixed size preamble: the *CLB\\0* magic number, the format version and
+    the header length, as little-endian unsigned 32-bit integers.
+-   A *JSON* header describing the *LUT* names, comments, domains, tables
+    dtypes, shapes and offsets, and optionally the properties of the file the
+    *LUT* was read from when the file is used as a cache.
+-   The raw little-endian tables, each one aligned on a 64 bytes boundary so
+    that they can be mapped in memory with :class:`numpy.memmap` class.
+"""
+
+from __future__ import division, unicode_literals
+
+import hashlib
+import json
+import numpy as np
+import os
+import struct
+import tempfile
+
+from colour.io.luts import LUT1D, LUT2D, LUT3D, LUTSequence
+from colour.utilities import as_float_array, warning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'CLB_MAGIC_NUMBER', 'CLB_VERSION', 'CLB_ALIGNMENT',
+    'read_LUT_ColourBinary', 'write_LUT_ColourBinary', 'LUT_cache_path',
+    'read_LUT_cache', 'write_LUT_cache'
+]
+
+CLB_MAGIC_NUMBER = b'CLB\x00'
+"""
+*Colour* *Binary* *.clb* *LUT* Format magic number.
+
+CLB_MAGIC_NUMBER : bytes
+"""
+
+CLB_VERSION = 1
+"""
+*Colour* *Binary* *.clb* *LUT* Format version.
+
+CLB_VERSION : int
+"""
+
+CLB_ALIGNMENT = 64
+"""
+*Colour* *Binary* *.clb* *LUT* Format tables alignment in bytes.
+
+CLB_ALIGNMENT : int
+"""
+
+_CLB_PREAMBLE_FORMAT = '<4sII'
+
+_CLB_LUT_CLASSES = {'LUT1D': LUT1D, 'LUT2D': LUT2D, 'LUT3D': LUT3D}
+
+
+def _align(offset):
+    """
+    Returns given offset rounded up to the next tables alignment boundary.
+    """
+
+    return -(-offset // CLB_ALIGNMENT) * CLB_ALIGNMENT
+
+
+def _read_header(path):
+    """
+    Reads the header of given *Colour* *Binary* *.clb* *LUT* file.
+
+    Returns
+    -------
+    tuple
+        Header and tables start offset.
+    """
+
+    with open(path, 'rb') as clb_file:
+        preamble = clb_file.read(struct.calcsize(_CLB_PREAMBLE_FORMAT))
+
+        assert len(preamble) == struct.calcsize(_CLB_PREAMBLE_FORMAT), (
+            '"{0}" is not a "Colour Binary" LUT file!'.format(path))
+
+        magic_number, version, length = struct.unpack(_CLB_PREAMBLE_FORMAT,
+                                                      preamble)
+
+        assert magic_number == CLB_MAGIC_NUMBER, (
+            '"{0}" is not a "Colour Binary" LUT file!'.format(path))
+
+        assert version == CLB_VERSION, (
+            '"{0}" "Colour Binary" LUT file version "{1}" is unsupported!'.
+            format(path, version))
+
+        header = json.loads(clb_file.read(length).decode('utf-8'))
+
+    return header, _align(struct.calcsize(_CLB_PREAMBLE_FORMAT) + length)
+
+
+def read_LUT_ColourBinary(path):
+    """
+    Reads given *Colour* *Binary* *.clb* *LUT* file.
+
+    The tables are mapped in memory in copy-on-write mode: they are not read
+    until accessed and modifying them does not modify the file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT1D or LUT2D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT2D`, :class:`LUT3D` or :class:`LUTSequence`
+        class instance.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'My_LUT.clb')
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT')
+    >>> write_LUT_ColourBinary(LUT, path)
+    True
+    >>> print(read_LUT_ColourBinary(path))
+    LUT3D - My LUT
+    --------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.  0.  0.]
+                  [ 1.  1.  1.]]
+    Size       : (16, 16, 16, 3)
+    """
+
+    header, start = _read_header(path)
+
+    LUTs = []
+    for operator in header['LUTs']:
+        table = np.memmap(
+            path,
+            dtype=np.dtype(str(operator['dtype'])),
+            mode='c',
+            offset=start + operator['offset'],
+            shape=tuple(operator['shape']))
+
+        LUTs.append(_CLB_LUT_CLASSES[operator['type']](
+            table,
+            operator['name'],
+            domain=as_float_array(operator['domain']),
+            comments=operator['comments']))
+
+    if header['sequence']:
+        return LUTSequence(*LUTs)
+    else:
+        return LUTs[0]
+
+
+def write_LUT_ColourBinary(LUT, path, decimals=None, source=None):
+    """
+    Writes given *LUT* to given *Colour* *Binary* *.clb* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT2D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT2D`, :class:`LUT3D` or :class:`LUTSequence`
+        class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Unused, the tables are written with their full precision, the argument
+        is only accepted for consistency with the other writing methods.
+    source : dict, optional
+        Properties of the file the *LUT* was read from, stored in the header
+        when the file is used as a cache, see
+        :func:`colour.io.luts.colour_binary.write_LUT_cache` definition.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT')
+    >>> write_LUT_ColourBinary(LUT, 'My_LUT.clb')  # doctest: +SKIP
+    """
+
+    is_sequence = isinstance(LUT, LUTSequence)
+    LUTs = list(LUT) if is_sequence else [LUT]
+
+    operators, tables, offset = [], [], 0
+    for operator in LUTs:
+        assert isinstance(operator, tuple(_CLB_LUT_CLASSES.values())), (
+            '"{0}" is not a "LUT1D", "LUT2D" or "LUT3D" instance!'.format(
+                operator))
+
+        table = np.ascontiguousarray(operator.table)
+        table = table.astype(table.dtype.newbyteorder('<'), copy=False)
+
+        operators.append({
+            'type': operator.__class__.__name__,
+            'name': operator.name,
+            'comments': list(operator.comments),
+            'domain': as_float_array(operator.domain).tolist(),
+            'dtype': table.dtype.str,
+            'shape': list(table.shape),
+            'offset': offset,
+        })
+        tables.append(table)
+
+        offset = _align(offset + table.nbytes)
+
+    header = json.dumps({
+        'sequence': is_sequence,
+        'LUTs': operators,
+        'source': source,
+    }).encode('utf-8')
+
+    start = _align(struct.calcsize(_CLB_PREAMBLE_FORMAT) + len(header))
+
+    with open(path, 'wb') as clb_file:
+        clb_file.write(
+            struct.pack(_CLB_PREAMBLE_FORMAT, CLB_MAGIC_NUMBER, CLB_VERSION,
+                        len(header)))
+        clb_file.write(header)
+
+        for operator, table in zip(operators, tables):
+            clb_file.seek(start + operator['offset'])
+            clb_file.write(table.tobytes())
+
+    return True
+
+
+def _source_properties(path, method, digest=True):
+    """
+    Returns the properties identifying given *LUT* source file.
+    """
+
+    properties = {
+        'path': os.path.abspath(path),
+        'method': method,
+        'mtime': os.path.getmtime(path),
+        'size': os.path.getsize(path),
+    }
+
+    if digest:
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as source_file:
+            for chunk in iter(lambda: source_file.read(2 ** 20), b''):
+                sha1.update(chunk)
+
+        properties['sha1'] = sha1.hexdigest()
+
+    return properties
+
+
+def LUT_cache_path(path, cache=True):
+    """
+    Returns the *Colour* *Binary* *.clb* cache path of given *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    cache : bool or unicode, optional
+        If *True*, the cache is a sidecar file stored next to the *LUT* file,
+        if a directory, the cache is stored in that directory and named after
+        the *SHA-1* digest of the *LUT* absolute path.
+
+    Returns
+    -------
+    unicode
+        *Colour* *Binary* *.clb* cache path.
+
+    Examples
+    --------
+    >>> LUT_cache_path('/LUTs/My_LUT.cube')  # doctest: +SKIP
+    '/LUTs/My_LUT.cube.clb'
+    """
+
+    if cache is True:
+        return '{0}.clb'.format(path)
+    else:
+        return os.path.join(
+            cache, '{0}.clb'.format(
+                hashlib.sha1(
+                    os.path.abspath(path).encode('utf-8')).hexdigest()))
+
+
+def read_LUT_cache(path, method, cache=True):
+    """
+    Reads the *Colour* *Binary* *.clb* cache of given *LUT* file.
+
+    The cache is valid if the *LUT* file path, reading method, modification
+    time and size match the ones stored in the cache, or if the path or
+    modification time changed but the reading method and the *SHA-1* digest
+    of the *LUT* file content match, in which case the cache is rewritten with
+    the current *LUT* file properties so that the next reading does not
+    compute the digest again.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    method : unicode
+        *LUT* reading method.
+    cache : bool or unicode, optional
+        Cache location, see :func:`colour.io.luts.colour_binary.LUT_cache_path`
+        definition.
+
+    Returns
+    -------
+    LUT1D or LUT2D or LUT3D or LUTSequence or None
+        Cached *LUT* or *None* if the cache does not exist, is stale or cannot
+        be read, e.g. if it is truncated.
+    """
+
+    cache_path = LUT_cache_path(path, cache)
+
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        header, _start = _read_header(cache_path)
+    except (AssertionError, ValueError):
+        return None
+
+    cached = header.get('source')
+    if cached is None:
+        return None
+
+    source = _source_properties(path, method, False)
+    if all(cached.get(key) == value for key, value in source.items()):
+        source = None
+    else:
+        source = _source_properties(path, method)
+        if not all(
+                cached.get(key) == source[key]
+                for key in ('method', 'size', 'sha1')):
+            return None
+
+    try:
+        LUT = read_LUT_ColourBinary(cache_path)
+    except (ValueError, EnvironmentError):
+        return None
+
+    if source is not None:
+        _write_LUT_cache(LUT, path, method, cache_path, source)
+
+    return LUT
+
+
+def _write_LUT_cache(LUT, path, method, cache_path, source=None):
+    """
+    Writes given *LUT* to given *Colour* *Binary* *.clb* cache path with given
+    *LUT* file properties, computed if not given, see
+    :func:`colour.io.luts.colour_binary.write_LUT_cache` definition.
+    """
+
+    try:
+        if source is None:
+            source = _source_properties(path, method)
+
+        descriptor, temporary_path = tempfile.mkstemp(
+            '.clb', dir=os.path.dirname(os.path.abspath(cache_path)))
+        os.close(descriptor)
+
+        try:
+            write_LUT_ColourBinary(LUT, temporary_path, source=source)
+
+            # "os.replace" overwrites an existing cache on all platforms.
+            getattr(os, 'replace', os.rename)(temporary_path, cache_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+    except (AssertionError, EnvironmentError) as error:
+        warning('"{0}" "LUT" cache could not be written: {1}'.format(
+            path, error))
+
+        return False
+
+    return True
+
+
+def write_LUT_cache(LUT, path, method, cache=True):
+    """
+    Writes the *Colour* *Binary* *.clb* cache of given *LUT* file.
+
+    The cache is written to a temporary file first and then renamed so that
+    concurrent readers never see a partially written cache. A warning is
+    issued if the cache cannot be written.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT2D or LUT3D or LUTSequence
+        *LUT* read from given *LUT* file.
+    path : unicode
+        *LUT* path.
+    method : unicode
+        *LUT* reading method.
+    cache : bool or unicode, optional
+        Cache location, see :func:`colour.io.luts.colour_binary.LUT_cache_path`
+        definition.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    return _write_LUT_cache(LUT, path, method, LUT_cache_path(path, cache))
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Processing Common Utilities
+===============================
+
+Defines the common utilities objects shared by the *LUT* formats input /
+output utilities:
+
+-   :func:`colour.io.luts.common.parse_table`
+-   :func:`colour.io.luts.common.format_table`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import re
+
+from colour.utilities import as_float_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['parse_table', 'format_table']
+
+
+def parse_table(text, columns=3, comments=None):
+    """
+    Parses given *LUT* table text in bulk.
+
+    The whitespace separated values of the text are converted with a single
+    call to :func:`colour.utilities.as_float_array` definition instead of a
+    per row conversion.
+
+    Parameters
+    ----------
+    text : unicode
+        *LUT* table text, i.e. whitespace separated values, optionally
+        interleaved with comment lines starting with *#*.
+    columns : int, optional
+        *LUT* table columns count.
+    comments : list, optional
+        List the comments found in the text are appended to.
+
+    Returns
+    -------
+    ndarray
+        *LUT* table with shape (N, ``columns``).
+
+    Examples
+    --------
+    >>> parse_table('0 0 0\\n# Comment\\n0.5 0.5 0.5\\n1 1 1\\n')
+    array([[ 0. ,  0. ,  0. ],
+           [ 0.5,  0.5,  0.5],
+           [ 1. ,  1. ,  1. ]])
+    """
+
+    if '#' in text:
+        if comments is not None:
+            comments.extend([
+                comment.strip()
+                for comment in re.findall('^\\s*#(.*)$', text, re.MULTILINE)
+            ])
+
+        text = re.sub('^\\s*#.*$', '', text, flags=re.MULTILINE)
+
+    return as_float_array(text.split()).reshape([-1, columns])
+
+
+def format_table(table, row_format, chunk_size=2 ** 16):
+    """
+    Formats given *LUT* table in bulk, yielding chunks of formatted rows.
+
+    Each chunk is formatted with a single *%* operator call on a repeated row
+    format instead of a per row formatting.
+
+    Parameters
+    ----------
+    table : array_like
+        *LUT* table to format, its first axis indexes the rows.
+    row_format : unicode
+        *printf-style* row format, e.g. *'%0.7f %0.7f %0.7f\\n'*.
+    chunk_size : int, optional
+        Rows count of the chunks, it bounds the transient memory used by the
+        formatting.
+
+    Yields
+    ------
+    unicode
+        Formatted rows chunk.
+
+    Examples
+    --------
+    >>> table = np.array([[0, 0, 0], [0.5, 0.5, 0.5], [1, 1, 1]])
+    >>> print(''.join(format_table(table, '%0.3f %0.3f %0.3f\\n')))
+    0.000 0.000 0.000
+    0.500 0.500 0.500
+    1.000 1.000 1.000
+    <BLANKLINE>
+    """
+
+    table = np.reshape(table, [len(table), -1])
+
+    for i in range(0, table.shape[0], chunk_size):
+        chunk = table[i:i + chunk_size]
+
+        yield (row_format * chunk.shape[0]) % tuple(chunk.ravel().tolist())
@@ -23,7 +23,8 @@ import re
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT2D, LUT3D, LUTSequence
-from colour.utilities import as_float_array, warning
+from colour.io.luts.common import format_table, parse_table
+from colour.utilities import warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -103,7 +104,7 @@ def read_LUT_IridasCube(path):
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
     dimensions = 3
     size = 2
-    table = []
+    table = np.zeros([0, 3])
     comments = []
 
     def _parse_array(array):
@@ -114,8 +115,11 @@ def read_LUT_IridasCube(path):
         return np.array(list(map(DEFAULT_FLOAT_DTYPE, array)))
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
-        for line in lines:
+        while True:
+            line = cube_file.readline()
+            if len(line) == 0:
+                break
+
             line = line.strip()
 
             if len(line) == 0:
@@ -139,9 +143,12 @@ def read_LUT_IridasCube(path):
                 dimensions = 3
                 size = DEFAULT_INT_DTYPE(tokens[1])
             else:
-                table.append(_parse_array(tokens))
+                # The table data follows the keywords, it is parsed in bulk.
+                table = parse_table(
+                    '{0}\n{1}'.format(line, cube_file.read()),
+                    comments=comments)
+                break
 
-    table = as_float_array(table)
     if dimensions == 2:
         return LUT2D(
             table,
@@ -262,7 +269,7 @@ def write_LUT_IridasCube(LUT, path, decimals=7):
         else:
             table = LUT.table
 
-        for row in table:
-            cube_file.write('{0}\n'.format(_format_array(row)))
+        cube_file.writelines(
+            format_table(table, '%0.{0}f %0.{0}f %0.{0}f\n'.format(decimals)))
 
     return True
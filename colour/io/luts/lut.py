@@ -19,6 +19,7 @@ import re
 from abc import ABCMeta, abstractmethod
 from collections import MutableSequence
 from copy import deepcopy
+from multiprocessing.pool import ThreadPool
 # pylint: disable=W0622
 from operator import add, mul, pow, sub, iadd, imul, ipow, isub
 
@@ -30,12 +31,13 @@ except ImportError:
 
     div = truediv
     idiv = itruediv
+from scipy.spatial import cKDTree
 from six import add_metaclass
 
 from colour.algebra import LinearInterpolator, table_interpolation_trilinear
-from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (as_float_array, is_iterable, is_string,
-                              linear_conversion, tsplit, tstack)
+from colour.constants import DEFAULT_INT_DTYPE, EPSILON
+from colour.utilities import (as_float_array, get_default_float_dtype,
+                              is_iterable, is_string, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -45,11 +47,97 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'AbstractLUT', 'LUT1D', 'LUT2D', 'LUT3D', 'LUT_to_LUT',
+    'AbstractLUT', 'LUT1D', 'LUT2D', 'LUT3D', 'LUT_to_LUT', 'PreparedLUT',
     'AbstractLUTSequenceOperator', 'LUTSequence'
 ]
 
 
+def _apply_by_tiles(function,
+                    RGB,
+                    out=None,
+                    tile_size=None,
+                    processes=1,
+                    channels=3):
+    """
+    Applies given function to given *RGB* colourspace array by tiles of
+    bounded size, optionally writing the result into given output array.
+
+    Parameters
+    ----------
+    function : callable
+        Function processing a (N, channels) tile of the *RGB* colourspace
+        array.
+    RGB : array_like
+        *RGB* colourspace array to process.
+    out : ndarray, optional
+        C-contiguous array with the same shape than the *RGB* colourspace
+        array the result is written to, it can be the *RGB* colourspace array
+        itself.
+    tile_size : integer, optional
+        Samples count of the tiles, the whole array is processed at once if
+        *None* and ``processes`` is equal to 1.
+    processes : integer, optional
+        Threads count, the tiles are processed concurrently if greater than 1.
+    channels : integer, optional
+        Channels count of a sample.
+
+    Returns
+    -------
+    ndarray
+        Processed *RGB* colourspace array.
+
+    Raises
+    ------
+    ValueError
+        If ``out`` shape is not the *RGB* colourspace array shape or if it is
+        not C-contiguous.
+    """
+
+    processes = max(int(processes), 1)
+
+    if out is None and tile_size is None and processes == 1:
+        return function(RGB)
+
+    if not isinstance(RGB, np.ndarray):
+        RGB = as_float_array(RGB)
+
+    if out is None:
+        out = np.empty(RGB.shape, dtype=get_default_float_dtype())
+    elif out.shape != RGB.shape:
+        raise ValueError('"out" array shape must be "{0}", got "{1}"!'.format(
+            RGB.shape, out.shape))
+    elif not out.flags.c_contiguous:
+        raise ValueError('"out" array must be C-contiguous!')
+
+    RGB_f = np.reshape(RGB, [-1, channels])
+    out_f = out.reshape([-1, channels])
+
+    if tile_size is None:
+        tile_size = int(np.ceil(RGB_f.shape[0] / processes))
+    tile_size = max(int(tile_size), 1)
+
+    def process(i):
+        """
+        Processes the tile starting at given sample index.
+        """
+
+        out_f[i:i + tile_size] = function(RGB_f[i:i + tile_size])
+
+    indexes = range(0, RGB_f.shape[0], tile_size)
+    if processes > 1:
+        pool = ThreadPool(processes)
+        try:
+            pool.map(process, indexes)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for i in indexes:
+            process(i)
+
+    return out
+
+
 @add_metaclass(ABCMeta)
 class AbstractLUT:
     """
@@ -104,6 +192,7 @@ class AbstractLUT:
     arithmetical_operation
     linear_table
     apply
+    prepare
     copy
     as_LUT
     """
@@ -125,7 +214,7 @@ class AbstractLUT:
         self._domain = None
         self.domain = domain
         # pylint: disable=E1121
-        self._table = self.linear_table(size, domain)
+        self._table = self._validate_table(self.linear_table(size, domain))
         self.table = table
         self._comments = []
         self.comments = comments
@@ -654,7 +743,13 @@ class AbstractLUT:
         pass
 
     @abstractmethod
-    def apply(self, RGB, interpolator, interpolator_args):
+    def apply(self,
+              RGB,
+              interpolator,
+              interpolator_args,
+              out=None,
+              tile_size=None,
+              processes=1):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -667,6 +762,17 @@ class AbstractLUT:
         interpolator_args : dict_like, optional
             Arguments to use when instantiating or calling the interpolating
             function.
+        out : ndarray, optional
+            C-contiguous array with the same shape than the *RGB* colourspace
+            array the interpolated values are written to, it can be the *RGB*
+            colourspace array itself for in-place processing.
+        tile_size : integer, optional
+            Samples count of the tiles the *RGB* colourspace array is
+            processed by, it bounds the transient memory used by the
+            interpolation. The whole array is processed at once if *None*.
+        processes : integer, optional
+            Threads count, the tiles are processed concurrently if greater
+            than 1.
 
         Returns
         -------
@@ -688,6 +794,32 @@ class AbstractLUT:
 
         return deepcopy(self)
 
+    def prepare(self, method='Trilinear'):
+        """
+        Prepares the *LUT* for repeated application, see
+        :class:`colour.io.luts.lut.PreparedLUT` class.
+
+        Parameters
+        ----------
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method of a :class:`LUT3D` class instance.
+
+        Returns
+        -------
+        PreparedLUT
+            Prepared *LUT*.
+
+        Examples
+        --------
+        >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> LUT.prepare()(RGB)  # doctest: +ELLIPSIS
+        array([ 0.4583277...,  0.4583277...,  0.4583277...])
+        """
+
+        return PreparedLUT(self, method)
+
     @abstractmethod
     def as_LUT(self, cls, force_conversion, **kwargs):
         """
@@ -751,6 +883,7 @@ class LUT1D(AbstractLUT):
     -------
     linear_table
     apply
+    invert
     as_LUT
 
     Examples
@@ -883,7 +1016,10 @@ class LUT1D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
-              interpolator_args=None):
+              interpolator_args=None,
+              out=None,
+              tile_size=None,
+              processes=1):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -895,6 +1031,17 @@ class LUT1D(AbstractLUT):
             Interpolator class type to use as interpolating function.
         interpolator_args : dict_like, optional
             Arguments to use when instantiating the interpolating function.
+        out : ndarray, optional
+            C-contiguous array with the same shape than the *RGB* colourspace
+            array the interpolated values are written to, it can be the *RGB*
+            colourspace array itself for in-place processing.
+        tile_size : integer, optional
+            Samples count of the tiles the *RGB* colourspace array is
+            processed by, it bounds the transient memory used by the
+            interpolation. The whole array is processed at once if *None*.
+        processes : integer, optional
+            Threads count, the tiles are processed concurrently if greater
+            than 1.
 
         Returns
         -------
@@ -915,7 +1062,68 @@ class LUT1D(AbstractLUT):
 
         RGB_interpolator = interpolator(samples, self._table)
 
-        return RGB_interpolator(RGB)
+        return _apply_by_tiles(
+            RGB_interpolator, RGB, out, tile_size, processes, channels=1)
+
+    def invert(self,
+               size=None,
+               interpolator=LinearInterpolator,
+               interpolator_args=None):
+        """
+        Computes and returns an inverse copy of the *LUT*.
+
+        The *LUT* table being monotonic, its inverse is obtained by
+        interpolating the *LUT* domain samples over the *LUT* table.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, the *LUT* size is used if *None*.
+        interpolator : object, optional
+            Interpolator class type to use as interpolating function.
+        interpolator_args : dict_like, optional
+            Arguments to use when instantiating the interpolating function.
+
+        Returns
+        -------
+        LUT1D
+            Inverse *LUT* class instance, its domain is the *LUT* table range.
+
+        Examples
+        --------
+        >>> LUT = LUT1D(LUT1D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> LUT.invert(1024).apply(LUT.apply(RGB))  # doctest: +ELLIPSIS
+        array([ 0.18...,  0.18...,  0.18...])
+        """
+
+        if size is None:
+            size = self.size
+
+        if interpolator_args is None:
+            interpolator_args = {}
+
+        table = self._table
+        samples = self.linear_table(self.size, self.domain)
+
+        increments = np.diff(table)
+        assert np.all(increments > 0) or np.all(increments < 0), (
+            'The table must be strictly monotonic to be inverted!')
+
+        if increments[0] < 0:
+            table, samples = table[::-1], samples[::-1]
+
+        domain = np.array([table[0], table[-1]])
+
+        LUT_i = LUT1D(
+            name='{0} - Inverse'.format(self.name),
+            domain=domain,
+            comments=self.comments)
+        samples_interpolator = interpolator(table, samples,
+                                            **interpolator_args)
+        LUT_i.table = samples_interpolator(self.linear_table(size, domain))
+
+        return LUT_i
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1151,7 +1359,10 @@ class LUT2D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
-              interpolator_args=None):
+              interpolator_args=None,
+              out=None,
+              tile_size=None,
+              processes=1):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -1163,6 +1374,17 @@ class LUT2D(AbstractLUT):
             Interpolator class type to use as interpolating function.
         interpolator_args : dict_like, optional
             Arguments to use when instantiating the interpolating function.
+        out : ndarray, optional
+            C-contiguous array with the same shape than the *RGB* colourspace
+            array the interpolated values are written to, it can be the *RGB*
+            colourspace array itself for in-place processing.
+        tile_size : integer, optional
+            Samples count of the tiles the *RGB* colourspace array is
+            processed by, it bounds the transient memory used by the
+            interpolation. The whole array is processed at once if *None*.
+        processes : integer, optional
+            Threads count, the tiles are processed concurrently if greater
+            than 1.
 
         Returns
         -------
@@ -1177,19 +1399,25 @@ class LUT2D(AbstractLUT):
         array([ 0.4529220...,  0.4529220...,  0.4529220...])
         """
 
-        R, G, B = tsplit(RGB)
-        R_t, G_t, B_t = tsplit(self._table)
         domain_min, domain_max = self.domain
 
         size = DEFAULT_INT_DTYPE(self._table.size / 3)
 
-        RGB_i = [
+        RGB_interpolators = [
             interpolator(
-                np.linspace(domain_min[i], domain_max[i], size), j[1])(j[0])
-            for i, j in enumerate([(R, R_t), (G, G_t), (B, B_t)])
+                np.linspace(domain_min[i], domain_max[i], size),
+                self._table[..., i]) for i in range(3)
         ]
 
-        return tstack(RGB_i)
+        def apply(RGB):
+            """
+            Applies the *LUT* to given *RGB* colourspace array tile.
+            """
+
+            return tstack(
+                [RGB_interpolators[i](j) for i, j in enumerate(tsplit(RGB))])
+
+        return _apply_by_tiles(apply, RGB, out, tile_size, processes)
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1280,6 +1508,7 @@ class LUT3D(AbstractLUT):
     -------
     linear_table
     apply
+    invert
     as_LUT
 
     Examples
@@ -1461,7 +1690,10 @@ class LUT3D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=table_interpolation_trilinear,
-              interpolator_args=None):
+              interpolator_args=None,
+              out=None,
+              tile_size=None,
+              processes=1):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -1473,6 +1705,17 @@ class LUT3D(AbstractLUT):
             Interpolator object to use as interpolating function.
         interpolator_args : dict_like, optional
             Arguments to use when calling the interpolating function.
+        out : ndarray, optional
+            C-contiguous array with the same shape than the *RGB* colourspace
+            array the interpolated values are written to, it can be the *RGB*
+            colourspace array itself for in-place processing.
+        tile_size : integer, optional
+            Samples count of the tiles the *RGB* colourspace array is
+            processed by, it bounds the transient memory used by the
+            interpolation. The whole array is processed at once if *None*.
+        processes : integer, optional
+            Threads count, the tiles are processed concurrently if greater
+            than 1.
 
         Returns
         -------
@@ -1487,15 +1730,148 @@ class LUT3D(AbstractLUT):
         array([ 0.4583277...,  0.4583277...,  0.4583277...])
         """
 
-        R, G, B = tsplit(RGB)
-        domain_min, domain_max = self.domain
+        domain_min, domain_max = as_float_array(self.domain)
 
-        RGB_l = [
-            linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
-            for i, j in enumerate((R, G, B))
-        ]
+        def apply(RGB):
+            """
+            Applies the *LUT* to given *RGB* colourspace array tile.
+            """
+
+            # Single broadcasted equivalent of a per channel
+            # "linear_conversion" call to [0, 1].
+            RGB_l = as_float_array(RGB) - domain_min
+            RGB_l /= domain_max - domain_min
+
+            return interpolator(RGB_l, self._table)
+
+        return _apply_by_tiles(apply, RGB, out, tile_size, processes)
 
-        return interpolator(tstack(RGB_l), self._table)
+    def invert(self,
+               size=None,
+               query_size=8,
+               iterations=8,
+               interpolator=table_interpolation_trilinear,
+               interpolator_args=None):
+        """
+        Computes and returns an inverse copy of the *LUT*.
+
+        The inverse *LUT* table is first estimated by inverse distance
+        weighting the domain coordinates of the ``query_size`` nearest *LUT*
+        table samples, found with a *KD-Tree*. The estimate is then refined
+        with vectorised *Newton-Raphson* iterations using a finite differences
+        *Jacobian* of the interpolated *LUT*.
+
+        Parameters
+        ----------
+        size : int, optional
+            Inverse *LUT* size, the *LUT* size is used if *None*.
+        query_size : int, optional
+            Number of nearest *LUT* table samples used for the estimate.
+        iterations : int, optional
+            Maximum *Newton-Raphson* iterations count, the refinement stops
+            once converged.
+        interpolator : object, optional
+            Interpolator object to use as interpolating function.
+        interpolator_args : dict_like, optional
+            Arguments to use when calling the interpolating function.
+
+        Returns
+        -------
+        LUT3D
+            Inverse *LUT* class instance, its domain is the *LUT* table range.
+
+        Notes
+        -----
+        -   The *LUT* must be invertible, i.e. injective, and the values of
+            the inverse *LUT* domain that are outside the *LUT* gamut are
+            mapped to its boundary.
+        -   Inverting a 65x65x65 *LUT* takes a few seconds.
+
+        Examples
+        --------
+        >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> LUT.invert().apply(LUT.apply(RGB))  # doctest: +ELLIPSIS
+        array([ 0.18...,  0.18...,  0.18...])
+        """
+
+        if size is None:
+            size = self.size
+
+        if interpolator_args is None:
+            interpolator_args = {}
+
+        domain_min, domain_max = as_float_array(self.domain)
+        table = self._table.reshape([-1, 3])
+
+        # The inverse table is computed in the [0, 1] normalised domain of
+        # the interpolating function.
+        samples = self.linear_table(self.size).reshape([-1, 3])
+
+        domain = np.vstack([np.min(table, axis=0), np.max(table, axis=0)])
+        RGB = self.linear_table(size, domain).reshape([-1, 3])
+
+        # An unbalanced, non-compact tree is faster to build and query.
+        tree = cKDTree(table, balanced_tree=False, compact_nodes=False)
+        distances, indexes = tree.query(RGB, query_size)
+        if query_size == 1:
+            UVW = samples[indexes]
+        else:
+            weights = 1 / np.maximum(distances, EPSILON)
+            weights /= np.sum(weights, axis=-1)[..., np.newaxis]
+            UVW = np.sum(samples[indexes] * weights[..., np.newaxis], axis=-2)
+
+        def function(UVW):
+            """
+            Interpolates the *LUT* at given normalised domain coordinates.
+            """
+
+            return interpolator(UVW, self._table, **interpolator_args)
+
+        # Only the samples that have not converged yet are refined, the
+        # finite differences steps point towards the domain interior.
+        h = 1e-4
+        active = np.arange(UVW.shape[0])
+        for _i in range(iterations):
+            UVW_a = UVW[active]
+            RGB_a = function(UVW_a)
+            residual = RGB[active] - RGB_a
+
+            steps = np.where(UVW_a > 0.5, -h, h)
+            a, b, c = [(function(UVW_a + steps * np.identity(3)[j]) - RGB_a) /
+                       steps[..., j, np.newaxis] for j in range(3)]
+
+            # Vectorised "Cramer's rule" solution of the "Jacobian" system.
+            b_c = np.cross(b, c)
+            determinant = np.sum(a * b_c, axis=-1)
+            singular = np.abs(determinant) < EPSILON
+            determinant[singular] = 1
+
+            delta = tstack([
+                np.sum(residual * b_c, axis=-1),
+                np.sum(residual * np.cross(c, a), axis=-1),
+                np.sum(residual * np.cross(a, b), axis=-1),
+            ]) / determinant[..., np.newaxis]
+            delta[singular] = 0
+
+            UVW[active] = np.clip(UVW_a + delta, 0, 1)
+
+            # Converged samples, and samples outside the *LUT* gamut once
+            # clipped, are not refined further.
+            active = active[
+                np.max(np.abs(UVW[active] - UVW_a), axis=-1) > 1e-12]
+
+            if active.size == 0:
+                break
+
+        LUT_i = LUT3D(
+            name='{0} - Inverse'.format(self.name),
+            domain=domain,
+            comments=self.comments)
+        LUT_i.table = (domain_min + UVW * (domain_max - domain_min)).reshape(
+            [size, size, size, 3])
+
+        return LUT_i
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1564,6 +1940,64 @@ class LUT3D(AbstractLUT):
         return LUT_to_LUT(self, cls, force_conversion, **kwargs)
 
 
+def _separable_curves(LUT):
+    """
+    Returns the per-channel curves of given :class:`LUT3D` class instance if
+    its channels are independent, i.e. if its red, green and blue outputs
+    only depend on its red, green and blue inputs respectively.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        :class:`LUT3D` class instance.
+
+    Returns
+    -------
+    ndarray or None
+        Per-channel curves with shape (N, 3) or *None* if the channels of the
+        :class:`LUT3D` class instance are not independent.
+    """
+
+    table = LUT.table
+
+    curves = tstack([table[:, 0, 0, 0], table[0, :, 0, 1], table[0, 0, :, 2]])
+
+    for i, shape in enumerate(([-1, 1, 1], [1, -1, 1], [1, 1, -1])):
+        if not np.all(table[..., i] == np.reshape(curves[..., i], shape)):
+            return None
+
+    return curves
+
+
+def _sample_curves(curves, domain, RGB):
+    """
+    Linearly interpolates given per-channel curves defined over given domain
+    at given *RGB* colourspace array.
+    """
+
+    return tstack([
+        np.interp(RGB[..., i],
+                  np.linspace(domain[0, i], domain[1, i], curves.shape[0]),
+                  curves[..., i]) for i in range(3)
+    ])
+
+
+def _curves_to_table(curves):
+    """
+    Returns the :class:`LUT3D` class instance table of given per-channel
+    curves by broadcasting them along their respective axis.
+    """
+
+    size = curves.shape[0]
+
+    table = np.empty([size, size, size, 3], dtype=curves.dtype)
+    table[..., 0] = np.reshape(curves[..., 0], [-1, 1, 1])
+    table[..., 1] = np.reshape(curves[..., 1], [1, -1, 1])
+    table[..., 2] = np.reshape(curves[..., 2], [1, 1, -1])
+
+    return table
+
+
 def LUT_to_LUT(LUT, cls, force_conversion=False, **kwargs):
     """
     Converts given *LUT* to given ``cls`` class instance.
@@ -1593,6 +2027,15 @@ def LUT_to_LUT(LUT, cls, force_conversion=False, **kwargs):
     LUT1D or LUT2D or LUT3D
         Converted *LUT* class instance.
 
+    Notes
+    -----
+    -   The :class:`LUT3D` class instance tables of the upcasts are built by
+        broadcasting the channels curves rather than by applying the *LUT*
+        onto a full :class:`LUT3D` class instance linear table.
+    -   The channels independence of a :class:`LUT3D` class instance is
+        detected, in which case its channels curves are extracted from the
+        table axes and the downcasts are exact.
+
     Warning
     -------
     Some conversions are destructive and raise a :class:`ValueError` exception
@@ -1655,14 +2098,18 @@ def LUT_to_LUT(LUT, cls, force_conversion=False, **kwargs):
         if 'channel_weights' in kwargs:
             del kwargs['channel_weights']
 
+        # The 1D and 2D *LUTs* are channel independent: their upcast
+        # "LUT3D" tables are built by broadcasting the per-channel curves
+        # sampled along the "LUT2D" linear table, i.e. the cube diagonal,
+        # rather than by applying them onto a full "LUT3D" linear table.
         if isinstance(LUT, LUT1D):
             if cls is LUT2D:
                 domain = tstack([LUT.domain, LUT.domain, LUT.domain])
                 table = tstack([LUT.table, LUT.table, LUT.table])
             elif cls is LUT3D:
                 domain = tstack([LUT.domain, LUT.domain, LUT.domain])
-                table = LUT3D.linear_table(size, domain)
-                table = LUT.apply(table, **kwargs)
+                table = LUT2D.linear_table(size, domain)
+                table = _curves_to_table(LUT.apply(table, **kwargs))
         elif isinstance(LUT, LUT2D):
             if cls is LUT1D:
                 domain = np.array(
@@ -1671,26 +2118,353 @@ def LUT_to_LUT(LUT, cls, force_conversion=False, **kwargs):
                 table = np.sum(LUT.table * channel_weights, axis=-1)
             elif cls is LUT3D:
                 domain = LUT.domain
-                table = LUT3D.linear_table(size, domain)
-                table = LUT.apply(table, **kwargs)
+                table = LUT2D.linear_table(size, domain)
+                table = _curves_to_table(LUT.apply(table, **kwargs))
         elif isinstance(LUT, LUT3D):
+            # The curves of a channel independent "LUT3D" are extracted from
+            # the table axes and only interpolated along their axis.
+            curves = _separable_curves(LUT)
+
             if cls is LUT1D:
                 domain = np.array(
                     [np.max(LUT.domain[0, ...]),
                      np.min(LUT.domain[1, ...])])
                 table = LUT1D.linear_table(size, domain)
-                table = LUT.apply(tstack([table, table, table]), **kwargs)
-                table = np.sum(table * channel_weights, axis=-1)
+                table = tstack([table, table, table])
             elif cls is LUT2D:
                 domain = LUT.domain
                 table = LUT2D.linear_table(size, domain)
+
+            if curves is not None:
+                table = _sample_curves(curves, as_float_array(LUT.domain),
+                                       table)
+            else:
                 table = LUT.apply(table, **kwargs)
 
+            if cls is LUT1D:
+                table = np.sum(table * channel_weights, axis=-1)
+
         LUT = cls(table, name, domain, table.shape[0], LUT.comments)
 
     return LUT
 
 
+class PreparedLUT(object):
+    """
+    Defines a *LUT* prepared for repeated application.
+
+    The *LUT* domain scale and offset, the flattened table, the table
+    increments and strides are computed once at instantiation so that
+    applying the prepared *LUT* only performs the interpolation itself.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT2D or LUT3D
+        *LUT* to prepare.
+    method : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation method of a :class:`LUT3D` class instance, the
+        :class:`LUT1D` and :class:`LUT2D` class instances are linearly
+        interpolated.
+
+    Attributes
+    ----------
+    LUT
+    method
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    -   The *LUT* table is copied at instantiation, subsequent changes to the
+        *LUT* are not reflected by the prepared *LUT*.
+    -   The *RGB* colourspace array values outside the *LUT* domain are
+        clipped to it, whereas :meth:`LUT1D.apply` and :meth:`LUT2D.apply`
+        methods raise an exception.
+
+    Examples
+    --------
+    >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
+    >>> prepared_LUT = PreparedLUT(LUT, 'Tetrahedral')
+    >>> RGB = np.array([[0.18, 0.18, 0.18], [0.5, 0.5, 0.5]])
+    >>> prepared_LUT(RGB)  # doctest: +ELLIPSIS
+    array([[ 0.4583277...,  0.4583277...,  0.4583277...],
+           [ 0.7297400...,  0.7297400...,  0.7297400...]])
+    """
+
+    def __init__(self, LUT, method='Trilinear'):
+        assert isinstance(LUT, AbstractLUT), (
+            '"LUT" must be a "LUT1D", "LUT2D" or "LUT3D" instance!')
+
+        assert method.lower() in ('trilinear', 'tetrahedral'), (
+            '"method" must be one of "Trilinear" or "Tetrahedral"!')
+
+        self._LUT = LUT
+        self._method = method
+
+        dtype = get_default_float_dtype()
+
+        table = as_float_array(LUT.table)
+        domain_min, domain_max = as_float_array(LUT.domain)
+
+        # The *LUT* domain is mapped to the table indexes with a single
+        # multiply-add: "i = RGB * scale + offset".
+        self._i_m = table.shape[0] - 1
+        self._scale = (self._i_m / (domain_max - domain_min)).astype(dtype)
+        self._offset = (-domain_min * self._scale).astype(dtype)
+
+        if isinstance(LUT, LUT3D):
+            self._channels = 3
+            self._strides = np.array(
+                [table.shape[1] * table.shape[2], table.shape[2], 1])
+            self._table = np.reshape(table, [-1, 3])
+        else:
+            # The channels of a "LUT2D" table are flattened one after the
+            # other, they are reached with a per-channel base index. The
+            # increments are padded so that they share the table indexes.
+            self._channels = 1 if isinstance(LUT, LUT1D) else 3
+            increments = np.diff(table, axis=0)
+            increments = np.concatenate(
+                [increments,
+                 np.zeros([1] + list(increments.shape[1:]))])
+            self._table = np.ravel(np.transpose(table)).astype(dtype)
+            self._increments = np.ravel(np.transpose(increments)).astype(dtype)
+            self._bases = (0 if self._channels == 1 else
+                           np.arange(3) * table.shape[0])
+
+    @property
+    def LUT(self):
+        """
+        Getter property for the prepared *LUT*.
+
+        Returns
+        -------
+        LUT1D or LUT2D or LUT3D
+            Prepared *LUT*.
+        """
+
+        return self._LUT
+
+    @property
+    def method(self):
+        """
+        Getter property for the prepared *LUT* interpolation method.
+
+        Returns
+        -------
+        unicode
+            Interpolation method.
+        """
+
+        return self._method
+
+    def _indexes_and_relative_coordinates(self, RGB):
+        """
+        Returns the floor indexes and relative coordinates of given *RGB*
+        colourspace array in the table.
+        """
+
+        i = RGB * self._scale
+        i += self._offset
+        i = np.clip(i, 0, self._i_m)
+
+        # The floor indexes are bounded so that the ceiling indexes are always
+        # valid, the relative coordinates being equal to 1 on the table upper
+        # boundary.
+        i_f = np.minimum(i.astype(DEFAULT_INT_DTYPE), self._i_m - 1)
+        i -= i_f
+
+        return i_f, i
+
+    def _interpolate_linear(self, RGB):
+        """
+        Linearly interpolates given *RGB* colourspace array tile with the
+        prepared :class:`LUT1D` or :class:`LUT2D` class instance.
+        """
+
+        i_f, r = self._indexes_and_relative_coordinates(as_float_array(RGB))
+        i_f += self._bases
+
+        RGB_o = np.take(self._increments, i_f)
+        RGB_o *= r
+        RGB_o += np.take(self._table, i_f)
+
+        return RGB_o
+
+    def _interpolate_trilinear(self, RGB):
+        """
+        Trilinearly interpolates given *RGB* colourspace array tile with the
+        prepared :class:`LUT3D` class instance.
+        """
+
+        RGB = as_float_array(RGB)
+
+        i_f, r = self._indexes_and_relative_coordinates(
+            np.reshape(RGB, [-1, 3]))
+        i_0 = np.dot(i_f, self._strides)
+        del i_f
+
+        s_x, s_y, s_z = self._strides
+        x, y, z = [r[..., i, np.newaxis] for i in range(3)]
+
+        def vertex(i):
+            """
+            Gathers the table vertices at given flat indexes.
+            """
+
+            return np.take(self._table, i, axis=0)
+
+        def lerp(a, b, t):
+            """
+            Linearly interpolates between given vertices.
+            """
+
+            b -= a
+            b *= t
+            b += a
+
+            return b
+
+        # Successive interpolations along the *z*, *y* and *x* axes.
+        RGB_o = lerp(
+            lerp(
+                lerp(vertex(i_0), vertex(i_0 + s_z), z),
+                lerp(vertex(i_0 + s_y), vertex(i_0 + s_y + s_z), z), y),
+            lerp(
+                lerp(vertex(i_0 + s_x), vertex(i_0 + s_x + s_z), z),
+                lerp(
+                    vertex(i_0 + s_x + s_y), vertex(i_0 + s_x + s_y + s_z), z),
+                y), x)
+
+        return np.reshape(RGB_o, RGB.shape)
+
+    def _interpolate_tetrahedral(self, RGB):
+        """
+        Tetrahedrally interpolates given *RGB* colourspace array tile with the
+        prepared :class:`LUT3D` class instance.
+        """
+
+        RGB = as_float_array(RGB)
+
+        i_f, r = self._indexes_and_relative_coordinates(
+            np.reshape(RGB, [-1, 3]))
+        i_0 = np.dot(i_f, self._strides)
+        del i_f
+
+        # The simplex vertices are reached by successively stepping along the
+        # axes sorted by decreasing relative coordinates, see
+        # :func:`colour.algebra.table_interpolation_tetrahedral` definition.
+        x, y, z = [r[..., i] for i in range(3)]
+        simplex = 4 * (x > y) + 2 * (y > z) + (x > z)
+        del x, y, z
+
+        axes = np.array([[2, 1, 0], [2, 1, 0], [1, 2, 0], [1, 0, 2], [2, 0, 1],
+                         [0, 2, 1], [0, 1, 2], [0, 1, 2]])[simplex]
+        del simplex
+
+        i_s = self._strides[axes]
+        axes += 3 * np.arange(r.shape[0])[..., np.newaxis]
+        r_1, r_2, r_3 = tsplit(np.take(r, axes))
+        del r, axes
+
+        i_1 = i_0 + i_s[..., 0]
+        i_2 = i_1 + i_s[..., 1]
+        i_3 = i_2 + i_s[..., 2]
+        del i_s
+
+        RGB_o = (1 - r_1)[..., np.newaxis] * np.take(self._table, i_0, axis=0)
+        RGB_o += (r_1 - r_2)[..., np.newaxis] * np.take(
+            self._table, i_1, axis=0)
+        RGB_o += (r_2 - r_3)[..., np.newaxis] * np.take(
+            self._table, i_2, axis=0)
+        RGB_o += r_3[..., np.newaxis] * np.take(self._table, i_3, axis=0)
+
+        return np.reshape(RGB_o, RGB.shape)
+
+    def __call__(self, RGB, out=None, tile_size=None, processes=1):
+        """
+        Applies the prepared *LUT* to given *RGB* colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the prepared *LUT* onto.
+        out : ndarray, optional
+            C-contiguous array with the same shape than the *RGB* colourspace
+            array the interpolated values are written to, it can be the *RGB*
+            colourspace array itself for in-place processing.
+        tile_size : integer, optional
+            Samples count of the tiles the *RGB* colourspace array is
+            processed by, it bounds the transient memory used by the
+            interpolation. The whole array is processed at once if *None*.
+        processes : integer, optional
+            Threads count, the tiles are processed concurrently if greater
+            than 1.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+        """
+
+        if not isinstance(self._LUT, LUT3D):
+            function = self._interpolate_linear
+        elif self._method.lower() == 'trilinear':
+            function = self._interpolate_trilinear
+        else:
+            function = self._interpolate_tetrahedral
+
+        return _apply_by_tiles(function, RGB, out, tile_size, processes,
+                               self._channels)
+
+
+def _fuse_LUTs(LUTs,
+               size=None,
+               interpolator=LinearInterpolator,
+               interpolator_args=None):
+    """
+    Fuses given consecutive :class:`colour.LUT1D` and :class:`colour.LUT2D`
+    class instances into a single *LUT* by resampling their composition over
+    the first *LUT* domain.
+
+    Parameters
+    ----------
+    LUTs : array_like
+        :class:`colour.LUT1D` and :class:`colour.LUT2D` class instances to
+        fuse.
+    size : int, optional
+        Fused *LUT* size, default to the largest *LUT* size.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function.
+    interpolator_args : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+
+    Returns
+    -------
+    LUT1D or LUT2D
+        Fused *LUT*, a :class:`colour.LUT1D` class instance if all the given
+        *LUTs* are :class:`colour.LUT1D` class instances.
+    """
+
+    cls = LUT1D if all(isinstance(LUT, LUT1D) for LUT in LUTs) else LUT2D
+
+    if size is None:
+        size = max(LUT.table.shape[0] for LUT in LUTs)
+
+    domain = LUTs[0].domain
+    if cls is LUT2D and isinstance(LUTs[0], LUT1D):
+        domain = tstack([domain, domain, domain])
+
+    table = cls.linear_table(size, domain)
+    for LUT in LUTs:
+        table = LUT.apply(table, interpolator, interpolator_args)
+
+    return cls(table, ' ---> '.join([LUT.name for LUT in LUTs]), domain, size,
+               [comment for LUT in LUTs for comment in LUT.comments])
+
+
 @add_metaclass(ABCMeta)
 class AbstractLUTSequenceOperator:
     """
@@ -1752,6 +2526,8 @@ class LUTSequence(MutableSequence):
     __ne__
     insert
     apply
+    compile
+    bake
     copy
 
     Examples
@@ -2053,6 +2829,176 @@ class LUTSequence(MutableSequence):
 
         return RGB
 
+    def compile(self,
+                size=None,
+                interpolator_1D=LinearInterpolator,
+                interpolator_1D_args=None):
+        """
+        Compiles the *LUT* sequence by fusing the runs of consecutive
+        :class:`colour.LUT1D` and :class:`colour.LUT2D` class instances into
+        single *LUTs*.
+
+        Each run is resampled over the domain of its first *LUT*: the fused
+        *LUT* is a :class:`colour.LUT1D` class instance if the run only
+        contains :class:`colour.LUT1D` class instances, a
+        :class:`colour.LUT2D` class instance otherwise. The other operations
+        are copied as is.
+
+        Parameters
+        ----------
+        size : int, optional
+            Fused *LUTs* size, default to the largest *LUT* size of each run.
+        interpolator_1D : object, optional
+            Interpolator object to use as interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT2D`) class instances.
+        interpolator_1D_args : dict_like, optional
+            Arguments to use when calling the interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT2D`) class instances.
+
+        Returns
+        -------
+        LUTSequence
+            Compiled *LUT* sequence.
+
+        Examples
+        --------
+        >>> LUT_1 = LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'Gamma')
+        >>> LUT_2 = LUT2D(LUT2D.linear_table(16) * 0.750, 'Scale')
+        >>> LUT_3 = LUT3D(LUT3D.linear_table(16) ** 2, 'Cube')
+        >>> LUT_sequence = LUTSequence(LUT_1, LUT_2, LUT_3).compile()
+        >>> print(' ---> '.join(LUT.name for LUT in LUT_sequence))
+        Gamma ---> Scale ---> Cube
+        >>> print(len(LUT_sequence))
+        2
+        """
+
+        sequence = []
+        run = []
+        for operation in list(self) + [None]:
+            if isinstance(operation, (LUT1D, LUT2D)):
+                run.append(operation)
+                continue
+
+            if len(run) == 1:
+                sequence.append(deepcopy(run[0]))
+            elif len(run) > 1:
+                sequence.append(
+                    _fuse_LUTs(run, size, interpolator_1D,
+                               interpolator_1D_args))
+            run = []
+
+            if operation is not None:
+                sequence.append(deepcopy(operation))
+
+        return LUTSequence(*sequence)
+
+    def bake(self,
+             size=33,
+             shaper=True,
+             interpolator_1D=LinearInterpolator,
+             interpolator_1D_args=None,
+             interpolator_3D=table_interpolation_trilinear,
+             interpolator_3D_args=None):
+        """
+        Bakes the *LUT* sequence into a single :class:`colour.LUT3D` class
+        instance, optionally preceded by a shaper *LUT*, so that it is applied
+        with a single 3D lookup.
+
+        The *LUT* sequence is compiled first, see
+        :meth:`colour.LUTSequence.compile` method. If ``shaper`` is *True* and
+        the compiled *LUT* sequence starts with a :class:`colour.LUT1D` or
+        :class:`colour.LUT2D` class instance, the latter is kept as the shaper
+        *LUT* and the remaining operations are sampled over its output range,
+        otherwise the whole *LUT* sequence is sampled over the domain of its
+        first *LUT*, or [0, 1] if it starts with an
+        :class:`colour.io.luts.lut.AbstractLUTSequenceOperator` class instance.
+        An empty *LUT* sequence is baked into an empty *LUT* sequence.
+
+        Parameters
+        ----------
+        size : int, optional
+            Baked :class:`colour.LUT3D` class instance size.
+        shaper : bool, optional
+            Whether to keep the leading 1D *LUT* of the compiled *LUT* sequence
+            as a shaper *LUT*.
+        interpolator_1D : object, optional
+            Interpolator object to use as interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT2D`) class instances.
+        interpolator_1D_args : dict_like, optional
+            Arguments to use when calling the interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT2D`) class instances.
+        interpolator_3D : object, optional
+            Interpolator object to use as interpolating function for
+            :class:`colour.LUT3D` class instances.
+        interpolator_3D_args : dict_like, optional
+            Arguments to use when calling the interpolating function for
+            :class:`colour.LUT3D` class instances.
+
+        Returns
+        -------
+        LUTSequence
+            Baked *LUT* sequence, i.e. a :class:`colour.LUT3D` class instance
+            optionally preceded by a shaper *LUT*.
+
+        Examples
+        --------
+        >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
+        >>> LUT_2 = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2))
+        >>> LUT_3 = LUT2D(LUT2D.linear_table(16) * 0.750)
+        >>> LUT_sequence = LUTSequence(LUT_1, LUT_2, LUT_3).bake()
+        >>> print(' ---> '.join(a.__class__.__name__ for a in LUT_sequence))
+        LUT1D ---> LUT3D
+        >>> samples = np.linspace(0, 1, 5)
+        >>> RGB = tstack([samples, samples, samples])
+        >>> LUT_sequence.apply(RGB)  # doctest: +ELLIPSIS
+        array([[ 0.2899886...,  0.2899886...,  0.2899886...],
+               [ 0.4797662...,  0.4797662...,  0.4797662...],
+               [ 0.6055328...,  0.6055328...,  0.6055328...],
+               [ 0.7057779...,  0.7057779...,  0.7057779...],
+               [ 0.75     ...,  0.75     ...,  0.75     ...]])
+        """
+
+        operations = list(
+            self.compile(
+                interpolator_1D=interpolator_1D,
+                interpolator_1D_args=interpolator_1D_args))
+
+        if len(operations) == 0:
+            return LUTSequence()
+
+        shaper_LUT = None
+        if (shaper and len(operations) > 1 and
+                isinstance(operations[0], (LUT1D, LUT2D))):
+            shaper_LUT = operations.pop(0)
+            domain = np.array([
+                np.min(shaper_LUT.table, axis=0),
+                np.max(shaper_LUT.table, axis=0)
+            ])
+        elif isinstance(operations[0], AbstractLUT):
+            domain = operations[0].domain
+        else:
+            domain = np.array([0, 1])
+
+        if domain.ndim == 1:
+            domain = tstack([domain, domain, domain])
+
+        table = LUTSequence(*operations).apply(
+            LUT3D.linear_table(size, domain), interpolator_1D,
+            interpolator_1D_args, interpolator_3D, interpolator_3D_args)
+
+        LUTs = [
+            operation for operation in operations
+            if isinstance(operation, AbstractLUT)
+        ]
+        comments = [comment for LUT in LUTs for comment in LUT.comments]
+        LUT = LUT3D(table, ' ---> '.join([LUT.name for LUT in LUTs]), domain,
+                    size, comments)
+
+        if shaper_LUT is None:
+            return LUTSequence(LUT)
+        else:
+            return LUTSequence(shaper_LUT, LUT)
+
     def copy(self):
         """
         Returns a copy of the *LUT* sequence.
@@ -24,7 +24,8 @@ import re
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.io.luts import LUT1D, LUT2D, LUT3D, LUTSequence
-from colour.utilities import as_float_array, tstack
+from colour.io.luts.common import format_table, parse_table
+from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -104,7 +105,7 @@ def read_LUT_ResolveCube(path):
     title = re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
     size2D = 2
     size3D = 2
-    table = []
+    table = np.zeros([0, 3])
     comments = []
     has_2D, has_3D = False, False
 
@@ -116,9 +117,12 @@ def read_LUT_ResolveCube(path):
         return np.array(list(map(DEFAULT_FLOAT_DTYPE, array)))
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
         LUT = LUTSequence(LUT2D(), LUT3D())
-        for line in lines:
+        while True:
+            line = cube_file.readline()
+            if len(line) == 0:
+                break
+
             line = line.strip()
 
             if len(line) == 0:
@@ -144,9 +148,12 @@ def read_LUT_ResolveCube(path):
                 has_3D = True
                 size3D = np.int_(tokens[1])
             else:
-                table.append(_parse_array(tokens))
+                # The table data follows the keywords, it is parsed in bulk.
+                table = parse_table(
+                    '{0}\n{1}'.format(line, cube_file.read()),
+                    comments=comments)
+                break
 
-    table = as_float_array(table)
     if has_2D and has_3D:
         LUT[0].name = '{0} - Shaper'.format(title)
         LUT[1].name = '{0} - Cube'.format(title)
@@ -261,13 +268,6 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
     if has_3D:
         assert 2 <= LUT[1].size <= 256, 'Cube size must be in domain [2, 256]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Resolve* *.cube* data row.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
     def _format_tuple(array):
         """
         Formats given array as 2 space separated values to *decimals* precison.
@@ -302,15 +302,15 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
                 cube_file.write('LUT_3D_INPUT_RANGE {0}\n'.format(
                     _format_tuple([LUT[1].domain[0][0], LUT[1].domain[1][0]])))
 
+        row_format = '%0.{0}f %0.{0}f %0.{0}f\n'.format(decimals)
+
         if has_2D:
             table = LUT[0].table
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.writelines(format_table(table, row_format))
             cube_file.write('\n')
 
         if has_3D:
             table = LUT[1].table.reshape([-1, 3], order='F')
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.writelines(format_table(table, row_format))
 
     return True
@@ -17,7 +17,8 @@ import re
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT2D, LUTSequence
-from colour.utilities import as_float_array, warning
+from colour.io.luts.common import format_table, parse_table
+from colour.utilities import warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -80,7 +81,7 @@ def read_LUT_SonySPI1D(path):
     title = re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
     domain_min, domain_max = np.array([0, 1])
     dimensions = 1
-    table = []
+    table = np.zeros([0, 1])
 
     comments = []
 
@@ -92,8 +93,11 @@ def read_LUT_SonySPI1D(path):
         return np.array(list(map(DEFAULT_FLOAT_DTYPE, array)))
 
     with open(path) as spi1d_file:
-        lines = spi1d_file.readlines()
-        for line in lines:
+        while True:
+            line = spi1d_file.readline()
+            if len(line) == 0:
+                break
+
             line = line.strip()
 
             if len(line) == 0:
@@ -116,12 +120,20 @@ def read_LUT_SonySPI1D(path):
                     'Only 1 or 3 components are supported!')
 
                 dimensions = 1 if component == 1 else 2
-            elif tokens[0] in ('{', '}'):
-                continue
-            else:
-                table.append(_parse_array(tokens))
+            elif tokens[0] == '{':
+                # The table data is enclosed in braces, it is parsed in bulk.
+                data, _brace, remaining = spi1d_file.read().partition('}')
+                table = parse_table(
+                    data,
+                    columns=1 if dimensions == 1 else 3,
+                    comments=comments)
+                comments.extend([
+                    line.strip()[1:].strip()
+                    for line in remaining.splitlines()
+                    if line.strip().startswith('#')
+                ])
+                break
 
-    table = as_float_array(table)
     if dimensions == 1:
         return LUT1D(
             np.squeeze(table),
@@ -200,13 +212,6 @@ def write_LUT_SonySPI1D(LUT, path, decimals=7):
 
         assert len(domain) == 2, 'Non-uniform "LUT" domain is unsupported!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Sony* *.spi1d* data row.
-        """
-
-        return ' {1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
     with open(path, 'w') as spi1d_file:
         spi1d_file.write('Version 1\n')
 
@@ -219,11 +224,9 @@ def write_LUT_SonySPI1D(LUT, path, decimals=7):
         spi1d_file.write('Components {0}\n'.format(1 if is_1D else 3))
 
         spi1d_file.write('{\n')
-        for row in LUT.table:
-            if is_1D:
-                spi1d_file.write(' {1:0.{0}f}\n'.format(decimals, row))
-            else:
-                spi1d_file.write('{0}\n'.format(_format_array(row)))
+        spi1d_file.writelines(
+            format_table(LUT.table, (' %0.{0}f' * (1 if is_1D else 3) + '\n')
+                         .format(decimals)))
         spi1d_file.write('}\n')
 
         if LUT.comments:
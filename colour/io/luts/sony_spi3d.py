@@ -15,9 +15,10 @@ import numpy as np
 import os
 import re
 
-from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
+from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
-from colour.utilities import as_float_array, warning
+from colour.io.luts.common import format_table, parse_table
+from colour.utilities import warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -64,20 +65,15 @@ def read_LUT_SonySPI3D(path):
     title = re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
     size = 2
-    indexes = []
-    table = []
+    data = np.zeros([0, 6])
     comments = []
 
-    def _parse_array(array, dtype=DEFAULT_FLOAT_DTYPE):
-        """
-        Converts given string array to :class:`ndarray` class.
-        """
-
-        return np.array(list(map(dtype, array)))
-
     with open(path) as spi3d_file:
-        lines = spi3d_file.readlines()
-        for line in lines:
+        while True:
+            line = spi3d_file.readline()
+            if len(line) == 0:
+                break
+
             line = line.strip()
 
             if len(line) == 0:
@@ -94,15 +90,21 @@ def read_LUT_SonySPI3D(path):
 
                 size = DEFAULT_INT_DTYPE(tokens[0])
             if len(tokens) == 6:
-                indexes.append(_parse_array(tokens[:3]))
-                table.append(_parse_array(tokens[3:]))
+                # The table data follows the header, it is parsed in bulk.
+                data = parse_table(
+                    '{0}\n{1}'.format(line, spi3d_file.read()),
+                    columns=6,
+                    comments=comments)
+                break
+
+    indexes, table = data[:, :3], data[:, 3:]
 
     assert np.array_equal(
         indexes,
         DEFAULT_INT_DTYPE(LUT3D.linear_table(size) * (size - 1)).reshape(
             (-1, 3))), 'Indexes do not match expected "LUT3D" indexes!'
 
-    table = as_float_array(table).reshape([size, size, size, 3])
+    table = table.reshape([size, size, size, 3])
 
     return LUT3D(
         table, title, np.vstack([domain_min, domain_max]), comments=comments)
@@ -157,14 +159,6 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
         [1, 1, 1],
     ])), '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Sony* *.spi3d* data row.
-        """
-
-        return '{1:d} {2:d} {3:d} {4:0.{0}f} {5:0.{0}f} {6:0.{0}f}'.format(
-            decimals, *array)
-
     with open(path, 'w') as spi3d_file:
         spi3d_file.write('SPILUT 1.0\n')
 
@@ -176,9 +170,10 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
             LUT.linear_table(LUT.size) * (LUT.size - 1)).reshape([-1, 3])
         table = LUT.table.reshape([-1, 3])
 
-        for i, row in enumerate(indexes):
-            spi3d_file.write('{0}\n'.format(
-                _format_array(list(row) + list(table[i]))))
+        spi3d_file.writelines(
+            format_table(
+                np.hstack([indexes, table]),
+                '%d %d %d %0.{0}f %0.{0}f %0.{0}f\n'.format(decimals)))
 
         if LUT.comments:
             for comment in LUT.comments:
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.colour_binary` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (LUT1D, LUT2D, LUT3D, LUTSequence, read_LUT,
+                       read_LUT_ColourBinary, write_LUT_ColourBinary)
+from colour.io.luts.colour_binary import LUT_cache_path, _read_header
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUTS_DIRECTORY', 'TestReadWriteLUTColourBinary', 'TestReadLUTCache'
+]
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'resolve_cube')
+
+
+class TestReadWriteLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary` and
+    :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary` definitions
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_write_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary` and
+        :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+        definitions.
+        """
+
+        path = os.path.join(self._temporary_directory, 'LUT.clb')
+
+        LUT_1 = LUT1D(
+            LUT1D.linear_table(16) ** (1 / 2.2),
+            'LUT 1',
+            np.array([-0.1, 1.5]),
+            comments=['A first comment.', 'A second comment.'])
+        LUT_2 = LUT2D(
+            LUT2D.linear_table(16) ** (1 / 2.2), 'LUT 2',
+            np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]))
+        LUT_3 = LUT3D(LUT3D.linear_table(17) ** (1 / 2.2), 'LUT 3')
+
+        for LUT_r in (LUT_1, LUT_2, LUT_3, LUTSequence(LUT_1, LUT_2, LUT_3)):
+            write_LUT_ColourBinary(LUT_r, path)
+            LUT_t = read_LUT_ColourBinary(path)
+
+            self.assertEqual(LUT_r, LUT_t)
+
+        LUT_t = read_LUT(path)
+        self.assertIsInstance(LUT_t, LUTSequence)
+        self.assertEqual(LUT_t[0].name, 'LUT 1')
+        self.assertListEqual(LUT_t[0].comments,
+                             ['A first comment.', 'A second comment.'])
+
+        self.assertIsInstance(LUT_t[2].table.base, np.memmap)
+
+        LUT_t[2] += 1
+        np.testing.assert_equal(read_LUT(path)[2].table, LUT_3.table)
+
+
+class TestReadLUTCache(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.read_LUT` definition cache unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._path = os.path.join(self._temporary_directory, 'LogC.cube')
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, 'LogC_Video.cube'), self._path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_cache(self):
+        """
+        Tests :func:`colour.io.luts.read_LUT` definition cache.
+        """
+
+        LUT_r = read_LUT(self._path, 'Resolve Cube', cache=True)
+        cache_path = LUT_cache_path(self._path)
+
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertEqual(cache_path, '{0}.clb'.format(self._path))
+
+        LUT_t = read_LUT(self._path, 'Resolve Cube', cache=True)
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertIsInstance(LUT_t[1].table.base, np.memmap)
+
+        os.utime(self._path, (0, 0))
+        self.assertEqual(
+            read_LUT(self._path, 'Resolve Cube', cache=True), LUT_r)
+
+        # The cache is rewritten with the new modification time after the
+        # digest matched so that the next reading takes the fast path.
+        source = _read_header(cache_path)[0]['source']
+        self.assertEqual(source['mtime'], os.path.getmtime(self._path))
+        self.assertEqual(
+            read_LUT(self._path, 'Resolve Cube', cache=True), LUT_r)
+
+        with open(self._path, 'a') as cube_file:
+            cube_file.write('# A new comment.\n')
+
+        LUT_t = read_LUT(self._path, 'Resolve Cube', cache=True)
+        self.assertEqual(LUT_t[1].comments[-1], 'A new comment.')
+        self.assertEqual(read_LUT_ColourBinary(cache_path), LUT_t)
+
+        self.assertIsInstance(
+            read_LUT(
+                self._path, 'Resolve Cube', cache=self._temporary_directory),
+            LUTSequence)
+        self.assertTrue(
+            os.path.exists(
+                LUT_cache_path(self._path, self._temporary_directory)))
+
+    def test_read_LUT_truncated_cache(self):
+        """
+        Tests :func:`colour.io.luts.read_LUT` definition truncated cache
+        rebuilding.
+        """
+
+        LUT_r = read_LUT(self._path, 'Resolve Cube', cache=True)
+        cache_path = LUT_cache_path(self._path)
+        size = os.path.getsize(cache_path)
+
+        with open(cache_path, 'r+b') as cache_file:
+            cache_file.truncate(size - 64)
+
+        self.assertEqual(
+            read_LUT(self._path, 'Resolve Cube', cache=True), LUT_r)
+        self.assertEqual(os.path.getsize(cache_path), size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.common` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.io.luts.common import format_table, parse_table
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestParseTable', 'TestFormatTable']
+
+
+class TestParseTable(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_table` definition unit tests
+    methods.
+    """
+
+    def test_parse_table(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_table` definition.
+        """
+
+        comments = []
+        np.testing.assert_equal(
+            parse_table(
+                '# A first comment.\n'
+                '0 1 2 3 4 5\n'
+                '  # A second comment.\n'
+                '6 7 8 9 10 11\n',
+                columns=6,
+                comments=comments),
+            np.arange(12).reshape([2, 6]))
+        self.assertListEqual(comments,
+                             ['A first comment.', 'A second comment.'])
+
+        self.assertTupleEqual(parse_table('').shape, (0, 3))
+
+
+class TestFormatTable(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.format_table` definition unit tests
+    methods.
+    """
+
+    def test_format_table(self):
+        """
+        Tests :func:`colour.io.luts.common.format_table` definition.
+        """
+
+        table = np.linspace(0, 1, 30).reshape([10, 3])
+        chunks = list(format_table(table, '%0.7f %0.7f %0.7f\n', 4))
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(
+            ''.join(chunks), ''.join(
+                '{0:0.7f} {1:0.7f} {2:0.7f}\n'.format(*row) for row in table))
+
+        np.testing.assert_almost_equal(
+            parse_table(''.join(chunks)), table, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,12 +10,13 @@ import os
 import textwrap
 import unittest
 
-from colour.algebra import random_triplet_generator, spow
+from colour.algebra import (random_triplet_generator, spow,
+                            table_interpolation_tetrahedral)
 from colour.io.luts.lut import AbstractLUT
 from colour.io.luts import (AbstractLUTSequenceOperator, LUT1D, LUT2D, LUT3D,
-                            LUTSequence, LUT_to_LUT)
+                            LUTSequence, LUT_to_LUT, PreparedLUT)
 from colour.models import function_gamma
-from colour.utilities import tsplit, tstack
+from colour.utilities import default_float_dtype, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -432,6 +433,140 @@ class TestLUT(unittest.TestCase):
         np.testing.assert_almost_equal(
             LUT_2.apply(RANDOM_TRIPLETS), self._applied_2, decimal=7)
 
+    def test_apply_tiled(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply`,
+        :class:`colour.io.luts.lut.LUT2D.apply` and
+        :class:`colour.io.luts.lut.LUT3D.apply` methods tiled processing.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(domain=self._domain_2)
+        LUT.table = spow(LUT.table, 1 / 2.2)
+
+        for tile_size, processes in ((1, 1), (3, 1), (3, 2), (None, 3)):
+            np.testing.assert_almost_equal(
+                LUT.apply(
+                    RANDOM_TRIPLETS, tile_size=tile_size, processes=processes),
+                self._applied_2,
+                decimal=7)
+
+        out = np.zeros(RANDOM_TRIPLETS.shape)
+        self.assertIs(LUT.apply(RANDOM_TRIPLETS, out=out, tile_size=3), out)
+        np.testing.assert_almost_equal(out, self._applied_2, decimal=7)
+
+        RGB = np.copy(RANDOM_TRIPLETS)
+        LUT.apply(RGB, out=RGB, tile_size=5, processes=2)
+        np.testing.assert_almost_equal(RGB, self._applied_2, decimal=7)
+
+        self.assertRaises(
+            ValueError, LUT.apply, RANDOM_TRIPLETS, out=np.zeros([4, 3]))
+
+        self.assertRaises(
+            ValueError,
+            LUT.apply,
+            RANDOM_TRIPLETS,
+            out=np.zeros([2, 4, 3]).transpose([1, 0, 2]))
+
+    def test_apply_float32(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply`,
+        :class:`colour.io.luts.lut.LUT2D.apply` and
+        :class:`colour.io.luts.lut.LUT3D.apply` methods single precision
+        processing.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(domain=self._domain_2)
+        LUT.table = spow(LUT.table, 1 / 2.2)
+
+        with default_float_dtype(np.float32):
+            # pylint: disable=E1102
+            self.assertEqual(self._LUT_factory().table.dtype, np.float32)
+
+            RGB = LUT.apply(RANDOM_TRIPLETS.astype(np.float32))
+            self.assertEqual(RGB.dtype, np.float32)
+            np.testing.assert_allclose(RGB, self._applied_2, atol=1e-6)
+
+            RGB = LUT.apply(RANDOM_TRIPLETS, tile_size=3)
+            self.assertEqual(RGB.dtype, np.float32)
+            np.testing.assert_allclose(RGB, self._applied_2, atol=1e-6)
+
+    def test_invert(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.invert` and
+        :class:`colour.io.luts.lut.LUT3D.invert` methods.
+        """
+
+        if self._LUT_factory is None or self._LUT_factory is LUT2D:
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(self._table_2)
+        LUT_i = LUT.invert()
+
+        self.assertEqual(LUT_i.name, '{0} - Inverse'.format(LUT.name))
+        self.assertEqual(LUT_i.size, LUT.size)
+        np.testing.assert_almost_equal(LUT_i.domain, self._domain_1)
+
+        np.testing.assert_allclose(
+            LUT_i.apply(LUT.apply(RANDOM_TRIPLETS)),
+            RANDOM_TRIPLETS,
+            atol=1e-2)
+        self.assertEqual(LUT.invert(17).size, 17)
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(self._table_1 * 0.5 + 0.25)
+        LUT_i = LUT.invert()
+
+        np.testing.assert_almost_equal(
+            LUT_i.domain, self._domain_1 * 0.5 + 0.25, decimal=7)
+        np.testing.assert_almost_equal(LUT_i.table, self._table_1, decimal=7)
+
+    def test_prepare(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.prepare`,
+        :class:`colour.io.luts.lut.LUT2D.prepare` and
+        :class:`colour.io.luts.lut.LUT3D.prepare` methods.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(domain=self._domain_2)
+        LUT.table = spow(LUT.table, 1 / 2.2)
+
+        # The method only affects "LUT3D" class instances.
+        methods = {
+            'Trilinear':
+                self._applied_2,
+            'Tetrahedral':
+                LUT.apply(RANDOM_TRIPLETS, table_interpolation_tetrahedral)
+                if self._LUT_factory is LUT3D else self._applied_2,
+        }
+
+        for method, applied in methods.items():
+            prepared_LUT = LUT.prepare(method)
+
+            self.assertIsInstance(prepared_LUT, PreparedLUT)
+            self.assertIs(prepared_LUT.LUT, LUT)
+
+            np.testing.assert_almost_equal(
+                prepared_LUT(RANDOM_TRIPLETS), applied, decimal=7)
+
+            out = np.zeros(RANDOM_TRIPLETS.shape)
+            self.assertIs(
+                prepared_LUT(
+                    RANDOM_TRIPLETS, out=out, tile_size=3, processes=2), out)
+            np.testing.assert_almost_equal(out, applied, decimal=7)
+
     def test_copy(self):
         """
         Tests :class:`colour.io.luts.lut.LUT1D.copy`,
@@ -690,7 +825,8 @@ class TestLUTSequence(unittest.TestCase):
 
         required_methods = ('__getitem__', '__setitem__', '__delitem__',
                             '__len__', '__str__', '__repr__', '__eq__',
-                            '__ne__', 'insert', 'apply', 'copy')
+                            '__ne__', 'insert', 'apply', 'compile', 'bake',
+                            'copy')
 
         for method in required_methods:
             self.assertIn(method, dir(LUTSequence))
@@ -1067,6 +1203,75 @@ class TestLUTSequence(unittest.TestCase):
                 [0.75000000, 0.75000000, 0.75000000],
             ]))
 
+    def test_compile(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.compile` method.
+        """
+
+        domain = np.array([0, 1.5])
+        LUT_sequence = LUTSequence(
+            self._LUT_1,
+            LUT1D(LUT1D.linear_table(16, domain) ** (1 / 2.2), domain=domain),
+            self._LUT_2, self._LUT_3,
+            LUT2D(LUT2D.linear_table(16) ** 2.2 * (1.0, 0.75, 0.5)))
+        compiled_LUT_sequence = LUT_sequence.compile()
+
+        self.assertEqual([LUT.__class__ for LUT in compiled_LUT_sequence],
+                         [LUT1D, LUT3D, LUT2D])
+        self.assertEqual(compiled_LUT_sequence[1], self._LUT_2)
+        self.assertIsNot(compiled_LUT_sequence[1], self._LUT_2)
+
+        np.testing.assert_allclose(
+            compiled_LUT_sequence.apply(self._RGB),
+            LUT_sequence.apply(self._RGB),
+            atol=0.005)
+
+        compiled_LUT_sequence = LUT_sequence.compile(size=4096)
+        self.assertEqual(compiled_LUT_sequence[0].size, 4096)
+
+        np.testing.assert_allclose(
+            compiled_LUT_sequence.apply(self._RGB),
+            LUT_sequence.apply(self._RGB),
+            atol=0.005)
+
+        self.assertEqual(self._LUT_sequence.compile(), self._LUT_sequence)
+
+    def test_bake(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.bake` method.
+        """
+
+        RGB = np.reshape(
+            list(
+                random_triplet_generator(
+                    64, random_state=np.random.RandomState(4))), (8, 8, 3))
+
+        baked_LUT_sequence = self._LUT_sequence.bake()
+
+        self.assertEqual([LUT.__class__ for LUT in baked_LUT_sequence],
+                         [LUT1D, LUT3D])
+        self.assertEqual(baked_LUT_sequence[0], self._LUT_1)
+        np.testing.assert_almost_equal(
+            baked_LUT_sequence[1].domain,
+            np.array([[0.125, 0.125, 0.125], [1.125, 1.125, 1.125]]))
+
+        np.testing.assert_allclose(
+            baked_LUT_sequence.apply(RGB),
+            self._LUT_sequence.apply(RGB),
+            atol=0.005)
+
+        baked_LUT_sequence = self._LUT_sequence.bake(size=17, shaper=False)
+
+        self.assertEqual([LUT.__class__ for LUT in baked_LUT_sequence],
+                         [LUT3D])
+        self.assertEqual(baked_LUT_sequence[0].size, 17)
+        np.testing.assert_allclose(
+            baked_LUT_sequence.apply(RGB),
+            self._LUT_sequence.apply(RGB),
+            atol=0.005)
+
+        self.assertEqual(len(LUTSequence().bake()), 0)
+
 
 class TestLUT_to_LUT(unittest.TestCase):
     """
@@ -1532,6 +1737,33 @@ class TestLUT_to_LUT(unittest.TestCase):
 
         self.assertEqual(LUT, self._LUT_3)
 
+    def test_LUT_to_LUT_separable(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT_to_LUT` definition with channel
+        independent and channel dependent :class:`colour.io.luts.lut.LUT3D`
+        class instances.
+        """
+
+        # Upcast tables are built from the curves sampled on the diagonal.
+        LUT = LUT_to_LUT(self._LUT_2, LUT3D, force_conversion=True, size=9)
+        np.testing.assert_array_equal(
+            LUT.table,
+            self._LUT_2.apply(LUT3D.linear_table(9, self._domain)))
+
+        # Channel independent "LUT" 3D, the curves are extracted exactly.
+        LUT = LUT_to_LUT(self._LUT_3, LUT2D, force_conversion=True, size=16)
+        np.testing.assert_almost_equal(
+            LUT.table, LUT2D.linear_table(16) ** (1 / 2.2), decimal=15)
+
+        # Channel dependent "LUT" 3D, the diagonal is interpolated.
+        M = np.array([[0.90, 0.07, 0.03], [0.05, 0.92, 0.03],
+                      [0.02, 0.08, 0.90]])
+        LUT_3 = LUT3D(np.einsum('...ij,...j->...i', M, self._LUT_3.table))
+
+        LUT = LUT_to_LUT(LUT_3, LUT2D, force_conversion=True, size=24)
+        np.testing.assert_almost_equal(
+            LUT.table, LUT_3.apply(LUT2D.linear_table(24)), decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
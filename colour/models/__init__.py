@@ -25,7 +25,7 @@ from .hunter_rdab import XYZ_to_Hunter_Rdab, Hunter_Rdab_to_XYZ
 from .ipt import XYZ_to_IPT, IPT_to_XYZ, IPT_hue_angle
 from .jzazbz import XYZ_to_JzAzBz, JzAzBz_to_XYZ
 from .hdr_ipt import HDR_IPT_METHODS, XYZ_to_hdr_IPT, hdr_IPT_to_XYZ
-from .osa_ucs import XYZ_to_OSA_UCS, OSA_UCS_to_XYZ
+from .osa_ucs import OSA_UCS_NEWTON_SETTINGS, XYZ_to_OSA_UCS, OSA_UCS_to_XYZ
 from .common import (COLOURSPACE_MODELS, COLOURSPACE_MODELS_LABELS,
                      XYZ_to_colourspace_model)
 from .dataset import *  # noqa
@@ -65,7 +65,7 @@ __all__ += ['XYZ_to_Hunter_Rdab', 'Hunter_Rdab_to_XYZ']
 __all__ += ['XYZ_to_IPT', 'IPT_to_XYZ', 'IPT_hue_angle']
 __all__ += ['XYZ_to_JzAzBz', 'JzAzBz_to_XYZ']
 __all__ += ['HDR_IPT_METHODS', 'XYZ_to_hdr_IPT', 'hdr_IPT_to_XYZ']
-__all__ += ['XYZ_to_OSA_UCS', 'OSA_UCS_to_XYZ']
+__all__ += ['OSA_UCS_NEWTON_SETTINGS', 'XYZ_to_OSA_UCS', 'OSA_UCS_to_XYZ']
 __all__ += [
     'COLOURSPACE_MODELS', 'COLOURSPACE_MODELS_LABELS',
     'XYZ_to_colourspace_model'
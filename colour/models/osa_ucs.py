@@ -7,6 +7,7 @@ Defines the *OSA UCS* colourspace:
 
 -   :func:`colour.XYZ_to_OSA_UCS`
 -   :func:`colour.OSA_UCS_to_XYZ`
+-   :attr:`colour.models.OSA_UCS_NEWTON_SETTINGS`
 
 See Also
 --------
@@ -32,9 +33,10 @@ import numpy as np
 from scipy.optimize import fmin
 
 from colour.algebra import spow
+from colour.constants import EPSILON
 from colour.models import XYZ_to_xyY
-from colour.utilities import (domain_range_scale, dot_vector, from_range_100,
-                              to_domain_100, tsplit, tstack)
+from colour.utilities import (as_float_array, domain_range_scale, dot_vector,
+                              from_range_100, to_domain_100, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -43,7 +45,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XYZ_to_OSA_UCS', 'OSA_UCS_to_XYZ']
+__all__ = ['OSA_UCS_NEWTON_SETTINGS', 'XYZ_to_OSA_UCS', 'OSA_UCS_to_XYZ']
 
 M_XYZ_TO_RGB_OSA_UCS = np.array([
     [0.799, 0.4194, -0.1648],
@@ -57,6 +59,24 @@ colourspace.
 M_XYZ_TO_RGB_OSA_UCS : array_like, (3, 3)
 """
 
+OSA_UCS_NEWTON_SETTINGS = {
+    'iterations_maximum': 50,
+    'tolerance': 1e-12,
+    'error_maximum': 1e-7,
+}
+"""
+Settings of the vectorised *Newton* solver used by
+:func:`colour.OSA_UCS_to_XYZ` definition: the maximum iterations count, the
+relative tolerance of the solved equations and the maximum relative
+*OSA UCS* :math:`Ljg` error above which a sample is solved with
+:func:`scipy.optimize.fmin` definition instead.
+
+OSA_UCS_NEWTON_SETTINGS : dict
+    **{'iterations_maximum', 'tolerance', 'error_maximum'}**
+"""
+
+_OSA_UCS_JG_WEIGHTS = np.array([[1.7, 8, -9.7], [-13.7, 17.7, -4]])
+
 
 def XYZ_to_OSA_UCS(XYZ):
     """
@@ -128,14 +148,105 @@ def XYZ_to_OSA_UCS(XYZ):
 
     C = Lambda / (5.9 * Y_0_es)
     L = (Lambda - 14.4) / spow(2, 1 / 2)
-    j = C * np.dot(RGB_3, np.array([1.7, 8, -9.7]))
-    g = C * np.dot(RGB_3, np.array([-13.7, 17.7, -4]))
+    j, g = tsplit(C[..., np.newaxis] * dot_vector(_OSA_UCS_JG_WEIGHTS, RGB_3))
 
     Ljg = tstack([L, j, g])
 
     return from_range_100(Ljg)
 
 
+def _Y_0_OSA_UCS(XYZ):
+    """
+    Returns the *OSA UCS* :math:`Y_0` luminous reflectance factor and its
+    partial derivatives with respect to given *CIE XYZ* tristimulus values.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    tuple
+        :math:`Y_0` luminous reflectance factor and its partial derivatives.
+    """
+
+    X, Y, Z = tsplit(XYZ)
+    S = X + Y + Z
+    x, y = X / S, Y / S
+
+    K = (4.4934 * x ** 2 + 4.3034 * y ** 2 - 4.276 * x * y - 1.3744 * x -
+         2.5643 * y + 1.8103)
+    K_x = 2 * 4.4934 * x - 4.276 * y - 1.3744
+    K_y = 2 * 4.3034 * y - 4.276 * x - 2.5643
+
+    d_x = tstack([1 - x, -x, -x]) / S[..., np.newaxis]
+    d_y = tstack([-y, 1 - y, -y]) / S[..., np.newaxis]
+
+    d_Y_0 = Y[..., np.newaxis] * (
+        K_x[..., np.newaxis] * d_x + K_y[..., np.newaxis] * d_y)
+    d_Y_0[..., 1] += K
+
+    return Y * K, d_Y_0
+
+
+def _L_to_Y_0_OSA_UCS(L):
+    """
+    Returns the *OSA UCS* :math:`Y_0` luminous reflectance factor of given
+    lightness :math:`L`.
+
+    :math:`\\Lambda / 5.9 + 2 / 3` is monotonically increasing with
+    :math:`w = Y_0^{1/3}` and bounded by :math:`1.042 w` and
+    :math:`1.042 (w^3 - 30)^{1/3}`, which gives the bracket of a safeguarded
+    *Newton* method falling back to bisection when the *Newton* step leaves
+    the bracket or does not converge fast enough.
+
+    Parameters
+    ----------
+    L : array_like
+        *OSA UCS* lightness :math:`L`.
+
+    Returns
+    -------
+    ndarray
+        :math:`Y_0` luminous reflectance factor.
+    """
+
+    Lambda_n = np.atleast_1d((spow(2, 1 / 2) * L + 14.4) / 5.9 + 2 / 3)
+
+    w_l = Lambda_n / 1.042
+    w_h = np.atleast_1d(spow(w_l ** 3 + 30, 1 / 3))
+    w = (w_l + w_h) / 2
+    step = w_h - w_l
+
+    active = np.isfinite(w)
+    for _i in range(128):
+        indexes = np.where(active)[0]
+        if not indexes.size:
+            break
+
+        w_a, w_l_a, w_h_a = w[indexes], w_l[indexes], w_h[indexes]
+
+        w_s = spow(w_a ** 3 - 30, 1 / 3)
+        h = w_a + 0.042 * w_s - Lambda_n[indexes]
+        d_h = 1 + 0.042 * w_a ** 2 / w_s ** 2
+
+        w_l_a = np.where(h < 0, w_a, w_l_a)
+        w_h_a = np.where(h < 0, w_h_a, w_a)
+
+        w_n = w_a - h / d_h
+        bisection = ~np.logical_and(
+            np.logical_and(w_n >= w_l_a, w_n <= w_h_a),
+            np.abs(2 * h) <= np.abs(step[indexes] * d_h))
+        w_n = np.where(bisection, (w_l_a + w_h_a) / 2, w_n)
+
+        step[indexes] = np.abs(w_n - w_a)
+        w[indexes], w_l[indexes], w_h[indexes] = w_n, w_l_a, w_h_a
+        active[indexes] = step[indexes] > EPSILON * np.abs(w_n)
+
+    return w ** 3
+
+
 def OSA_UCS_to_XYZ(Ljg, optimisation_parameters=None):
     """
     Converts from *OSA UCS* colourspace to *CIE XYZ* tristimulus values under
@@ -146,7 +257,8 @@ def OSA_UCS_to_XYZ(Ljg, optimisation_parameters=None):
     Ljg : array_like
         *OSA UCS* :math:`Ljg` lightness, jaune (yellowness), and greenness.
     optimisation_parameters : dict_like, optional
-        Parameters for :func:`scipy.optimize.fmin` definition.
+        Parameters for :func:`scipy.optimize.fmin` definition, used for the
+        samples the *Newton* solver does not converge for.
 
     Returns
     -------
@@ -158,9 +270,9 @@ def OSA_UCS_to_XYZ(Ljg, optimisation_parameters=None):
     --------
     There is no analytical reverse transformation from *OSA UCS* to :math:`Ljg`
     lightness, jaune (yellowness), and greenness to *CIE XYZ* tristimulus
-    values, the current implementation relies on optimization using
-    :func:`scipy.optimize.fmin` definition and thus has reduced precision and
-    poor performance.
+    values, the current implementation relies on a vectorised *Newton* solver
+    and on optimization using :func:`scipy.optimize.fmin` definition for the
+    samples it does not converge for.
 
     Notes
     -----
@@ -182,6 +294,14 @@ def OSA_UCS_to_XYZ(Ljg, optimisation_parameters=None):
     +------------+-----------------------+--------------------+
 
     -   *OSA UCS* uses the *CIE 1964 10 Degree Standard Observer*.
+    -   The lightness :math:`L` only depends on the :math:`Y_0` luminous
+        reflectance factor which is found with a safeguarded *Newton* method,
+        the jaune (yellowness) :math:`j` and greenness :math:`g` are then
+        linear in the cube root of the *OSA UCS* *RGB* values. The resulting
+        equations are solved for all the samples simultaneously with a damped
+        *Newton* method using their analytical *Jacobian* matrix, the samples
+        being removed from the iterations as soon as they converge, see
+        :attr:`colour.models.OSA_UCS_NEWTON_SETTINGS` attribute.
 
     References
     ----------
@@ -192,32 +312,128 @@ def OSA_UCS_to_XYZ(Ljg, optimisation_parameters=None):
     >>> import numpy as np
     >>> Ljg = np.array([-3.00499790, 2.99713697, -9.66784231])
     >>> OSA_UCS_to_XYZ(Ljg)  # doctest: +ELLIPSIS
-    array([ 20.6540240...,  12.1972369...,   5.1369372...])
+    array([ 20.654008...,  12.197225...,   5.1369520...])
     """
 
     Ljg = to_domain_100(Ljg)
     shape = Ljg.shape
-    Ljg = np.atleast_1d(Ljg.reshape([-1, 3]))
-
-    optimisation_settings = {'disp': False}
-    if optimisation_parameters is not None:
-        optimisation_settings.update(optimisation_parameters)
-
-    def function_error(XYZ, Ljg):
-        """
-        Error function.
-        """
+    Ljg = np.atleast_1d(as_float_array(Ljg).reshape([-1, 3]))
+    L, j, g = tsplit(Ljg)
+
+    settings = OSA_UCS_NEWTON_SETTINGS
+    M_RGB_OSA_UCS_TO_XYZ = np.linalg.inv(M_XYZ_TO_RGB_OSA_UCS)
+
+    with np.errstate(all='ignore'):
+        Y_0 = _L_to_Y_0_OSA_UCS(L)
+        C = 1 + 0.042 * spow(Y_0 - 30, 1 / 3) / (spow(Y_0, 1 / 3) - 2 / 3)
+
+        # The unknowns are the cube roots of the *OSA UCS* *RGB* values, the
+        # initial guess is the achromatic colour with the expected "Y_0"
+        # projected onto the "j" and "g" equations.
+        jg = tstack([j, g]) / C[..., np.newaxis]
+        RGB_3 = spow(
+            dot_vector(M_XYZ_TO_RGB_OSA_UCS, tstack([Y_0, Y_0, Y_0])), 1 / 3)
+        RGB_3 += dot_vector(
+            np.linalg.pinv(_OSA_UCS_JG_WEIGHTS),
+            jg - dot_vector(_OSA_UCS_JG_WEIGHTS, RGB_3))
+
+        def equations(RGB_3, Y_0, jg):
+            """
+            Returns the equations residual and its *Jacobian* matrix.
+            """
+
+            XYZ = dot_vector(M_RGB_OSA_UCS_TO_XYZ, RGB_3 ** 3)
+            Y_0_e, d_Y_0 = _Y_0_OSA_UCS(XYZ)
+
+            error = np.hstack([(Y_0_e - Y_0)[..., np.newaxis],
+                               dot_vector(_OSA_UCS_JG_WEIGHTS, RGB_3) - jg])
+
+            J = np.empty(RGB_3.shape + (3, ))
+            J[..., 0, :] = np.dot(d_Y_0, M_RGB_OSA_UCS_TO_XYZ) * 3 * RGB_3 ** 2
+            J[..., 1:, :] = _OSA_UCS_JG_WEIGHTS
+
+            return error, J
+
+        error, J = equations(RGB_3, Y_0, jg)
+        norm = np.sum(error ** 2, axis=-1)
+        scale = np.maximum(np.max(np.abs(tstack([Y_0, j, g])), axis=-1), 1)
+        active = np.isfinite(norm)
+        for _i in range(settings['iterations_maximum']):
+            active &= (np.max(np.abs(error), axis=-1) >
+                       settings['tolerance'] * scale)
+            if not np.any(active):
+                break
+
+            indexes = np.where(active)[0]
+            RGB_3_a, Y_0_a, jg_a = RGB_3[indexes], Y_0[indexes], jg[indexes]
+            error_a, norm_a = error[indexes], norm[indexes]
+
+            # Solving the 3x3 linear systems with Cramer's rule.
+            r_0, r_1, r_2 = J[indexes, 0], J[indexes, 1], J[indexes, 2]
+            c_0, c_1, c_2 = (np.cross(r_1, r_2), np.cross(r_2, r_0),
+                             np.cross(r_0, r_1))
+            determinant = np.sum(r_0 * c_0, axis=-1)[..., np.newaxis]
+            step = (error_a[..., 0:1] * c_0 + error_a[..., 1:2] * c_1 +
+                    error_a[..., 2:3] * c_2) / determinant
+
+            # The step is halved for the samples whose residual does not
+            # decrease, those still not decreasing are stalled.
+            damping = np.ones([indexes.size, 1])
+            increasing = np.ones(indexes.size, np.bool_)
+            RGB_3_n = np.copy(RGB_3_a)
+            error_n, J_n = np.copy(error_a), J[indexes]
+            norm_n = np.copy(norm_a)
+            for _j in range(32):
+                RGB_3_n[increasing] = (RGB_3_a[increasing] -
+                                       damping[increasing] * step[increasing])
+                error_n[increasing], J_n[increasing] = equations(
+                    RGB_3_n[increasing], Y_0_a[increasing], jg_a[increasing])
+                norm_n[increasing] = np.sum(error_n[increasing] ** 2, axis=-1)
+
+                increasing = ~(norm_n < norm_a)
+                if not np.any(increasing):
+                    break
+
+                damping[increasing] /= 2
+
+            decreasing = ~increasing
+            RGB_3[indexes[decreasing]] = RGB_3_n[decreasing]
+            error[indexes[decreasing]] = error_n[decreasing]
+            J[indexes[decreasing]] = J_n[decreasing]
+            norm[indexes[decreasing]] = norm_n[decreasing]
+            active[indexes[increasing]] = False
+
+        XYZ = dot_vector(M_RGB_OSA_UCS_TO_XYZ, RGB_3 ** 3)
 
         # Error must be computed in "reference" domain and range.
         with domain_range_scale('ignore'):
-            error = np.linalg.norm(XYZ_to_OSA_UCS(XYZ) - Ljg)
-
-        return error
-
-    x_0 = np.array([30, 30, 30])
-    XYZ = np.array([
-        fmin(function_error, x_0, (Ljg_i, ), **optimisation_settings)
-        for Ljg_i in Ljg
-    ])
+            error = (np.max(np.abs(XYZ_to_OSA_UCS(XYZ) - Ljg), axis=-1) /
+                     np.maximum(np.max(np.abs(Ljg), axis=-1), 1))
+
+    unconverged = np.where(
+        np.logical_and(
+            np.all(np.isfinite(Ljg), axis=-1),
+            ~(error <= settings['error_maximum'])))[0]
+    if unconverged.size:
+        optimisation_settings = {'disp': False}
+        if optimisation_parameters is not None:
+            optimisation_settings.update(optimisation_parameters)
+
+        def function_error(XYZ, Ljg):
+            """
+            Error function.
+            """
+
+            # Error must be computed in "reference" domain and range.
+            with domain_range_scale('ignore'):
+                error = np.linalg.norm(XYZ_to_OSA_UCS(XYZ) - Ljg)
+
+            return error
+
+        x_0 = np.array([30, 30, 30])
+        XYZ[unconverged] = np.array([
+            fmin(function_error, x_0, (Ljg[i], ), **optimisation_settings)
+            for i in unconverged
+        ])
 
     return from_range_100(XYZ.reshape(shape))
@@ -7,7 +7,7 @@ from .derivation import (normalised_primary_matrix,
                          RGB_luminance_equation, RGB_luminance)
 from .rgb_colourspace import RGB_Colourspace
 from .rgb_colourspace import XYZ_to_RGB, RGB_to_XYZ
-from .rgb_colourspace import RGB_to_RGB_matrix, RGB_to_RGB
+from .rgb_colourspace import RGB_to_RGB_matrix, RGB_to_RGB, RGB_Transform
 from .transfer_functions import *  # noqa
 from . import transfer_functions
 from .dataset import *  # noqa
@@ -28,7 +28,7 @@ __all__ = [
 ]
 __all__ += ['RGB_Colourspace']
 __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
-__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB']
+__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB', 'RGB_Transform']
 __all__ += transfer_functions.__all__
 __all__ += dataset.__all__
 __all__ += ['XYZ_to_sRGB', 'sRGB_to_XYZ']
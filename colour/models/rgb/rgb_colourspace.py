@@ -11,6 +11,7 @@ dataset from :mod:`colour.models.dataset.aces_rgb`, etc... and the following
 -   :func:`colour.RGB_to_XYZ`
 -   :func:`colour.RGB_to_RGB_matrix`
 -   :func:`colour.RGB_to_RGB`
+-   :class:`colour.RGB_Transform`
 
 See Also
 --------
@@ -52,7 +53,7 @@ __status__ = 'Production'
 
 __all__ = [
     'RGB_Colourspace', 'XYZ_to_RGB', 'RGB_to_XYZ', 'RGB_to_RGB_matrix',
-    'RGB_to_RGB'
+    'RGB_to_RGB', 'RGB_Transform'
 ]
 
 
@@ -1180,8 +1181,9 @@ def RGB_to_RGB(RGB,
         with domain_range_scale('ignore'):
             RGB = input_colourspace.decoding_cctf(RGB)
 
-    M = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
-                          chromatic_adaptation_transform)
+    M = as_float_array(
+        RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                          chromatic_adaptation_transform))
 
     RGB = dot_vector(M, RGB)
 
@@ -1190,3 +1192,280 @@ def RGB_to_RGB(RGB,
             RGB = output_colourspace.encoding_cctf(RGB)
 
     return from_range_1(RGB)
+
+
+class RGB_Transform(object):
+    """
+    Implements a reusable conversion from given input *RGB* colourspace to
+    output *RGB* colourspace using given *chromatic adaptation* method.
+
+    The conversion matrix and the decoding and encoding colour component
+    transfer functions are resolved once upon instantiation, converting an
+    *RGB* colourspace array only performs the matrix product and the transfer
+    functions evaluation within a single domain-range scale context.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace
+        *RGB* input colourspace.
+    output_colourspace : RGB_Colourspace
+        *RGB* output colourspace.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC', None}**,
+        *Chromatic adaptation* transform, if *None* no chromatic adaptation is
+        performed.
+    apply_decoding_cctf : bool, optional
+        Apply input colourspace decoding colour component transfer function /
+        electro-optical transfer function.
+    apply_encoding_cctf : bool, optional
+        Apply output colourspace encoding colour component transfer function /
+        opto-electronic transfer function.
+
+    Attributes
+    ----------
+    input_colourspace
+    output_colourspace
+    chromatic_adaptation_transform
+    matrix
+    decoding_cctf
+    encoding_cctf
+
+    Methods
+    -------
+    __hash__
+    __eq__
+    __ne__
+    __call__
+
+    Notes
+    -----
+    -   The transform is a snapshot of the colourspaces at instantiation time:
+        subsequent changes to the colourspaces, e.g. calling their
+        :meth:`colour.RGB_Colourspace.use_derived_transformation_matrices`
+        method, are not reflected.
+    -   Two transforms with the same conversion matrix and transfer functions
+        compare equal and have the same hash, they can be used as dictionary
+        keys.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE
+    >>> RGB = np.array([0.45595571, 0.03039702, 0.04087245])
+    >>> transform = RGB_Transform(sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE)
+    >>> transform(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2568891...,  0.0721446...,  0.0465553...])
+    """
+
+    def __init__(self,
+                 input_colourspace,
+                 output_colourspace,
+                 chromatic_adaptation_transform='CAT02',
+                 apply_decoding_cctf=False,
+                 apply_encoding_cctf=False):
+        self._input_colourspace = input_colourspace
+        self._output_colourspace = output_colourspace
+        self._chromatic_adaptation_transform = chromatic_adaptation_transform
+
+        self._matrix = np.array(
+            RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                              chromatic_adaptation_transform),
+            dtype=np.float64)
+        self._matrix.setflags(write=False)
+
+        self._decoding_cctf = (input_colourspace.decoding_cctf
+                               if apply_decoding_cctf else None)
+        self._encoding_cctf = (output_colourspace.encoding_cctf
+                               if apply_encoding_cctf else None)
+
+        self._key = (self._matrix.tobytes(), self._decoding_cctf,
+                     self._encoding_cctf)
+
+    @property
+    def input_colourspace(self):
+        """
+        Getter property for the *RGB* input colourspace.
+
+        Returns
+        -------
+        RGB_Colourspace
+            *RGB* input colourspace.
+        """
+
+        return self._input_colourspace
+
+    @property
+    def output_colourspace(self):
+        """
+        Getter property for the *RGB* output colourspace.
+
+        Returns
+        -------
+        RGB_Colourspace
+            *RGB* output colourspace.
+        """
+
+        return self._output_colourspace
+
+    @property
+    def chromatic_adaptation_transform(self):
+        """
+        Getter property for the *chromatic adaptation* transform.
+
+        Returns
+        -------
+        unicode
+            *Chromatic adaptation* transform.
+        """
+
+        return self._chromatic_adaptation_transform
+
+    @property
+    def matrix(self):
+        """
+        Getter property for the read-only conversion matrix :math:`M`.
+
+        Returns
+        -------
+        ndarray
+            Conversion matrix :math:`M`.
+        """
+
+        return self._matrix
+
+    @property
+    def decoding_cctf(self):
+        """
+        Getter property for the input colourspace decoding colour component
+        transfer function applied by the transform.
+
+        Returns
+        -------
+        object
+            Decoding colour component transfer function or *None*.
+        """
+
+        return self._decoding_cctf
+
+    @property
+    def encoding_cctf(self):
+        """
+        Getter property for the output colourspace encoding colour component
+        transfer function applied by the transform.
+
+        Returns
+        -------
+        object
+            Encoding colour component transfer function or *None*.
+        """
+
+        return self._encoding_cctf
+
+    def __hash__(self):
+        """
+        Returns the transform hash.
+
+        Returns
+        -------
+        int
+            Object hash.
+        """
+
+        return hash(self._key)
+
+    def __eq__(self, other):
+        """
+        Returns whether the transform is equal to given other object.
+
+        Parameters
+        ----------
+        other : object
+            Object to test whether it is equal to the transform.
+
+        Returns
+        -------
+        bool
+            Is given object equal to the transform.
+        """
+
+        if isinstance(other, RGB_Transform):
+            return self._key == other._key
+
+        return False
+
+    def __ne__(self, other):
+        """
+        Returns whether the transform is not equal to given other object.
+
+        Parameters
+        ----------
+        other : object
+            Object to test whether it is not equal to the transform.
+
+        Returns
+        -------
+        bool
+            Is given object not equal to the transform.
+        """
+
+        return not (self == other)
+
+    def __call__(self, RGB, out=None):
+        """
+        Converts given *RGB* colourspace array from the input *RGB*
+        colourspace to the output *RGB* colourspace.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array.
+        out : ndarray, optional
+            Floating point array with the same shape than the *RGB*
+            colourspace array the converted values are written to, it can be
+            the *RGB* colourspace array itself for in-place processing.
+
+        Returns
+        -------
+        ndarray
+            *RGB* colourspace array.
+
+        Notes
+        -----
+
+        +------------+-----------------------+---------------+
+        | **Domain** | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``RGB``    | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+
+        +------------+-----------------------+---------------+
+        | **Range**  | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``RGB``    | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+        """
+
+        RGB = to_domain_1(RGB)
+
+        with domain_range_scale('ignore'):
+            if self._decoding_cctf is not None:
+                RGB = self._decoding_cctf(RGB)
+
+            M = self._matrix.astype(RGB.dtype, copy=False)
+            if out is None or np.may_share_memory(RGB, out):
+                RGB = dot_vector(M, RGB)
+            else:
+                RGB = np.einsum(
+                    '...ij,...j->...i', M, RGB, out=out, casting='same_kind')
+
+            if self._encoding_cctf is not None:
+                RGB = self._encoding_cctf(RGB)
+
+        RGB = from_range_1(RGB)
+
+        if out is not None and RGB is not out:
+            out[...] = RGB
+            RGB = out
+
+        return RGB
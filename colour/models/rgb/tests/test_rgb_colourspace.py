@@ -14,11 +14,13 @@ import unittest
 from copy import deepcopy
 from itertools import permutations
 
-from colour.models import (
-    RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB, RGB_to_XYZ,
-    RGB_to_RGB_matrix, RGB_to_RGB, chromatically_adapted_primaries,
-    normalised_primary_matrix, oetf_sRGB, oetf_reverse_sRGB)
-from colour.utilities import domain_range_scale, ignore_numpy_errors
+from colour.models import (RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB,
+                           RGB_to_XYZ, RGB_to_RGB_matrix, RGB_to_RGB,
+                           RGB_Transform, chromatically_adapted_primaries,
+                           normalised_primary_matrix, oetf_sRGB,
+                           oetf_reverse_sRGB)
+from colour.utilities import (default_float_dtype, domain_range_scale,
+                              ignore_numpy_errors)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -29,7 +31,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_COLOURSPACES', 'TestRGB_Colourspace', 'TestXYZ_to_RGB',
-    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB'
+    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB',
+    'TestRGB_Transform'
 ]
 
 
@@ -779,6 +782,28 @@ class TestRGB_to_RGB(unittest.TestCase):
             np.array([0.60983062, 0.67896356, 0.50435764]),
             decimal=7)
 
+    def test_float32_RGB_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB` definition
+        single precision processing.
+        """
+
+        aces_cc_colourspace = RGB_COLOURSPACES['ACEScc']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+        RGB_i = np.array([0.46956438, 0.48137533, 0.43788601])
+        RGB_o = np.array([0.60983062, 0.67896356, 0.50435764])
+
+        with default_float_dtype(np.float32):
+            RGB = RGB_to_RGB(
+                RGB_i.astype(np.float32),
+                aces_cc_colourspace,
+                sRGB_colourspace,
+                apply_decoding_cctf=True,
+                apply_encoding_cctf=True)
+
+        self.assertEqual(RGB.dtype, np.float32)
+        np.testing.assert_allclose(RGB, RGB_o, atol=1e-6)
+
     def test_n_dimensional_RGB_to_RGB(self):
         """
         Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB` definition
@@ -845,5 +870,132 @@ class TestRGB_to_RGB(unittest.TestCase):
             RGB_to_RGB(RGB, aces_2065_1_colourspace, sRGB_colourspace)
 
 
+class TestRGB_Transform(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.rgb_colourspace.RGB_Transform` class
+    unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('input_colourspace', 'output_colourspace',
+                               'chromatic_adaptation_transform', 'matrix',
+                               'decoding_cctf', 'encoding_cctf')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RGB_Transform))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__hash__', '__eq__', '__ne__',
+                            '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(RGB_Transform))
+
+    def test__hash__(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_Transform.__hash__`
+        and :func:`colour.models.rgb.rgb_colourspace.RGB_Transform.__eq__`
+        methods.
+        """
+
+        aces_cc_colourspace = RGB_COLOURSPACES['ACEScc']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        transform = RGB_Transform(aces_cc_colourspace, sRGB_colourspace)
+        self.assertEqual(transform,
+                         RGB_Transform(aces_cc_colourspace, sRGB_colourspace))
+        self.assertEqual(
+            hash(transform),
+            hash(RGB_Transform(aces_cc_colourspace, sRGB_colourspace)))
+        self.assertNotEqual(
+            transform,
+            RGB_Transform(
+                aces_cc_colourspace,
+                sRGB_colourspace,
+                apply_decoding_cctf=True))
+        self.assertNotEqual(
+            transform,
+            RGB_Transform(aces_cc_colourspace, sRGB_colourspace, 'Bradford'))
+        self.assertEqual(
+            len({
+                transform,
+                RGB_Transform(aces_cc_colourspace, sRGB_colourspace),
+                RGB_Transform(sRGB_colourspace, aces_cc_colourspace)
+            }), 2)
+
+        self.assertFalse(transform.matrix.flags.writeable)
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_Transform.__call__`
+        method.
+        """
+
+        aces_cg_colourspace = RGB_COLOURSPACES['ACEScg']
+        aces_cc_colourspace = RGB_COLOURSPACES['ACEScc']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        RGB_i = np.array([0.46956438, 0.48137533, 0.43788601])
+        colourspaces = (aces_cg_colourspace, aces_cc_colourspace,
+                        sRGB_colourspace)
+        cctfs = set(permutations((True, False, True, False), 2))
+        for input_colourspace, output_colourspace in permutations(
+                colourspaces, 2):
+            for chromatic_adaptation_transform in ('CAT02', 'Bradford', None):
+                for apply_decoding_cctf, apply_encoding_cctf in cctfs:
+                    transform = RGB_Transform(
+                        input_colourspace, output_colourspace,
+                        chromatic_adaptation_transform, apply_decoding_cctf,
+                        apply_encoding_cctf)
+
+                    np.testing.assert_almost_equal(
+                        transform(RGB_i),
+                        RGB_to_RGB(RGB_i, input_colourspace,
+                                   output_colourspace,
+                                   chromatic_adaptation_transform,
+                                   apply_decoding_cctf, apply_encoding_cctf),
+                        decimal=12)
+
+        transform = RGB_Transform(aces_cc_colourspace, sRGB_colourspace,
+                                  'CAT02', True, True)
+        RGB_i = np.tile(RGB_i, (6, 1))
+        RGB_o = RGB_to_RGB(RGB_i, aces_cc_colourspace, sRGB_colourspace,
+                           'CAT02', True, True)
+
+        out = np.zeros(RGB_i.shape)
+        self.assertIs(transform(RGB_i, out=out), out)
+        np.testing.assert_almost_equal(out, RGB_o, decimal=12)
+
+        RGB_t = np.copy(RGB_i)
+        self.assertIs(transform(RGB_t, out=RGB_t), RGB_t)
+        np.testing.assert_almost_equal(RGB_t, RGB_o, decimal=12)
+
+        transform = RGB_Transform(aces_cg_colourspace, sRGB_colourspace)
+        RGB_o = RGB_to_RGB(RGB_i, aces_cg_colourspace, sRGB_colourspace)
+        RGB_t = np.copy(RGB_i)
+        self.assertIs(transform(RGB_t, out=RGB_t), RGB_t)
+        np.testing.assert_almost_equal(RGB_t, RGB_o, decimal=12)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    transform(RGB_i * factor), RGB_o * factor, decimal=7)
+
+        with default_float_dtype(np.float32):
+            RGB = transform(RGB_i.astype(np.float32))
+
+        self.assertEqual(RGB.dtype, np.float32)
+        np.testing.assert_allclose(RGB, RGB_o, atol=1e-6)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,11 +2,15 @@
 
 from __future__ import absolute_import
 
+import numpy as np
 from functools import partial
 
 from colour.utilities import CaseInsensitiveMapping, filter_kwargs, warning
 
-from .common import CV_range, legal_to_full, full_to_legal
+from .common import (CV_range, legal_to_full, full_to_legal, CV_TABLES_CACHE,
+                     CV_table, TransferFunctionApproximation,
+                     TRANSFER_FUNCTION_APPROXIMATIONS_CACHE,
+                     transfer_function_approximation)
 from .aces import (log_encoding_ACESproxy, log_decoding_ACESproxy,
                    log_encoding_ACEScc, log_decoding_ACEScc,
                    log_encoding_ACEScct, log_decoding_ACEScct)
@@ -49,7 +53,11 @@ from .sony_slog import (log_encoding_SLog, log_decoding_SLog,
 from .srgb import oetf_sRGB, oetf_reverse_sRGB
 from .viper_log import log_encoding_ViperLog, log_decoding_ViperLog
 
-__all__ = ['CV_range', 'legal_to_full', 'full_to_legal']
+__all__ = [
+    'CV_range', 'legal_to_full', 'full_to_legal', 'CV_TABLES_CACHE',
+    'CV_table', 'TransferFunctionApproximation',
+    'TRANSFER_FUNCTION_APPROXIMATIONS_CACHE', 'transfer_function_approximation'
+]
 __all__ += [
     'log_encoding_ACESproxy', 'log_decoding_ACESproxy', 'log_encoding_ACEScc',
     'log_decoding_ACEScc', 'log_encoding_ACEScct', 'log_decoding_ACEScct'
@@ -100,6 +108,63 @@ __all__ += [
 __all__ += ['oetf_sRGB', 'oetf_reverse_sRGB']
 __all__ += ['log_encoding_ViperLog', 'log_decoding_ViperLog']
 
+
+def _evaluate(function, value, int_bit_depth=None, approximate=False,
+              **kwargs):
+    """
+    Evaluates given transfer function at given value.
+
+    Integer code values of given bit depth are evaluated by indexing the
+    transfer function dense table returned by :func:`colour.CV_table`
+    definition. Float values are evaluated with the transfer function
+    approximation returned by
+    :func:`colour.models.transfer_function_approximation` definition if
+    ``approximate`` is *True* or a domain, or with the transfer function
+    otherwise.
+
+    Integer code values outside the bit depth range are converted to their
+    float equivalent. Unhashable keyword arguments and bit depths above 16
+    always fall back to the transfer function evaluation.
+    """
+
+    kwargs = filter_kwargs(function, **kwargs)
+
+    if approximate is True:
+        approximate = np.array([0, 1])
+    elif approximate is False:
+        approximate = None
+
+    if int_bit_depth is None and approximate is None:
+        return function(value, **kwargs)
+
+    try:
+        hash(tuple(kwargs.items()))
+    except TypeError:
+        is_hashable = False
+    else:
+        is_hashable = True
+
+    if int_bit_depth is not None:
+        CV = np.asarray(value)
+
+        if np.issubdtype(CV.dtype, np.integer):
+            MV = 2 ** int_bit_depth - 1
+
+            is_in_range = CV.size == 0 or (np.min(CV) >= 0 and
+                                           np.max(CV) <= MV)
+
+            if is_hashable and int_bit_depth <= 16 and is_in_range:
+                return CV_table(function, int_bit_depth, **kwargs)[CV]
+
+            value = CV / MV
+
+    if approximate is not None and is_hashable:
+        return transfer_function_approximation(function, approximate,
+                                               **kwargs)(value)
+
+    return function(value, **kwargs)
+
+
 LOG_ENCODING_CURVES = CaseInsensitiveMapping({
     'ACEScc': log_encoding_ACEScc,
     'ACEScct': log_encoding_ACEScct,
@@ -135,7 +200,11 @@ LOG_ENCODING_CURVES : CaseInsensitiveMapping
 """
 
 
-def log_encoding_curve(value, curve='Cineon', **kwargs):
+def log_encoding_curve(value,
+                       curve='Cineon',
+                       int_bit_depth=None,
+                       approximate=False,
+                       **kwargs):
     """
     Encodes linear-light values to :math:`R'G'B'` video component signal
     value using given *log* curve.
@@ -150,6 +219,17 @@ def log_encoding_curve(value, curve='Cineon', **kwargs):
         'Log3G10', 'Log3G12', 'Panalog', 'PLog', 'Protune', 'REDLog',
         'REDLogFilm', 'S-Log', 'S-Log2', 'S-Log3', 'V-Log', 'ViperLog'}**,
         Computation curve.
+    int_bit_depth : int, optional
+        If given, integer code values of given bit depth are evaluated by
+        indexing a cached dense table of the *log* encoding curve, see
+        :func:`colour.CV_table` definition, float values and bit depths above
+        16 are evaluated as usual.
+    approximate : bool or array_like, optional
+        If *True* or a domain, float values are evaluated with a cached
+        approximation of the *log* encoding curve with bounded error, see
+        :class:`colour.TransferFunctionApproximation` class. The approximation
+        domain is [0, 1] if *True*, or the given array_like otherwise, values
+        outside it are evaluated as usual.
 
     Other Parameters
     ----------------
@@ -229,7 +309,7 @@ def log_encoding_curve(value, curve='Cineon', **kwargs):
 
     function = LOG_ENCODING_CURVES[curve]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate(function, value, int_bit_depth, approximate, **kwargs)
 
 
 LOG_DECODING_CURVES = CaseInsensitiveMapping({
@@ -267,7 +347,11 @@ LOG_DECODING_CURVES : CaseInsensitiveMapping
 """
 
 
-def log_decoding_curve(value, curve='Cineon', **kwargs):
+def log_decoding_curve(value,
+                       curve='Cineon',
+                       int_bit_depth=None,
+                       approximate=False,
+                       **kwargs):
     """
     Decodes :math:`R'G'B'` video component signal value to linear-light values
     using given *log* curve.
@@ -282,6 +366,17 @@ def log_decoding_curve(value, curve='Cineon', **kwargs):
         'Log3G10', 'Log3G12', 'Panalog', 'PLog', 'Protune', 'REDLog',
         'REDLogFilm', 'S-Log', 'S-Log2', 'S-Log3', 'V-Log', 'ViperLog'}**,
         Computation curve.
+    int_bit_depth : int, optional
+        If given, integer code values of given bit depth are evaluated by
+        indexing a cached dense table of the *log* decoding curve, see
+        :func:`colour.CV_table` definition, float values and bit depths above
+        16 are evaluated as usual.
+    approximate : bool or array_like, optional
+        If *True* or a domain, float values are evaluated with a cached
+        approximation of the *log* decoding curve with bounded error, see
+        :class:`colour.TransferFunctionApproximation` class. The approximation
+        domain is [0, 1] if *True*, or the given array_like otherwise, values
+        outside it are evaluated as usual.
 
     Other Parameters
     ----------------
@@ -363,7 +458,7 @@ def log_decoding_curve(value, curve='Cineon', **kwargs):
 
     function = LOG_DECODING_CURVES[curve]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate(function, value, int_bit_depth, approximate, **kwargs)
 
 
 __all__ += ['LOG_ENCODING_CURVES', 'LOG_DECODING_CURVES']
@@ -395,7 +490,11 @@ OETFS : CaseInsensitiveMapping
 """
 
 
-def oetf(value, function='sRGB', **kwargs):
+def oetf(value,
+         function='sRGB',
+         int_bit_depth=None,
+         approximate=False,
+         **kwargs):
     """
     Encodes estimated tristimulus values in a scene to :math:`R'G'B'` video
     component signal value using given opto-electronic transfer function
@@ -411,6 +510,17 @@ def oetf(value, function='sRGB', **kwargs):
         'ITU-R BT.709', 'ProPhoto RGB', 'RIMM RGB', 'ROMM RGB', 'SMPTE 240M',
         'ST 2084'}**,
         Opto-electronic transfer function (OETF / OECF).
+    int_bit_depth : int, optional
+        If given, integer code values of given bit depth are evaluated by
+        indexing a cached dense table of the opto-electronic transfer
+        function, see :func:`colour.CV_table` definition, float values and
+        bit depths above 16 are evaluated as usual.
+    approximate : bool or array_like, optional
+        If *True* or a domain, float values are evaluated with a cached
+        approximation of the opto-electronic transfer function with bounded
+        error, see :class:`colour.TransferFunctionApproximation` class. The
+        approximation domain is [0, 1] if *True*, or the given array_like
+        otherwise, values outside it are evaluated as usual.
 
     Other Parameters
     ----------------
@@ -452,7 +562,7 @@ def oetf(value, function='sRGB', **kwargs):
 
     function = OETFS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate(function, value, int_bit_depth, approximate, **kwargs)
 
 
 OETFS_REVERSE = CaseInsensitiveMapping({
@@ -535,7 +645,11 @@ EOTFS : CaseInsensitiveMapping
 """
 
 
-def eotf(value, function='ITU-R BT.1886', **kwargs):
+def eotf(value,
+         function='ITU-R BT.1886',
+         int_bit_depth=None,
+         approximate=False,
+         **kwargs):
     """
     Decodes :math:`R'G'B'` video component signal value to tristimulus values
     at the display using given electro-optical transfer function (EOTF / EOCF).
@@ -549,6 +663,17 @@ def eotf(value, function='ITU-R BT.1886', **kwargs):
         'ITU-R BT.2100 HLG', 'ITU-R BT.2100 PQ', 'ProPhoto RGB', 'RIMM RGB',
         'ROMM RGB', 'SMPTE 240M', 'ST 2084'}**,
         Electro-optical transfer function (EOTF / EOCF).
+    int_bit_depth : int, optional
+        If given, integer code values of given bit depth are evaluated by
+        indexing a cached dense table of the electro-optical transfer
+        function, see :func:`colour.CV_table` definition, float values and
+        bit depths above 16 are evaluated as usual.
+    approximate : bool or array_like, optional
+        If *True* or a domain, float values are evaluated with a cached
+        approximation of the electro-optical transfer function with bounded
+        error, see :class:`colour.TransferFunctionApproximation` class. The
+        approximation domain is [0, 1] if *True*, or the given array_like
+        otherwise, values outside it are evaluated as usual.
 
     Other Parameters
     ----------------
@@ -595,11 +720,17 @@ def eotf(value, function='ITU-R BT.1886', **kwargs):
     >>> eotf(0.182011532850008, function='ST 2084', L_p=1000)
     ... # doctest: +ELLIPSIS
     0.1...
+
+    Evaluating integer code values with a cached dense table:
+
+    >>> eotf(np.array([0, 512, 1023]), function='ST 2084', int_bit_depth=10)
+    ... # doctest: +ELLIPSIS
+    array([     0.        ,     92.6984702...,  10000.        ])
     """
 
     function = EOTFS[function]
 
-    return function(value, **filter_kwargs(function, **kwargs))
+    return _evaluate(function, value, int_bit_depth, approximate, **kwargs)
 
 
 EOTFS_REVERSE = CaseInsensitiveMapping({
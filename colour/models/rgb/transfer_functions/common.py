@@ -5,6 +5,15 @@ Common Transfer Functions Utilities
 
 Defines various transfer functions common utilities.
 
+-   :func:`colour.CV_range`
+-   :func:`colour.legal_to_full`
+-   :func:`colour.full_to_legal`
+-   :attr:`colour.models.CV_TABLES_CACHE`
+-   :func:`colour.CV_table`
+-   :class:`colour.TransferFunctionApproximation`
+-   :attr:`colour.models.TRANSFER_FUNCTION_APPROXIMATIONS_CACHE`
+-   :func:`colour.models.transfer_function_approximation`
+
 See Also
 --------
 `RGB Colourspaces Jupyter Notebook
@@ -17,7 +26,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
-from colour.utilities import as_float_array
+from colour.utilities import (LRUCache, as_float, as_float_array,
+                              get_default_float_dtype, get_domain_range_scale)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -26,7 +36,28 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['CV_range', 'legal_to_full', 'full_to_legal']
+__all__ = [
+    'CV_range', 'legal_to_full', 'full_to_legal', 'CV_TABLES_CACHE',
+    'CV_table', 'TransferFunctionApproximation',
+    'TRANSFER_FUNCTION_APPROXIMATIONS_CACHE', 'transfer_function_approximation'
+]
+
+CV_TABLES_CACHE = LRUCache(maximum_bytes=2 ** 26)
+CV_TABLES_CACHE.__doc__ = """
+Transfer functions dense tables cache used by :func:`colour.CV_table`
+definition.
+
+The tables are keyed by the transfer function, the bit depth, the current
+*Colour* domain-range scale, the current default float dtype and the transfer
+function keyword arguments, the least recently used tables are discarded when
+the cache bytes size exceeds its
+:attr:`colour.utilities.LRUCache.maximum_bytes` attribute value, 64 MiB by
+default. The :attr:`colour.utilities.LRUCache.statistics` attribute and
+:meth:`colour.utilities.LRUCache.clear` method allow inspecting and clearing
+the cache.
+
+CV_TABLES_CACHE : LRUCache
+"""
 
 
 def CV_range(bit_depth=10, is_legal=False, is_int=False):
@@ -186,3 +217,424 @@ def full_to_legal(CV, bit_depth=10, in_int=False, out_int=False):
     CV = (W - B) * CV + B
 
     return np.round(CV).astype(DEFAULT_INT_DTYPE) if out_int else CV / MV
+
+
+def CV_table(function, bit_depth=10, **kwargs):
+    """
+    Returns the dense table of given transfer function evaluated at every
+    integer code value :math:`CV` of given bit depth.
+
+    The table value at index :math:`CV` is the transfer function evaluated at
+    the float equivalent of the code value, i.e.
+    :math:`function(CV / (2^{bit\\_depth} - 1))`, integer code values can
+    thus be evaluated by indexing the table instead of evaluating the transfer
+    function.
+
+    Parameters
+    ----------
+    function : callable
+        Transfer function to tabulate.
+    bit_depth : int, optional
+        Bit depth of the integer code values, in domain [1, 16].
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function, they must be hashable.
+
+    Returns
+    -------
+    ndarray
+        Read-only transfer function table.
+
+    Notes
+    -----
+    -   The tables are cached in :attr:`colour.models.CV_TABLES_CACHE`
+        attribute.
+    -   The bit depth is limited to 16 so that a table does not exceed 512 KiB
+        with 64-bit floats.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_ST2084
+    >>> table = CV_table(eotf_ST2084, 10)
+    >>> table.shape
+    (1024,)
+    >>> table[520]  # doctest: +ELLIPSIS
+    100.2298855...
+    """
+
+    assert 1 <= bit_depth <= 16, (
+        '"{0}" bit depth must be in domain [1, 16]!'.format(bit_depth))
+
+    key = (function, bit_depth, get_domain_range_scale(),
+           get_default_float_dtype(), tuple(sorted(kwargs.items())))
+
+    table = CV_TABLES_CACHE.get(key)
+    if table is None:
+        MV = 2 ** bit_depth - 1
+
+        table = as_float_array(function(np.arange(MV + 1) / MV, **kwargs))
+        table.setflags(write=False)
+
+        CV_TABLES_CACHE[key] = table
+
+    return table
+
+
+class TransferFunctionApproximation(object):
+    """
+    Implements a fast approximation of given transfer function with bounded
+    error.
+
+    The transfer function is tabulated on a uniform grid and evaluated by
+    linear interpolation, avoiding its transcendental functions. The grid
+    resolution is chosen automatically: the domain is split into uniform
+    cells whose resolution is doubled until the linear interpolation error
+    bound between every table sample is lower than
+    ``tolerance`` multiplied by :math:`max(|y|, 1)`, where :math:`y` is the
+    transfer function value, and the grid uses the finest resolution required
+    by the cells. The cells not reaching the tolerance within
+    ``maximum_cell_size`` samples, e.g. around an infinite slope or a
+    discontinuity, are evaluated with the transfer function instead, as are
+    the values outside the domain.
+
+    Parameters
+    ----------
+    function : callable
+        Transfer function to approximate.
+    domain : array_like, optional
+        Domain of the approximation, the values outside it are evaluated with
+        the transfer function.
+    tolerance : numeric, optional
+        Interpolation error tolerance, absolute for transfer function values
+        lower than 1 and relative otherwise.
+    cells : int, optional
+        Number of uniform cells the domain is split into.
+    maximum_cell_size : int, optional
+        Maximum number of table samples per cell.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function.
+
+    Attributes
+    ----------
+    function
+    domain
+    tolerance
+    size
+    maximum_absolute_error
+    maximum_relative_error
+    nbytes
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    -   The maximum absolute and relative errors are derived from the
+        interpolation error measured on the final table at the three quarter
+        points between every table sample: they bound the approximation error
+        for transfer functions whose second derivative sign is constant
+        between the table samples, which is the case of the supported
+        transfer functions, including across their breakpoints as long as the
+        slope change agrees with the curvature.
+    -   The relative error is unbounded where the transfer function value is
+        close to zero, the tolerance is thus absolute for values lower than 1
+        and the maximum relative error is only reported where the absolute
+        transfer function value is greater than or equal to 1: it is derived
+        from the interpolation error of every table interval divided by the
+        lowest absolute transfer function value reached in the interval,
+        assuming that the transfer function is monotonic.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_ST2084
+    >>> approximation = TransferFunctionApproximation(eotf_ST2084)
+    >>> approximation(0.5)  # doctest: +ELLIPSIS
+    92.2457089...
+    >>> approximation.size
+    8192
+    >>> approximation.maximum_absolute_error  # doctest: +ELLIPSIS
+    0.0023...
+    """
+
+    def __init__(self,
+                 function,
+                 domain=np.array([0, 1]),
+                 tolerance=1e-6,
+                 cells=64,
+                 maximum_cell_size=4096,
+                 **kwargs):
+        self._function = function
+        self._domain = as_float_array(domain)
+        self._tolerance = tolerance
+        self._kwargs = kwargs
+
+        def evaluate(x):
+            """
+            Evaluates the transfer function and the interpolation error of
+            given table samples.
+            """
+
+            y = as_float_array(function(x, **kwargs))
+
+            x_e = (x[:-1, np.newaxis] + t * (x[1] - x[0])).ravel()
+            y_e = as_float_array(function(x_e, **kwargs))
+            # The interpolation error is concave between two table samples if
+            # the transfer function second derivative sign is constant, the
+            # error measured at the quarter points is then at least 3/4 of
+            # the maximum error.
+            error = np.abs(np.interp(x_e, x, y) - y_e) * 4 / 3
+
+            return y, error.reshape([-1, len(t)]), y_e.reshape([-1, len(t)])
+
+        t = np.linspace(0, 1, 5)[1:-1]
+        a, b = self._domain
+        cell_size, tabulated = 1, np.zeros(cells, np.bool_)
+        with np.errstate(all='ignore'):
+            for i, x_c in enumerate(np.linspace(a, b, cells + 1)[:-1]):
+                size = max(cell_size, 16)
+                while size <= maximum_cell_size:
+                    _y, error, y_e = evaluate(
+                        x_c + np.arange(size + 1) / size * (b - a) / cells)
+
+                    if np.all(error <= tolerance * np.maximum(np.abs(y_e), 1)):
+                        cell_size, tabulated[i] = size, True
+                        break
+
+                    size *= 2
+
+            self._size = size = cells * cell_size
+            self._scale = size / (b - a)
+
+            y, error, _y_e = evaluate(np.linspace(a, b, size + 1))
+
+        # Intervals are stored with their base value and delta, "NaN" guards
+        # are placed before and after the table and in the intervals of the
+        # cells evaluated with the transfer function.
+        tabulated = np.repeat(tabulated, cell_size)
+        self._bases = np.full(size + 2, np.nan)
+        self._bases[1:-1] = np.where(tabulated, y[:-1], np.nan)
+        self._deltas = np.full(size + 2, np.nan)
+        self._deltas[1:-1] = np.diff(y)
+
+        # The absolute transfer function value is bounded below in an
+        # interval by its lowest absolute value at the interval ends if they
+        # have the same sign, and by 1 in the region where the relative error
+        # is reported.
+        y_l, y_r = y[:-1], y[1:]
+        y_minimum = np.where(y_l * y_r > 0,
+                             np.minimum(np.abs(y_l), np.abs(y_r)), 0)
+        relative = np.logical_and(tabulated,
+                                  np.maximum(np.abs(y_l), np.abs(y_r)) >= 1)
+
+        error = np.max(error, axis=-1)
+        error_relative = error[relative] / np.maximum(y_minimum[relative], 1)
+
+        self._maximum_absolute_error = (np.max(error[tabulated])
+                                        if np.any(tabulated) else 0)
+        self._maximum_relative_error = (np.max(error_relative)
+                                        if error_relative.size else 0)
+
+    @property
+    def function(self):
+        """
+        Getter property for the approximated transfer function.
+
+        Returns
+        -------
+        callable
+            Approximated transfer function.
+        """
+
+        return self._function
+
+    @property
+    def domain(self):
+        """
+        Getter property for the approximation domain.
+
+        Returns
+        -------
+        ndarray
+            Approximation domain.
+        """
+
+        return self._domain
+
+    @property
+    def tolerance(self):
+        """
+        Getter property for the interpolation error tolerance.
+
+        Returns
+        -------
+        numeric
+            Interpolation error tolerance.
+        """
+
+        return self._tolerance
+
+    @property
+    def size(self):
+        """
+        Getter property for the table intervals count.
+
+        Returns
+        -------
+        int
+            Table intervals count.
+        """
+
+        return self._size
+
+    @property
+    def maximum_absolute_error(self):
+        """
+        Getter property for the maximum absolute error of the approximation.
+
+        Returns
+        -------
+        numeric
+            Maximum absolute error.
+        """
+
+        return self._maximum_absolute_error
+
+    @property
+    def maximum_relative_error(self):
+        """
+        Getter property for the maximum relative error of the approximation
+        where the absolute transfer function value is greater than or equal
+        to 1, the error being absolute and bounded by
+        :attr:`colour.models.TransferFunctionApproximation.\
+maximum_absolute_error` attribute otherwise.
+
+        Returns
+        -------
+        numeric
+            Maximum relative error, 0 if the absolute transfer function value
+            is lower than 1 on the approximation domain.
+        """
+
+        return self._maximum_relative_error
+
+    @property
+    def nbytes(self):
+        """
+        Getter property for the approximation tables bytes size.
+
+        Returns
+        -------
+        int
+            Approximation tables bytes size.
+        """
+
+        return self._bases.nbytes + self._deltas.nbytes
+
+    def __call__(self, value):
+        """
+        Evaluates the approximation at given value.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Value.
+
+        Returns
+        -------
+        numeric or ndarray
+            Approximated transfer function value.
+        """
+
+        value = np.atleast_1d(as_float_array(value))
+
+        # The values are offset by one interval so that the values lower than
+        # the domain minimum fall into the leading "NaN" guard.
+        s = value * self._scale
+        s += 1 - self._domain[0] * self._scale
+        i = s.astype(DEFAULT_INT_DTYPE)
+        np.clip(i, 0, self._size + 1, out=i)
+        s -= i
+
+        s *= self._deltas[i]
+        s += self._bases[i]
+
+        analytic = np.isnan(s)
+        if np.any(analytic):
+            s[analytic] = self._function(value[analytic], **self._kwargs)
+
+        return as_float(s)
+
+
+TRANSFER_FUNCTION_APPROXIMATIONS_CACHE = LRUCache(maximum_bytes=2 ** 26)
+TRANSFER_FUNCTION_APPROXIMATIONS_CACHE.__doc__ = """
+Transfer functions approximations cache used by
+:func:`colour.models.transfer_function_approximation` definition.
+
+The approximations are keyed by the transfer function, the domain, the current
+*Colour* domain-range scale, the current default float dtype and the transfer
+function keyword arguments, the least recently used approximations are
+discarded when the cache bytes size exceeds its
+:attr:`colour.utilities.LRUCache.maximum_bytes` attribute value, 64 MiB by
+default. The :attr:`colour.utilities.LRUCache.statistics` attribute and
+:meth:`colour.utilities.LRUCache.clear` method allow inspecting and clearing
+the cache.
+
+TRANSFER_FUNCTION_APPROXIMATIONS_CACHE : LRUCache
+"""
+
+
+def transfer_function_approximation(function,
+                                    domain=np.array([0, 1]),
+                                    **kwargs):
+    """
+    Returns the cached approximation of given transfer function over given
+    domain.
+
+    Parameters
+    ----------
+    function : callable
+        Transfer function to approximate.
+    domain : array_like, optional
+        Domain of the approximation.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function, they must be hashable.
+
+    Returns
+    -------
+    TransferFunctionApproximation
+        Transfer function approximation.
+
+    Notes
+    -----
+    -   The approximations are cached in
+        :attr:`colour.models.TRANSFER_FUNCTION_APPROXIMATIONS_CACHE` attribute.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_ST2084
+    >>> approximation = transfer_function_approximation(eotf_ST2084)
+    >>> approximation is transfer_function_approximation(eotf_ST2084)
+    True
+    """
+
+    key = (function, tuple(np.ravel(domain).tolist()),
+           get_domain_range_scale(), get_default_float_dtype(),
+           tuple(sorted(kwargs.items())))
+
+    approximation = TRANSFER_FUNCTION_APPROXIMATIONS_CACHE.get(key)
+    if approximation is None:
+        approximation = TransferFunctionApproximation(function, domain,
+                                                      **kwargs)
+
+        TRANSFER_FUNCTION_APPROXIMATIONS_CACHE[key] = approximation
+
+    return approximation
@@ -10,10 +10,15 @@ import numpy as np
 import unittest
 
 from colour.models.rgb.transfer_functions import (
-    CV_range, DECODING_CCTFS, ENCODING_CCTFS, EOTFS, EOTFS_REVERSE,
-    LOG_DECODING_CURVES, LOG_ENCODING_CURVES, OETFS, OETFS_REVERSE, OOTFS,
-    OOTFS_REVERSE, legal_to_full, full_to_legal)
-from colour.utilities import ignore_numpy_errors
+    CV_TABLES_CACHE, CV_range, CV_table, DECODING_CCTFS, ENCODING_CCTFS, EOTFS,
+    EOTFS_REVERSE, LOG_DECODING_CURVES, LOG_ENCODING_CURVES, OETFS,
+    OETFS_REVERSE, OOTFS, OOTFS_REVERSE,
+    TRANSFER_FUNCTION_APPROXIMATIONS_CACHE, TransferFunctionApproximation,
+    eotf, eotf_BT1886, eotf_ST2084, legal_to_full, full_to_legal,
+    log_decoding_curve, log_encoding_curve, log_encoding_SLog3, oetf,
+    transfer_function_approximation)
+from colour.utilities import (default_float_dtype, domain_range_scale,
+                              ignore_numpy_errors)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -23,8 +28,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Development'
 
 __all__ = [
-    'TestCV_range', 'TestLegalToFull', 'TestFullToLegal',
-    'TestTransferFunctions'
+    'TestCV_range', 'TestLegalToFull', 'TestFullToLegal', 'TestCV_table',
+    'TestTransferFunctionApproximation', 'TestTransferFunctions'
 ]
 
 
@@ -201,6 +206,206 @@ class TestFullToLegal(unittest.TestCase):
         full_to_legal(np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]), 10)
 
 
+class TestCV_table(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.common.CV_table`
+    definition unit tests methods.
+    """
+
+    def test_CV_table(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.common.CV_table`
+        definition.
+        """
+
+        CV_TABLES_CACHE.clear()
+
+        table = CV_table(eotf_ST2084, 10, L_p=1000)
+        np.testing.assert_equal(table,
+                                eotf_ST2084(np.arange(1024) / 1023, L_p=1000))
+        self.assertFalse(table.flags.writeable)
+
+        self.assertIs(CV_table(eotf_ST2084, 10, L_p=1000), table)
+        self.assertIsNot(CV_table(eotf_ST2084, 10), table)
+        self.assertEqual(CV_table(eotf_ST2084, 12).shape, (4096, ))
+        self.assertEqual(len(CV_TABLES_CACHE), 3)
+
+        with domain_range_scale(1):
+            self.assertIsNot(CV_table(eotf_ST2084, 10, L_p=1000), table)
+
+        with default_float_dtype(np.float32):
+            self.assertEqual(
+                CV_table(eotf_ST2084, 10, L_p=1000).dtype, np.float32)
+
+        self.assertRaises(AssertionError, CV_table, eotf_ST2084, 24)
+
+        CV_TABLES_CACHE.clear()
+
+    def test_int_bit_depth(self):
+        """
+        Tests transfer functions integer code values evaluation using
+        :func:`colour.models.rgb.transfer_functions.common.CV_table`
+        definition.
+        """
+
+        for bit_depth in (10, 12):
+            CV = np.arange(2 ** bit_depth).reshape([-1, 2, 2])
+            value = CV / (2 ** bit_depth - 1)
+
+            for curve in ('ALEXA Log C', 'S-Log3', 'V-Log'):
+                np.testing.assert_equal(
+                    log_decoding_curve(CV, curve, bit_depth),
+                    log_decoding_curve(value, curve))
+                np.testing.assert_equal(
+                    log_encoding_curve(CV, curve, bit_depth),
+                    log_encoding_curve(value, curve))
+
+            np.testing.assert_equal(
+                oetf(CV, 'ST 2084', bit_depth, L_p=1000),
+                oetf(value, 'ST 2084', L_p=1000))
+            np.testing.assert_equal(
+                eotf(CV, 'ITU-R BT.1886', bit_depth, L_B=0.1),
+                eotf(value, 'ITU-R BT.1886', L_B=0.1))
+
+        self.assertEqual(eotf(512, 'ST 2084', 10), eotf_ST2084(512 / 1023))
+
+        # Float values and out of range integer code values are evaluated
+        # analytically.
+        np.testing.assert_equal(
+            eotf(np.array([0.25, 0.5]), 'ST 2084', 10),
+            eotf_ST2084(np.array([0.25, 0.5])))
+        np.testing.assert_almost_equal(
+            eotf(np.array([-1, 1024]), 'ST 2084', 10),
+            eotf_ST2084(np.array([-1, 1024]) / 1023),
+            decimal=7)
+
+        CV = np.array([0, 2 ** 23, 2 ** 24 - 1])
+        np.testing.assert_equal(
+            eotf(CV, 'ST 2084', 24), eotf_ST2084(CV / (2 ** 24 - 1)))
+
+
+class TestTransferFunctionApproximation(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.transfer_functions.common.\
+TransferFunctionApproximation` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('function', 'domain', 'tolerance', 'size',
+                               'maximum_absolute_error',
+                               'maximum_relative_error', 'nbytes')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(TransferFunctionApproximation))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(TransferFunctionApproximation))
+
+    def test__call__(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.common.\
+TransferFunctionApproximation.__call__` method.
+        """
+
+        # The samples are dense near zero where the relative error of the
+        # linear interpolation of a power curve is unbounded.
+        samples = np.hstack(
+            [np.linspace(0, 1, 100003),
+             np.logspace(-12, 0, 1001)])
+
+        for function, kwargs in ((eotf_ST2084, {
+                'L_p': 1000
+        }), (eotf_BT1886, {}), (log_encoding_SLog3, {})):
+            approximation = TransferFunctionApproximation(
+                function, tolerance=1e-5, **kwargs)
+
+            value_a = approximation(samples)
+            value_f = function(samples, **kwargs)
+            error = np.abs(value_a - value_f)
+
+            self.assertLessEqual(
+                np.max(error), approximation.maximum_absolute_error + 1e-12)
+            self.assertTrue(
+                np.all(error <= 1e-5 * np.maximum(np.abs(value_f), 1) + 1e-12))
+
+            relative = np.abs(value_f) >= 1
+            self.assertTrue(
+                np.all(error[relative] / np.abs(value_f[relative]) <=
+                       approximation.maximum_relative_error + 1e-12))
+
+        # Values outside the domain are evaluated with the transfer function.
+        approximation = TransferFunctionApproximation(eotf_ST2084)
+        value = np.array([-0.5, 1.5, np.nan, np.inf])
+        np.testing.assert_equal(approximation(value), eotf_ST2084(value))
+
+        self.assertEqual(approximation(1), eotf_ST2084(1))
+        self.assertIsInstance(approximation(0.5), float)
+        self.assertTupleEqual(
+            approximation(np.zeros([4, 3, 2])).shape, (4, 3, 2))
+
+    def test_transfer_function_approximation(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.common.\
+transfer_function_approximation` definition and transfer functions
+        approximate evaluation.
+        """
+
+        TRANSFER_FUNCTION_APPROXIMATIONS_CACHE.clear()
+
+        approximation = transfer_function_approximation(eotf_ST2084)
+        self.assertIs(
+            transfer_function_approximation(eotf_ST2084), approximation)
+        self.assertIsNot(
+            transfer_function_approximation(eotf_ST2084, L_p=1000),
+            approximation)
+        self.assertIsNot(
+            transfer_function_approximation(eotf_ST2084, np.array([0, 0.5])),
+            approximation)
+        self.assertEqual(len(TRANSFER_FUNCTION_APPROXIMATIONS_CACHE), 3)
+
+        with default_float_dtype(np.float32):
+            self.assertIsNot(
+                transfer_function_approximation(eotf_ST2084), approximation)
+
+        samples = np.linspace(0, 1, 1001)
+        np.testing.assert_equal(
+            eotf(samples, 'ST 2084', approximate=True), approximation(samples))
+        np.testing.assert_allclose(
+            oetf(samples, 'ITU-R BT.2100 HLG', approximate=True),
+            oetf(samples, 'ITU-R BT.2100 HLG'),
+            rtol=1e-6,
+            atol=1e-6)
+        np.testing.assert_allclose(
+            log_decoding_curve(
+                samples, 'ALEXA Log C', approximate=np.array([0, 2])),
+            log_decoding_curve(samples, 'ALEXA Log C'),
+            rtol=1e-6,
+            atol=1e-6)
+        np.testing.assert_allclose(
+            log_encoding_curve(samples, 'S-Log3', approximate=True),
+            log_encoding_curve(samples, 'S-Log3'),
+            rtol=1e-6,
+            atol=1e-6)
+
+        # Integer code values are still evaluated with dense tables.
+        np.testing.assert_equal(
+            eotf(np.arange(1024), 'ST 2084', 10, approximate=True),
+            eotf_ST2084(np.arange(1024) / 1023))
+
+        TRANSFER_FUNCTION_APPROXIMATIONS_CACHE.clear()
+
+
 class TestTransferFunctions(unittest.TestCase):
     """
     Defines transfer functions unit tests methods.
@@ -9,7 +9,7 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.models import XYZ_to_OSA_UCS, OSA_UCS_to_XYZ
+from colour.models import XYZ_to_OSA_UCS, OSA_UCS_to_XYZ, sRGB_to_XYZ
 from colour.utilities import domain_range_scale, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -126,6 +126,17 @@ class TestOSA_UCS_to_XYZ(unittest.TestCase):
             rtol=0.00001,
             atol=0.00001)
 
+    def test_batch_OSA_UCS_to_XYZ(self):
+        """
+        Tests :func:`colour.models.osa_ucs.OSA_UCS_to_XYZ` definition
+        vectorised *Newton* solver on a batch of samples.
+        """
+
+        RGB = np.random.RandomState(4).random_sample([1000, 3])
+        XYZ = sRGB_to_XYZ(RGB) * 100
+        np.testing.assert_allclose(
+            OSA_UCS_to_XYZ(XYZ_to_OSA_UCS(XYZ)), XYZ, rtol=1e-7, atol=1e-7)
+
     def test_n_dimensional_OSA_UCS_to_XYZ(self):
         """
         Tests :func:`colour.models.osa_ucs.OSA_UCS_to_XYZ` definition
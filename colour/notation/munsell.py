@@ -118,10 +118,9 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import re
-from collections import OrderedDict
 
 from colour.algebra import (Extrapolator, LinearInterpolator,
-                            cartesian_to_cylindrical, euclidean_distance,
+                            cartesian_to_cylindrical, cartesian_to_polar,
                             polar_to_cartesian, spow)
 from colour.colorimetry import ILLUMINANTS, luminance_ASTMD153508
 from colour.constants import (DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE,
@@ -133,7 +132,8 @@ from colour.utilities import (CaseInsensitiveMapping, Lookup, as_float_array,
                               as_float, domain_range_scale, from_range_1,
                               from_range_10, get_domain_range_scale,
                               to_domain_1, to_domain_10, to_domain_100,
-                              is_integer, is_numeric, tsplit, warning)
+                              is_integer, is_numeric, tsplit, tstack,
+                              warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -199,7 +199,8 @@ MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = (ILLUMINANTS[
 
 _MUNSELL_SPECIFICATIONS_CACHE = None
 _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_RENOTATION_INDEX_CACHE = None
+_MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE = None
 
 
 def _munsell_specifications():
@@ -260,33 +261,123 @@ def _munsell_value_ASTMD153508_interpolator():
     return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
 
 
-def _munsell_maximum_chromas_from_renotation():
+def _munsell_renotation_index():
     """
-    Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
-    and caches them if not existing.
+    Returns the *Munsell Renotation System* index and caches it if not
+    existing.
+
+    The *Munsell Renotation System* data is stored in a dense
+    hue x value x chroma x code grid of *CIE xyY* colourspace vectors, the
+    vectors of specifications not existing in the data are set to *NaN*. The
+    maximum *Munsell* chromas for each hue, value and code are stored in a
+    dense hue x value x code table:
+
+    (hues, values, chromas, codes), xyY, maximum_chromas
+
+    where the grid axes are sorted so that a specification is located with
+    :func:`numpy.searchsorted` definition.
+
+    Returns
+    -------
+    tuple
+        *Munsell Renotation System* index.
+    """
+
+    global _MUNSELL_RENOTATION_INDEX_CACHE
+
+    if _MUNSELL_RENOTATION_INDEX_CACHE is None:
+        specifications = as_float_array(_munsell_specifications())
+
+        axes = tuple(np.unique(a) for a in tsplit(specifications))
+        indexes = tuple(
+            np.searchsorted(axis, a)
+            for axis, a in zip(axes, tsplit(specifications)))
+
+        xyY = np.full([len(axis) for axis in axes] + [3], np.nan)
+        xyY[indexes] = [colour[1] for colour in MUNSELL_COLOURS_ALL]
+
+        hues, values, chromas, codes = axes
+        maximum_chromas = np.max(
+            np.where(
+                np.isnan(xyY[..., 0]), -np.inf,
+                chromas[np.newaxis, np.newaxis, :, np.newaxis]),
+            axis=2)
+        maximum_chromas[maximum_chromas == -np.inf] = np.nan
+
+        for a in axes + (xyY, maximum_chromas):
+            a.setflags(write=False)
+
+        _MUNSELL_RENOTATION_INDEX_CACHE = axes, xyY, maximum_chromas
+
+    return _MUNSELL_RENOTATION_INDEX_CACHE
+
+
+def _munsell_renotation_indexes(axes, *keys):
+    """
+    Returns the *Munsell Renotation System* index indexes of given keys
+    arrays along given axes and whether the keys exist.
+
+    Parameters
+    ----------
+    axes : array_like
+        *Munsell Renotation System* index axes.
+
+    Other Parameters
+    ----------------
+    \\*keys : array_like
+        Keys arrays to locate along the axes.
 
     Returns
     -------
     tuple
-        Maximum *Munsell* chromas.
+        Indexes and keys existence array.
+    """
+
+    indexes = []
+    exists = True
+    for axis, key in zip(axes, keys):
+        index = np.minimum(np.searchsorted(axis, key), len(axis) - 1)
+        exists = np.logical_and(exists, axis[index] == key)
+        indexes.append(index)
+
+    return tuple(indexes), exists
+
+
+def _munsell_interpolation_methods_table():
     """
+    Returns the *Munsell Renotation System* ovoid interpolation methods table
+    and caches it if not existing.
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+    The table is indexed by *Munsell* value in domain [1, 9], *Munsell* chroma
+    in domain [2, 50] with a step of 2 and *ASTM* hue interval of width 2.5,
+    its entries are 0 for no interpolation method, 1 for *Linear* and 2 for
+    *Radial* interpolation. It is built by evaluating
+    :func:`colour.notation.munsell.interpolation_method_from_renotation_ovoid`
+    definition at the middle of each *ASTM* hue interval.
 
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
-        chromas = OrderedDict()
-        for munsell_colour in MUNSELL_COLOURS_ALL:
-            hue, value, chroma, code = munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))
-            index = (hue, value, code)
-            if index in chromas:
-                chroma = max(chromas[index], chroma)
+    Returns
+    -------
+    ndarray, (9, 25, 40)
+        *Munsell Renotation System* ovoid interpolation methods table.
+    """
+
+    global _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE
 
-            chromas[index] = chroma
+    if _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE is None:
+        methods = {None: 0, 'Linear': 1, 'Radial': 2}
+        table = np.zeros((9, 25, 40), dtype=DEFAULT_INT_DTYPE)
+        for i, value in enumerate(range(1, 10)):
+            for j, chroma in enumerate(range(2, 52, 2)):
+                for k in range(40):
+                    ASTM_hue = 2.5 * k + 1.25
+                    code = (7 - int(ASTM_hue // 10)) % 10 or 10
+                    table[i, j, k] = methods[
+                        interpolation_method_from_renotation_ovoid(
+                            (ASTM_hue % 10, value, chroma, code))]
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+        _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE = table
+
+    return _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE
 
 
 def munsell_value_Priest1920(Y):
@@ -860,7 +951,7 @@ def xyY_to_munsell_specification(xyY):
 
     Parameters
     ----------
-    xyY : array_like, (3,)
+    xyY : array_like
         *CIE xyY* colourspace array.
 
     Returns
@@ -875,10 +966,19 @@ def xyY_to_munsell_specification(xyY):
         limits.
     RuntimeError
         If the maximum iterations count has been reached without converging to
-        a result.
+        a result for a single *CIE xyY* colourspace array of shape (3,).
 
     Notes
     -----
+    -   The samples of a *CIE xyY* colourspace array of shape (..., 3) are
+        solved simultaneously, each sample leaving the iterations as soon as
+        it converges, and a *Munsell* *Colorlab* specification array of shape
+        (..., 4) is returned in which grey samples are represented as
+        *[NaN, value, NaN, NaN]*. A single *CIE xyY* colourspace array of
+        shape (3,) returns the *Munsell* value of a grey sample as a numeric.
+    -   The specifications of the samples of a *CIE xyY* colourspace array of
+        shape (..., 3) having reached the maximum iterations count without
+        converging to a result are set to *NaN* and a warning is issued.
 
     +-------------------+-----------------------+---------------+
     | **Domain**        | **Scale - Reference** | **Scale - 1** |
@@ -907,217 +1007,48 @@ def xyY_to_munsell_specification(xyY):
     >>> xyY = np.array([0.38736945, 0.35751656, 0.59362000])
     >>> xyY_to_munsell_specification(xyY)  # doctest: +ELLIPSIS
     array([ 4.2000019...,  8.0999999...,  5.2999996...,  6.        ])
+    >>> xyY = np.array([[0.38736945, 0.35751656, 0.59362000],
+    ...                 [0.31006000, 0.31616000, 0.74613450]])
+    >>> xyY_to_munsell_specification(xyY)  # doctest: +ELLIPSIS
+    array([[ 4.2000019...,  8.0999999...,  5.2999996...,  6.        ],
+           [        nan,  8.9000000...,         nan,         nan]])
     """
 
+    xyY = as_float_array(xyY)
     x, y, Y = tsplit(xyY)
     Y = to_domain_1(Y)
 
-    if not is_within_macadam_limits(xyY, MUNSELL_DEFAULT_ILLUMINANT):
+    within_macadam_limits = is_within_macadam_limits(
+        xyY, MUNSELL_DEFAULT_ILLUMINANT)
+    if not np.all(within_macadam_limits):
         warning('"{0}" is not within "MacAdam" limits for illuminant '
-                '"{1}"!'.format(xyY, MUNSELL_DEFAULT_ILLUMINANT))
-
-    with domain_range_scale('ignore'):
-        value = munsell_value_ASTMD153508(Y * 100)
-
-    if is_integer(value):
-        value = round(value)
-
-    with domain_range_scale('ignore'):
-        x_center, y_center, Y_center = np.ravel(
-            munsell_specification_to_xyY(value))
-
-    rho_input, phi_input, _z_input = cartesian_to_cylindrical(
-        (x - x_center, y - y_center, Y_center))
-    phi_input = np.degrees(phi_input)
-
-    grey_threshold = 1e-7
-    if rho_input < grey_threshold:
-        return from_range_10(value)
-
-    X, Y, Z = np.ravel(xyY_to_XYZ((x, y, Y)))
-    xi, yi = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
-    Xr, Yr, Zr = np.ravel(xyY_to_XYZ((xi, yi, Y)))
-
-    XYZ = np.array([X, Y, Z])
-    XYZr = np.array([(1 / Yr) * Xr, 1, (1 / Yr) * Zr])
-
-    Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
-    LCHab = Lab_to_LCHab(Lab)
-    hue_initial, _value_initial, chroma_initial, code_initial = (
-        LCHab_to_munsell_specification(LCHab))
-    specification_current = [
-        hue_initial, value, (5 / 5.5) * chroma_initial, code_initial
-    ]
-
-    convergence_threshold = 1e-7
-    iterations_maximum = 64
-    iterations = 0
-
-    while iterations <= iterations_maximum:
-        iterations += 1
-
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        hue_angle_current = hue_to_hue_angle(hue_current, code_current)
-
-        chroma_maximum = maximum_chroma_from_renotation(
-            hue_current, value, code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
-
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
-
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
-        phi_current = np.degrees(phi_current)
-        phi_current_difference = (360 - phi_input + phi_current) % 360
-        if phi_current_difference > 180:
-            phi_current_difference -= 360
-
-        phi_differences = [phi_current_difference]
-        hue_angles = [hue_angle_current]
-        hue_angles_differences = [0]
-
-        iterations_maximum_inner = 16
-        iterations_inner = 0
-        extrapolate = False
-
-        while np.sign(min(phi_differences)) == np.sign(
-                max(phi_differences)) and extrapolate is False:
-            iterations_inner += 1
-
-            if iterations_inner > iterations_maximum_inner:
-                raise RuntimeError(('Maximum inner iterations count reached '
-                                    'without convergence!'))
-
-            hue_angle_inner = ((hue_angle_current + iterations_inner *
-                                (phi_input - phi_current)) % 360)
-            hue_angle_difference_inner = (iterations_inner *
-                                          (phi_input - phi_current) % 360)
-            if hue_angle_difference_inner > 180:
-                hue_angle_difference_inner -= 360
-
-            hue_inner, code_inner = hue_angle_to_hue(hue_angle_inner)
-
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = np.ravel(
-                    munsell_specification_to_xyY((hue_inner, value,
-                                                  chroma_current, code_inner)))
-
-            if len(phi_differences) >= 2:
-                extrapolate = True
-
-            if extrapolate is False:
-                rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                    (x_inner - x_center, y_inner - y_center, Y_center))
-                phi_inner = np.degrees(phi_inner)
-                phi_inner_difference = ((360 - phi_input + phi_inner) % 360)
-                if phi_inner_difference > 180:
-                    phi_inner_difference -= 360
-
-                phi_differences.append(phi_inner_difference)
-                hue_angles.append(hue_angle_inner)
-                hue_angles_differences.append(hue_angle_difference_inner)
-
-        phi_differences = np.array(phi_differences)
-        hue_angles_differences = np.array(hue_angles_differences)
-
-        phi_differences_indexes = phi_differences.argsort()
-
-        phi_differences = phi_differences[phi_differences_indexes]
-        hue_angles_differences = hue_angles_differences[
-            phi_differences_indexes]
-
-        hue_angle_difference_new = Extrapolator(
-            LinearInterpolator(phi_differences,
-                               hue_angles_differences))(0) % 360
-        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
-
-        hue_new, code_new = hue_angle_to_hue(hue_angle_new)
-        specification_current = [hue_new, value, chroma_current, code_new]
-
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
+                '"{1}"!'.format(
+                    xyY if xyY.ndim == 1 else xyY[~within_macadam_limits],
+                    MUNSELL_DEFAULT_ILLUMINANT))
 
-        chroma_scale = 50 if get_domain_range_scale() == '1' else 2
-
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
-
-        # TODO: Consider refactoring implementation.
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        chroma_maximum = maximum_chroma_from_renotation(
-            hue_current, value, code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
-
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
-
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
-
-        rho_bounds = [rho_current]
-        chroma_bounds = [chroma_current]
-
-        iterations_maximum_inner = 16
-        iterations_inner = 0
-        while not (min(rho_bounds) < rho_input < max(rho_bounds)):
-            iterations_inner += 1
-
-            if iterations_inner > iterations_maximum_inner:
-                raise RuntimeError(('Maximum inner iterations count reached '
-                                    'without convergence!'))
-
-            chroma_inner = (((
-                rho_input / rho_current) ** iterations_inner) * chroma_current)
-            if chroma_inner > chroma_maximum:
-                chroma_inner = specification_current[2] = chroma_maximum
-
-            specification_inner = (hue_current, value, chroma_inner,
-                                   code_current)
-
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = np.ravel(
-                    munsell_specification_to_xyY(specification_inner))
-
-            rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                (x_inner - x_center, y_inner - y_center, Y_center))
-
-            rho_bounds.append(rho_inner)
-            chroma_bounds.append(chroma_inner)
+    specification = _xyY_to_munsell_specification_array(
+        np.reshape(tstack([x, y, Y]), (-1, 3)), xyY.ndim == 1)
 
-        rho_bounds = np.array(rho_bounds)
-        chroma_bounds = np.array(chroma_bounds)
+    failed = np.reshape(
+        np.all(np.isnan(specification), axis=-1), xyY.shape[:-1])
+    if np.any(failed):
+        warning('Maximum iterations count reached without convergence for '
+                '{0} sample(s) at indexes "{1}", their specifications are '
+                'set to "NaN"!'.format(
+                    np.sum(failed),
+                    np.argwhere(failed).tolist()))
 
-        rhos_bounds_indexes = rho_bounds.argsort()
+    chroma_scale = 50 if get_domain_range_scale() == '1' else 2
 
-        rho_bounds = rho_bounds[rhos_bounds_indexes]
-        chroma_bounds = chroma_bounds[rhos_bounds_indexes]
-        chroma_new = LinearInterpolator(rho_bounds, chroma_bounds)(rho_input)
+    if xyY.ndim == 1:
+        specification = specification[0]
 
-        specification_current = [hue_current, value, chroma_new, code_current]
+        if np.isnan(specification[0]):
+            return from_range_10(specification[1])
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
-
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
-
-    raise RuntimeError(
-        'Maximum outside iterations count reached without convergence!')
+    return from_range_10(
+        np.reshape(specification, xyY.shape[:-1] + (4, )),
+        np.array([10, 10, chroma_scale, 10]))
 
 
 def xyY_to_munsell_colour(xyY,
@@ -1397,14 +1328,18 @@ def xyY_from_renotation(specification):
 
     specification = normalize_munsell_specification(specification)
 
-    specifications = _munsell_specifications()
-    try:
-        return MUNSELL_COLOURS_ALL[specifications.index(specification)][1]
-    except ValueError:
-        # TODO: Should raise KeyError, need to check the tests.
-        raise ValueError(
-            ('"{0}" specification does not exists in '
-             '"Munsell Renotation System" data!').format(specification))
+    if not is_grey_munsell_colour(specification):
+        axes, xyY, _maximum_chromas = _munsell_renotation_index()
+        indexes, exists = _munsell_renotation_indexes(axes, *specification)
+
+        # Specifications on the grid axes may not have renotation data.
+        if exists and not np.isnan(xyY[indexes][0]):
+            return np.copy(xyY[indexes])
+
+    # TODO: Should raise KeyError, need to check the tests.
+    raise ValueError(
+        ('"{0}" specification does not exists in '
+         '"Munsell Renotation System" data!').format(specification))
 
 
 def is_specification_in_renotation(specification):
@@ -2131,19 +2066,20 @@ def maximum_chroma_from_renotation(hue, value, code):
     hue_cw, code_cw = hue_cw
     hue_ccw, code_ccw = hue_ccw
 
-    maximum_chromas = _munsell_maximum_chromas_from_renotation()
-    specification_for_indexes = [chroma[0] for chroma in maximum_chromas]
+    ma_limit_mcw, ma_limit_mccw, ma_limit_pcw, ma_limit_pccw = (
+        _maximum_chroma_from_renotation_index(
+            [hue_cw, hue_ccw, hue_cw, hue_ccw],
+            [value_minus, value_minus, value_plus, value_plus],
+            [code_cw, code_ccw, code_cw, code_ccw]))
 
-    ma_limit_mcw = maximum_chromas[specification_for_indexes.index(
-        (hue_cw, value_minus, code_cw))][1]
-    ma_limit_mccw = maximum_chromas[specification_for_indexes.index(
-        (hue_ccw, value_minus, code_ccw))][1]
+    ma_limits = ([ma_limit_mcw, ma_limit_mccw, ma_limit_pcw, ma_limit_pccw]
+                 if value_plus <= 9 else [ma_limit_mcw, ma_limit_mccw])
+    if np.any(np.isnan(ma_limits)):
+        raise ValueError(('"{0}" bounding hues, values and codes do not exist '
+                          'in "Munsell Renotation System" data!').format(
+                              (hue, value, code)))
 
     if value_plus <= 9:
-        ma_limit_pcw = maximum_chromas[specification_for_indexes.index(
-            (hue_cw, value_plus, code_cw))][1]
-        ma_limit_pccw = maximum_chromas[specification_for_indexes.index(
-            (hue_ccw, value_plus, code_ccw))][1]
         max_chroma = min(ma_limit_mcw, ma_limit_mccw, ma_limit_pcw,
                          ma_limit_pccw)
     else:
@@ -2154,6 +2090,7 @@ def maximum_chroma_from_renotation(hue, value, code):
         max_chroma = min(
             LinearInterpolator((L9, L10), (ma_limit_mcw, 0))(L),
             LinearInterpolator((L9, L10), (ma_limit_mccw, 0))(L))
+
     return max_chroma
 
 
@@ -2227,3 +2164,617 @@ def munsell_specification_to_xy(specification):
                                    (y_minus, y_plus))(chroma)
 
         return np.array([x, y])
+
+
+def _interpolate_linear(x, x_0, x_1, y_0, y_1):
+    """
+    Linearly interpolates element-wise between given :math:`(x_0, y_0)` and
+    :math:`(x_1, y_1)` points arrays, the results are clipped to the points
+    :math:`y` values outside the :math:`[x_0, x_1]` interval like
+    :class:`colour.LinearInterpolator` class does.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = (y_1 - y_0) / (x_1 - x_0) * (x - x_0) + y_0
+
+        y = np.where(x < x_0, y_0, y)
+        y = np.where(x >= x_1, y_1, y)
+
+    return y
+
+
+def _maximum_chroma_from_renotation_index(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas of given hues, values and codes
+    arrays from the *Munsell Renotation System* index, hues, values and codes
+    not existing in the data return *NaN*.
+    """
+
+    (hues, values, _chromas, codes), _xyY, maximum_chromas = (
+        _munsell_renotation_index())
+    indexes, exists = _munsell_renotation_indexes((hues, values, codes), hue,
+                                                  value, code)
+    exists = np.logical_and(exists, ~np.isnan(maximum_chromas[indexes]))
+
+    return np.where(exists, maximum_chromas[indexes], np.nan)
+
+
+def _xyY_from_renotation_array(hue, value, chroma, code):
+    """
+    Returns given *Munsell* *Colorlab* specifications arrays *CIE xyY*
+    colourspace vectors from *Munsell Renotation System* data, specifications
+    not existing in the data return *NaN*.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, chroma, code)])
+
+    # 0YR is equivalent to 10R.
+    zero = hue == 0
+    hue = np.where(zero, 10, hue)
+    code = np.where(zero, (code + 1) % 10, code)
+
+    axes, xyY, _maximum_chromas = _munsell_renotation_index()
+    indexes, exists = _munsell_renotation_indexes(axes, hue, value, chroma,
+                                                  code)
+    exists = np.logical_and(exists, ~np.isnan(xyY[indexes][..., 0]))
+
+    return np.where(exists[..., np.newaxis], xyY[indexes], np.nan)
+
+
+def _bounding_hues_from_renotation_array(hue, code):
+    """
+    Returns for given hues arrays the two bounding hues from
+    *Munsell Renotation System* data, element-wise equivalent of
+    :func:`colour.notation.munsell.bounding_hues_from_renotation` definition.
+    """
+
+    hue, code = np.broadcast_arrays(as_float_array(hue), as_float_array(code))
+
+    hue_cw = 2.5 * np.floor(hue / 2.5)
+    hue_ccw = (hue_cw + 2.5) % 10
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
+    code_cw = (code + 1) % 10
+    code_cw = np.where(hue_cw == 0, np.where(code_cw == 0, 10, code_cw), code)
+    hue_cw = np.where(hue_cw == 0, 10, hue_cw)
+    code_ccw = code
+
+    exact = hue % 2.5 == 0
+    hue_exact = np.where(hue == 0, 10, hue)
+    code_exact = np.where(hue == 0, (code + 1) % 10, code)
+
+    return ((np.where(exact, hue_exact, hue_cw),
+             np.where(exact, code_exact, code_cw)),
+            (np.where(exact, hue_exact, hue_ccw),
+             np.where(exact, code_exact, code_ccw)))
+
+
+def _hue_angle_to_hue_array(hue_angle):
+    """
+    Converts from hue angles arrays in degrees to the *Munsell* *Colorlab*
+    specification hues, element-wise equivalent of
+    :func:`colour.notation.munsell.hue_angle_to_hue` definition.
+    """
+
+    hue_angle = as_float_array(hue_angle)
+
+    single_hue = np.reshape(
+        LinearInterpolator((0, 45, 70, 135, 160, 225, 255, 315, 360),
+                           (0, 2, 3, 4, 5, 6, 8, 9, 10))(hue_angle),
+        hue_angle.shape)
+
+    code = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7])[np.searchsorted(
+        np.arange(0.5, 10, 1), single_hue)]
+
+    hue = (10 * (single_hue % 1) + 5) % 10
+    hue = np.where(hue == 0, 10, hue)
+
+    return hue, code
+
+
+def _hue_to_ASTM_hue_array(hue, code):
+    """
+    Converts from the *Munsell* *Colorlab* specification hues arrays to *ASTM*
+    hue numbers, element-wise equivalent of
+    :func:`colour.notation.munsell.hue_to_ASTM_hue` definition.
+    """
+
+    ASTM_hue = 10 * ((7 - as_float_array(code)) % 10) + as_float_array(hue)
+
+    return np.where(ASTM_hue == 0, 100, ASTM_hue)
+
+
+def _xy_from_renotation_ovoid_array(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications arrays to *xy*
+    chromaticity coordinates on *Munsell Renotation System* ovoid,
+    element-wise equivalent of
+    :func:`colour.notation.munsell.xy_from_renotation_ovoid` definition.
+    Specifications without renotation data return *NaN*.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, chroma, code)])
+
+    zero = hue == 0
+    hue = np.where(zero, 10, hue)
+    code = np.where(zero, (code + 1) % 10, code)
+    value = np.around(value)
+    chroma = 2 * np.around(chroma / 2)
+
+    x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    # Checking if renotation data is available without interpolation using
+    # given threshold.
+    threshold = 1e-7
+    exact = np.zeros(hue.shape, dtype=np.bool_)
+    for hue_exact in (0, 2.5, 5, 7.5, 10):
+        exact = np.logical_or(exact, np.abs(hue - hue_exact) < threshold)
+
+    x_exact, y_exact, _Y_exact = tsplit(
+        _xyY_from_renotation_array(2.5 * np.around(hue / 2.5), value, chroma,
+                                   code))
+
+    (hue_minus, code_minus), (hue_plus, code_plus) = (
+        _bounding_hues_from_renotation_array(hue, code))
+
+    x_minus, y_minus, _Y_minus = tsplit(
+        _xyY_from_renotation_array(hue_minus, value, chroma, code_minus))
+    rho_minus, phi_minus = tsplit(
+        cartesian_to_polar(tstack([x_minus - x_grey, y_minus - y_grey])))
+    phi_minus = np.degrees(phi_minus)
+
+    x_plus, y_plus, _Y_plus = tsplit(
+        _xyY_from_renotation_array(hue_plus, value, chroma, code_plus))
+    rho_plus, phi_plus = tsplit(
+        cartesian_to_polar(tstack([x_plus - x_grey, y_plus - y_grey])))
+    phi_plus = np.degrees(phi_plus)
+
+    lower_hue_angle, hue_angle, upper_hue_angle = [
+        np.reshape(hue_to_hue_angle(hue_b, code_b), hue.shape)
+        for hue_b, code_b in ((hue_minus, code_minus), (hue, code),
+                              (hue_plus, code_plus))
+    ]
+
+    with np.errstate(invalid='ignore'):
+        phi_plus = np.where(phi_minus - phi_plus > 180, phi_plus + 360,
+                            phi_plus)
+
+        lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
+        wrap = lower_hue_angle > upper_hue_angle
+        hue_angle = np.where(
+            np.logical_and(wrap, ~(lower_hue_angle > hue_angle)),
+            hue_angle - 360, hue_angle)
+        lower_hue_angle = np.where(wrap, lower_hue_angle - 360,
+                                   lower_hue_angle)
+
+    def index(a, count):
+        """
+        Converts given array to interpolation methods table indexes.
+        """
+
+        return np.clip(np.nan_to_num(a), 0, count - 1).astype(
+            DEFAULT_INT_DTYPE)
+
+    interpolation_method = _munsell_interpolation_methods_table()[
+        index(value - 1, 9),
+        index(chroma / 2 - 1, 25),
+        index(np.floor(_hue_to_ASTM_hue_array(hue, code) / 2.5), 40)]
+
+    x_linear = _interpolate_linear(hue_angle, lower_hue_angle,
+                                   upper_hue_angle, x_minus, x_plus)
+    y_linear = _interpolate_linear(hue_angle, lower_hue_angle,
+                                   upper_hue_angle, y_minus, y_plus)
+
+    theta = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                                phi_minus, phi_plus)
+    rho = _interpolate_linear(hue_angle, lower_hue_angle, upper_hue_angle,
+                              rho_minus, rho_plus)
+    x_radial, y_radial = tsplit(
+        polar_to_cartesian(tstack([rho, np.radians(theta)])) +
+        as_float_array([x_grey, y_grey]))
+
+    x = np.select([interpolation_method == 1, interpolation_method == 2],
+                  [x_linear, x_radial], np.nan)
+    y = np.select([interpolation_method == 1, interpolation_method == 2],
+                  [y_linear, y_radial], np.nan)
+
+    x = np.where(exact, x_exact, x)
+    y = np.where(exact, y_exact, y)
+
+    grey = chroma == 0
+    x = np.where(grey, x_grey, x)
+    y = np.where(grey, y_grey, y)
+
+    return tstack([x, y])
+
+
+def _munsell_specification_to_xy_array(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications arrays with integer
+    *Munsell* value to *xy* chromaticity coordinates, element-wise equivalent
+    of :func:`colour.notation.munsell.munsell_specification_to_xy` definition.
+    """
+
+    chroma = as_float_array(chroma)
+    value = np.around(value)
+
+    even = chroma % 2 == 0
+    chroma_minus = np.where(even, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(even, chroma, chroma_minus + 2)
+
+    # Smallest chroma ovoid collapses to illuminant chromaticity coordinates.
+    x_minus, y_minus = tsplit(
+        _xy_from_renotation_ovoid_array(hue, value, chroma_minus, code))
+    x_plus, y_plus = tsplit(
+        _xy_from_renotation_ovoid_array(hue, value, chroma_plus, code))
+
+    same = chroma_minus == chroma_plus
+    x = np.where(
+        same, x_minus,
+        _interpolate_linear(chroma, chroma_minus, chroma_plus, x_minus,
+                            x_plus))
+    y = np.where(
+        same, y_minus,
+        _interpolate_linear(chroma, chroma_minus, chroma_plus, y_minus,
+                            y_plus))
+
+    return tstack([x, y])
+
+
+def _munsell_specification_to_xyY_array(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications arrays to *CIE xyY*
+    colourspace, element-wise equivalent of
+    :func:`colour.notation.munsell_specification_to_xyY` definition for
+    chromatic specifications and reference domain-range scale.
+    """
+
+    value = as_float_array(value)
+
+    with domain_range_scale('ignore'):
+        Y = np.reshape(luminance_ASTMD153508(value), value.shape)
+
+    integer = np.abs(value - np.around(value)) <= INTEGER_THRESHOLD
+    value_minus = np.where(integer, np.around(value), np.floor(value))
+    value_plus = np.where(integer, np.around(value), value_minus + 1)
+
+    x_minus, y_minus = tsplit(
+        _munsell_specification_to_xy_array(hue, value_minus, chroma, code))
+    x_plus, y_plus = tsplit(
+        _munsell_specification_to_xy_array(hue, value_plus, chroma, code))
+
+    x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    x_plus = np.where(value_plus == 10, x_grey, x_plus)
+    y_plus = np.where(value_plus == 10, y_grey, y_plus)
+
+    with domain_range_scale('ignore'):
+        Y_minus = np.reshape(luminance_ASTMD153508(value_minus), value.shape)
+        Y_plus = np.reshape(luminance_ASTMD153508(value_plus), value.shape)
+
+    same = value_minus == value_plus
+    x = np.where(same, x_minus,
+                 _interpolate_linear(Y, Y_minus, Y_plus, x_minus, x_plus))
+    y = np.where(same, y_minus,
+                 _interpolate_linear(Y, Y_minus, Y_plus, y_minus, y_plus))
+
+    return tstack([x, y, Y / 100])
+
+
+def _LCHab_to_munsell_specification_array(LCHab):
+    """
+    Converts from *CIE L\\*C\\*Hab* colourspace arrays to approximate *Munsell*
+    *Colorlab* specifications, element-wise equivalent of
+    :func:`colour.notation.munsell.LCHab_to_munsell_specification` definition.
+    """
+
+    L, C, Hab = tsplit(LCHab)
+
+    code = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8])[np.searchsorted(
+        np.arange(36, 360, 36), Hab)]
+    code = np.where(Hab == 0, 8, code)
+
+    hue = np.reshape(LinearInterpolator((0, 36), (0, 10))(Hab % 36), Hab.shape)
+    hue = np.where(hue == 0, 10, hue)
+
+    return hue, L / 10, C / 5, code
+
+
+def _maximum_chroma_from_renotation_array(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas from *Munsell Renotation System*
+    data for given hues, values and codes arrays, element-wise equivalent of
+    :func:`colour.notation.munsell.maximum_chroma_from_renotation` definition.
+    """
+
+    hue, value, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, code)])
+
+    integer = value % 1 == 0
+    value_minus = np.where(integer, value, np.floor(value))
+    value_plus = np.where(integer, value, value_minus + 1)
+
+    (hue_cw, code_cw), (hue_ccw, code_ccw) = (
+        _bounding_hues_from_renotation_array(hue, code))
+
+    ma_limit_mcw = _maximum_chroma_from_renotation_index(
+        hue_cw, value_minus, code_cw)
+    ma_limit_mccw = _maximum_chroma_from_renotation_index(
+        hue_ccw, value_minus, code_ccw)
+    ma_limit_pcw = _maximum_chroma_from_renotation_index(
+        hue_cw, value_plus, code_cw)
+    ma_limit_pccw = _maximum_chroma_from_renotation_index(
+        hue_ccw, value_plus, code_ccw)
+
+    with domain_range_scale('ignore'):
+        L = np.reshape(luminance_ASTMD153508(value), value.shape)
+        L9 = luminance_ASTMD153508(9)
+        L10 = luminance_ASTMD153508(10)
+
+    maximum_chroma = np.where(
+        value_plus <= 9,
+        np.minimum(
+            np.minimum(ma_limit_mcw, ma_limit_mccw),
+            np.minimum(ma_limit_pcw, ma_limit_pccw)),
+        np.minimum(
+            _interpolate_linear(L, L9, L10, ma_limit_mcw, 0),
+            _interpolate_linear(L, L9, L10, ma_limit_mccw, 0)))
+
+    # Ideal white, no chroma.
+    return np.where(value >= 9.99, 0, maximum_chroma)
+
+
+def _xyY_to_munsell_specification_array(xyY, raise_exception=False):
+    """
+    Converts from *CIE xyY* colourspace arrays to *Munsell* *Colorlab*
+    specifications for reference domain-range scale.
+
+    All the samples are iterated simultaneously, each one leaving the
+    computations as soon as it converges. Grey samples are returned as
+    *[NaN, value, NaN, NaN]* specifications and the samples having reached
+    the maximum iterations count without converging as *NaN* specifications.
+
+    Parameters
+    ----------
+    xyY : array_like, (N, 3)
+        *CIE xyY* colourspace array.
+    raise_exception : bool, optional
+        Whether to raise an exception if the maximum iterations count has been
+        reached without converging to a result for any sample.
+
+    Returns
+    -------
+    ndarray, (N, 4)
+        *Munsell* *Colorlab* specifications.
+
+    Raises
+    ------
+    RuntimeError
+        If ``raise_exception`` is *True* and the maximum iterations count has
+        been reached without converging to a result for any sample.
+    """
+
+    x, y, Y = tsplit(xyY)
+
+    with domain_range_scale('ignore'):
+        value = np.reshape(munsell_value_ASTMD153508(Y * 100), Y.shape)
+
+    value = np.where(
+        np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+        np.around(value), value)
+
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    def polar(x_p, y_p):
+        """
+        Returns given *xy* chromaticity coordinates radial distance and angle
+        in degrees about the achromatic point.
+        """
+
+        rho_p, phi_p = tsplit(
+            cartesian_to_polar(tstack([x_p - x_center, y_p - y_center])))
+
+        return rho_p, np.degrees(phi_p)
+
+    def angle_difference(a):
+        """
+        Wraps given angles differences to domain (-180, 180].
+        """
+
+        a = a % 360
+
+        return np.where(a > 180, a - 360, a)
+
+    def xy(hue, value, chroma, code):
+        """
+        Returns given *Munsell* *Colorlab* specifications arrays *xy*
+        chromaticity coordinates.
+        """
+
+        return tsplit(
+            _munsell_specification_to_xyY_array(hue, value, chroma,
+                                                code)[..., 0:2])
+
+    rho_input, phi_input = polar(x, y)
+
+    grey_threshold = 1e-7
+    grey = rho_input < grey_threshold
+
+    with domain_range_scale('ignore'), np.errstate(
+            divide='ignore', invalid='ignore'):
+        xi, yi = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+        Xr, Yr, Zr = tsplit(
+            xyY_to_XYZ(tstack([np.full(Y.shape, xi),
+                               np.full(Y.shape, yi), Y])))
+        XYZr = tstack([(1 / Yr) * Xr, np.ones(Y.shape), (1 / Yr) * Zr])
+
+        Lab = XYZ_to_Lab(xyY_to_XYZ(tstack([x, y, Y])), XYZ_to_xy(XYZr))
+        hue_initial, _value_initial, chroma_initial, code_initial = (
+            _LCHab_to_munsell_specification_array(Lab_to_LCHab(Lab)))
+
+    hue_s = hue_initial
+    chroma_s = (5 / 5.5) * chroma_initial
+    code_s = code_initial
+
+    specification = tstack([
+        np.full(value.shape, np.nan), value,
+        np.full(value.shape, np.nan),
+        np.full(value.shape, np.nan)
+    ])
+    pending = ~grey
+
+    convergence_threshold = 1e-7
+    iterations_maximum = 64
+    iterations_maximum_inner = 16
+
+    def converge(i, hue, chroma, code):
+        """
+        Stores the specifications of the samples at given indexes having
+        converged and returns the indexes of those that have not.
+        """
+
+        x_current, y_current = xy(hue, value[i], chroma, code)
+        difference = np.hypot(x[i] - x_current, y[i] - y_current)
+
+        converged = difference < convergence_threshold
+        specification[i[converged]] = tstack(
+            [hue, value[i], chroma, code])[converged]
+        pending[i[converged]] = False
+
+        return i[~converged]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _iteration in range(iterations_maximum + 1):
+            i = np.where(pending)[0]
+            if i.size == 0:
+                break
+
+            hue_current, chroma_current, code_current = (hue_s[i],
+                                                         chroma_s[i],
+                                                         code_s[i])
+            hue_angle_current = np.reshape(
+                hue_to_hue_angle(hue_current, code_current), i.shape)
+
+            chroma_maximum = _maximum_chroma_from_renotation_array(
+                hue_current, value[i], code_current)
+            chroma_current = np.where(chroma_current > chroma_maximum,
+                                      chroma_maximum, chroma_current)
+
+            _rho_current, phi_current = polar(*xy(
+                hue_current, value[i], chroma_current, code_current))
+            phi_current_difference = angle_difference(360 - phi_input[i] +
+                                                      phi_current)
+
+            hue_angle_inner = (
+                hue_angle_current + (phi_input[i] - phi_current)) % 360
+            hue_angle_difference_inner = angle_difference(phi_input[i] -
+                                                          phi_current)
+            hue_inner, code_inner = _hue_angle_to_hue_array(hue_angle_inner)
+
+            _rho_inner, phi_inner = polar(*xy(hue_inner, value[i],
+                                              chroma_current, code_inner))
+            phi_inner_difference = angle_difference(360 - phi_input[i] +
+                                                    phi_inner)
+
+            # Linear extrapolation of the hue angle difference nulling the
+            # "phi" difference.
+            hue_angle_difference_new = (
+                hue_angle_difference_inner * phi_current_difference /
+                (phi_current_difference - phi_inner_difference)) % 360
+            hue_angle_new = (
+                hue_angle_current + hue_angle_difference_new) % 360
+            hue_new, code_new = _hue_angle_to_hue_array(hue_angle_new)
+
+            hue_s[i], chroma_s[i], code_s[i] = (hue_new, chroma_current,
+                                                code_new)
+
+            i = converge(i, hue_new, chroma_current, code_new)
+            if i.size == 0:
+                continue
+
+            hue_current, chroma_current, code_current = (hue_s[i],
+                                                         chroma_s[i],
+                                                         code_s[i])
+            chroma_maximum = _maximum_chroma_from_renotation_array(
+                hue_current, value[i], code_current)
+            chroma_current = np.where(chroma_current > chroma_maximum,
+                                      chroma_maximum, chroma_current)
+
+            rho_current, _phi_current = polar(*xy(
+                hue_current, value[i], chroma_current, code_current))
+
+            rho_bounds = np.full((i.size, iterations_maximum_inner + 1),
+                                 np.nan)
+            chroma_bounds = np.full((i.size, iterations_maximum_inner + 1),
+                                    np.nan)
+            rho_bounds[..., 0] = rho_current
+            chroma_bounds[..., 0] = chroma_current
+            rho_minimum = rho_maximum = rho_current
+            bounded = np.zeros(i.size, dtype=np.bool_)
+
+            for iterations_inner in range(1, iterations_maximum_inner + 1):
+                j = np.where(~bounded)[0]
+                if j.size == 0:
+                    break
+
+                chroma_inner = (((rho_input[i][j] / rho_current[j]) **
+                                 iterations_inner) * chroma_current[j])
+                chroma_inner = np.where(chroma_inner > chroma_maximum[j],
+                                        chroma_maximum[j], chroma_inner)
+
+                rho_inner, _phi_inner = polar(*xy(
+                    hue_current[j], value[i][j], chroma_inner,
+                    code_current[j]))
+
+                rho_bounds[j, iterations_inner] = rho_inner
+                chroma_bounds[j, iterations_inner] = chroma_inner
+
+                rho_minimum = np.fmin(rho_minimum,
+                                      rho_bounds[..., iterations_inner])
+                rho_maximum = np.fmax(rho_maximum,
+                                      rho_bounds[..., iterations_inner])
+                bounded = np.logical_and(rho_minimum < rho_input[i],
+                                         rho_input[i] < rho_maximum)
+
+            if not np.all(bounded):
+                if raise_exception:
+                    raise RuntimeError(('Maximum inner iterations count '
+                                        'reached without convergence!'))
+
+                specification[i[~bounded]] = np.nan
+                pending[i[~bounded]] = False
+
+                i = i[bounded]
+                if i.size == 0:
+                    continue
+
+                hue_current, code_current = (hue_current[bounded],
+                                             code_current[bounded])
+                rho_bounds, chroma_bounds = (rho_bounds[bounded],
+                                             chroma_bounds[bounded])
+
+            samples = np.arange(i.size)
+            indexes = rho_bounds.argsort(axis=-1)
+            rho_bounds = rho_bounds[samples[:, np.newaxis], indexes]
+            chroma_bounds = chroma_bounds[samples[:, np.newaxis], indexes]
+
+            k = np.clip(
+                np.sum(rho_bounds <= rho_input[i][:, np.newaxis], axis=-1) -
+                1, 0, iterations_maximum_inner - 1)
+            chroma_new = _interpolate_linear(
+                rho_input[i], rho_bounds[samples, k],
+                rho_bounds[samples, k + 1], chroma_bounds[samples, k],
+                chroma_bounds[samples, k + 1])
+
+            chroma_s[i] = chroma_new
+
+            converge(i, hue_current, chroma_new, code_current)
+
+    if np.any(pending):
+        if raise_exception:
+            raise RuntimeError('Maximum outside iterations count reached '
+                               'without convergence!')
+
+        specification[pending] = np.nan
+
+    return specification
@@ -1407,6 +1407,62 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
                 rtol=0.00001,
                 atol=0.00001)
 
+    def test_n_dimensional_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition n-dimensional arrays support.
+        """
+
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+        specification = np.array([
+            specification for specification, _xyY in MUNSELL_SPECIFICATIONS
+        ])
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
+        xyY = np.reshape(xyY, (4, 25, 3))
+        specification = np.reshape(specification, (4, 25, 4))
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
+        xyY = np.array(
+            [xyY for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        specification = np.array([[np.nan, specification[0], np.nan, np.nan]
+                                  for specification, _xyY in
+                                  MUNSELL_GREYS_SPECIFICATIONS])
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
+    def test_raise_exception_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition raised exception and non-converging samples handling.
+        """
+
+        xyY_n_c = np.array([0.30549140, 0.33789886, 0.00902083])
+
+        self.assertRaises(RuntimeError, xyY_to_munsell_specification, xyY_n_c)
+
+        specification_g, xyY_g = MUNSELL_SPECIFICATIONS[0]
+        xyY = np.array([xyY_g, xyY_n_c, xyY_g])
+        specification = np.array([
+            specification_g, [np.nan, np.nan, np.nan, np.nan], specification_g
+        ])
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
     def test_domain_range_scale_munsell_specification_to_xyY(self):
         """
         Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -1594,6 +1650,26 @@ class Test_xyY_fromRenotation(unittest.TestCase):
             xyY_from_renotation((7.5, 0.2, 2.0, 4)),
             np.array([0.262, 0.837, 0.237]))
 
+    def test_raise_exception_xyY_from_renotation(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_from_renotation`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, xyY_from_renotation, (3.2, 5, 4, 4))
+
+        self.assertRaises(ValueError, xyY_from_renotation, (2.5, 5.5, 4, 4))
+
+        self.assertRaises(ValueError, xyY_from_renotation, 5.0)
+
+        # Specifications on the renotation grid axes but without data.
+        self.assertRaises(ValueError, xyY_from_renotation, (5.0, 8, 30, 4))
+
+        self.assertRaises(ValueError, xyY_from_renotation, (10, 1, 12, 2))
+
+        self.assertRaises(ValueError, munsell_specification_to_xyY,
+                          (5.0, 8, 30, 4))
+
 
 class TestIsSpecificationInRenotation(unittest.TestCase):
     """
@@ -1613,6 +1689,8 @@ class TestIsSpecificationInRenotation(unittest.TestCase):
 
         self.assertFalse(is_specification_in_renotation((25.0, 0.2, 2.0, 4)))
 
+        self.assertFalse(is_specification_in_renotation((5.0, 8, 30, 4)))
+
 
 class TestBoundingHuesFromRenotation(unittest.TestCase):
     """
@@ -1766,6 +1844,15 @@ class TestMaximumChromaFromRenotation(unittest.TestCase):
 
         self.assertEqual(maximum_chroma_from_renotation(6.875, 3.425, 1), 16.0)
 
+    def test_raise_exception_maximum_chroma_from_renotation(self):
+        """
+        Tests :func:`colour.notation.munsell.maximum_chroma_from_renotation`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, maximum_chroma_from_renotation, 2.5, 5,
+                          0)
+
 
 class TestMunsellSpecification_to_xy(unittest.TestCase):
     """
@@ -8,6 +8,9 @@ from .cct import (CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968,
                   CCT_to_uv_Krystek1985)
 from .cct import uv_to_CCT
 from .cct import (uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968)
+from .cct import PLANCKIAN_LOCUS_CACHE, PlanckianLocus
+from .cct import (planckian_locus, read_planckian_locus,
+                  write_planckian_locus)
 from .cct import CCT_TO_XY_METHODS, XY_TO_CCT_METHODS
 from .cct import CCT_to_xy
 from .cct import CCT_to_xy_Kang2002, CCT_to_xy_CIE_D
@@ -18,6 +21,8 @@ __all__ = [
     'CCT_TO_UV_METHODS', 'UV_TO_CCT_METHODS', 'CCT_to_uv',
     'CCT_to_uv_Ohno2013', 'CCT_to_uv_Robertson1968', 'CCT_to_uv_Krystek1985',
     'uv_to_CCT', 'uv_to_CCT_Ohno2013', 'uv_to_CCT_Robertson1968',
+    'PLANCKIAN_LOCUS_CACHE', 'PlanckianLocus', 'planckian_locus',
+    'read_planckian_locus', 'write_planckian_locus',
     'CCT_TO_XY_METHODS', 'XY_TO_CCT_METHODS', 'CCT_to_xy',
     'CCT_to_xy_Kang2002', 'CCT_to_xy_CIE_D', 'xy_to_CCT',
     'xy_to_CCT_McCamy1992', 'xy_to_CCT_Hernandez1999'
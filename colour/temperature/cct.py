@@ -12,6 +12,11 @@ Defines correlated colour temperature :math:`T_{cp}` computations objects:
 -   :func:`colour.temperature.CCT_to_uv_Ohno2013`: *CIE UCS* colourspace *uv*
     chromaticity coordinates computation of given correlated colour temperature
     :math:`T_{cp}`, :math:`\\Delta_{uv}` using *Ohno (2013)* method.
+-   :class:`colour.temperature.PlanckianLocus`: Planckian locus spatially
+    indexed for correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}` computation using nearest neighbour lookups.
+-   :func:`colour.temperature.planckian_locus`: Cached planckian locus
+    computation for given colour matching functions.
 -   :func:`colour.temperature.uv_to_CCT_Robertson1968`: Correlated colour
     temperature :math:`T_{cp}` and :math:`\\Delta_{uv}` computation of given
     *CIE UCS* colourspace *uv* chromaticity coordinates using
@@ -86,16 +91,18 @@ dng_temperature.cpp::dng_temperature::xy_coord. Retrieved from
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
 from collections import namedtuple
+from scipy.spatial import cKDTree
+from six import text_type
 
 from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
-                                STANDARD_OBSERVERS_CMFS, blackbody_spd,
-                                spectral_to_XYZ)
+                                STANDARD_OBSERVERS_CMFS, planck_law)
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              as_float, filter_kwargs, tsplit, tstack,
-                              warning)
+from colour.utilities import (CaseInsensitiveMapping, LRUCache,
+                              as_float_array, as_float, filter_kwargs,
+                              is_string, tsplit, tstack, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -106,10 +113,14 @@ __status__ = 'Production'
 
 __all__ = [
     'PLANCKIAN_TABLE_TUVD', 'CCT_MINIMAL', 'CCT_MAXIMAL', 'CCT_SAMPLES',
-    'CCT_CALCULATION_ITERATIONS', 'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
+    'CCT_CALCULATION_ITERATIONS', 'PLANCKIAN_LOCUS_SAMPLES',
+    'PLANCKIAN_LOCUS_CACHE', 'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
     'ROBERTSON_ISOTEMPERATURE_LINES_RUVT', 'ROBERTSON_ISOTEMPERATURE_LINES',
+    'ROBERTSON_ISOTEMPERATURE_LINES_ARRAY',
     'planckian_table', 'planckian_table_minimal_distance_index',
-    'uv_to_CCT_Ohno2013', 'CCT_to_uv_Ohno2013', 'uv_to_CCT_Robertson1968',
+    'uv_to_CCT_Ohno2013', 'CCT_to_uv_Ohno2013', 'PlanckianLocus',
+    'planckian_locus', 'write_planckian_locus', 'read_planckian_locus',
+    'uv_to_CCT_Robertson1968',
     'CCT_to_uv_Robertson1968', 'CCT_to_uv_Krystek1985', 'UV_TO_CCT_METHODS',
     'uv_to_CCT', 'CCT_TO_UV_METHODS', 'CCT_to_uv', 'xy_to_CCT_McCamy1992',
     'xy_to_CCT_Hernandez1999', 'CCT_to_xy_Kang2002', 'CCT_to_xy_CIE_D',
@@ -124,6 +135,30 @@ CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+_PLANCKIAN_UV_CHUNK_SIZE = 2 ** 12
+
+PLANCKIAN_LOCUS_SAMPLES = 2 ** 14
+"""
+Default samples count of the planckian loci built by
+:func:`colour.temperature.planckian_locus` definition.
+
+PLANCKIAN_LOCUS_SAMPLES : int
+"""
+
+PLANCKIAN_LOCUS_CACHE = LRUCache(maximum_bytes=2 ** 24)
+PLANCKIAN_LOCUS_CACHE.__doc__ = """
+Planckian loci cache used by :func:`colour.temperature.planckian_locus`
+definition.
+
+The planckian loci are keyed by a digest of the colour matching functions
+spectral data and the temperature range and samples count, the least recently
+used planckian loci are discarded when the cache bytes size exceeds its
+:attr:`colour.utilities.LRUCache.maximum_bytes` attribute value, 16 MiB by
+default.
+
+PLANCKIAN_LOCUS_CACHE : LRUCache
+"""
+
 ROBERTSON_ISOTEMPERATURE_LINES_DATA = (
     (0, 0.18006, 0.26352, -0.24341),
     (10, 0.18066, 0.26589, -0.25479),
@@ -183,6 +218,60 @@ ROBERTSON_ISOTEMPERATURE_LINES = [
     for x in ROBERTSON_ISOTEMPERATURE_LINES_DATA
 ]
 
+ROBERTSON_ISOTEMPERATURE_LINES_ARRAY = np.array(
+    ROBERTSON_ISOTEMPERATURE_LINES_DATA)
+"""
+*Robertson (1968)* iso-temperature lines as an array, used by the vectorised
+:func:`colour.temperature.uv_to_CCT_Robertson1968` and
+:func:`colour.temperature.CCT_to_uv_Robertson1968` definitions.
+
+ROBERTSON_ISOTEMPERATURE_LINES_ARRAY : ndarray
+"""
+
+
+def _planckian_uv(T, cmfs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures using given colour matching
+    functions.
+
+    Parameters
+    ----------
+    T : array_like
+        Temperatures in kelvins.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions, already trimmed to the
+        wavelengths range of interest.
+
+    Returns
+    -------
+    ndarray
+        *uv* chromaticity coordinates.
+
+    Notes
+    -----
+    -   The *CIE XYZ* tristimulus values are computed with a single matrix
+        product between the planckian radiators spectral radiance and the
+        colour matching functions, the temperatures are processed by chunks of
+        :attr:`colour.temperature.cct._PLANCKIAN_UV_CHUNK_SIZE` values to bound
+        the transient memory usage.
+    """
+
+    T = as_float_array(T)
+
+    wavelengths = cmfs.wavelengths[np.newaxis, ...] * 1e-9
+    T_f = np.ravel(T)[..., np.newaxis]
+
+    XYZ = np.empty([T_f.shape[0], 3])
+    for i in range(0, T_f.shape[0], _PLANCKIAN_UV_CHUNK_SIZE):
+        XYZ[i:i + _PLANCKIAN_UV_CHUNK_SIZE] = np.dot(
+            planck_law(wavelengths, T_f[i:i + _PLANCKIAN_UV_CHUNK_SIZE]),
+            cmfs.values)
+
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
+
+    return np.reshape(uv, T.shape + (2, ))
+
 
 def planckian_table(uv, cmfs, start, end, count):
     """
@@ -242,17 +331,11 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
 
     cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
 
-    shape = cmfs.shape
+    Ti = np.linspace(start, end, count)
+    ui, vi = tsplit(_planckian_uv(Ti, cmfs))
+    di = np.hypot(ux - ui, vx - vi)
 
-    table = []
-    for Ti in np.linspace(start, end, count):
-        spd = blackbody_spd(Ti, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ /= np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.hypot(ux - ui, vx - vi)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
+    table = [PLANCKIAN_TABLE_TUVD(*x) for x in zip(Ti, ui, vi, di)]
 
     return table
 
@@ -286,6 +369,67 @@ def planckian_table_minimal_distance_index(planckian_table_):
     return distances.index(min(distances))
 
 
+def _planckian_table_solution(vx, Tuvdip, Tuvdi, Tuvdin):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}` from given *CIE UCS* colourspace *v* chromaticity
+    coordinate and the planckian table rows surrounding the minimal distance
+    index using *Ohno (2013)* method triangular and parabolic solutions.
+
+    Parameters
+    ----------
+    vx : array_like
+        *CIE UCS* colourspace *v* chromaticity coordinate.
+    Tuvdip : tuple
+        Planckian table row :math:`T_i`, :math:`u_i`, :math:`v_i`,
+        :math:`d_i` preceding the minimal distance index.
+    Tuvdi : tuple
+        Planckian table row at the minimal distance index.
+    Tuvdin : tuple
+        Planckian table row following the minimal distance index.
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
+
+    References
+    ----------
+    :cite:`Ohno2014a`
+    """
+
+    Tip, uip, vip, dip = Tuvdip
+    Ti, _ui, _vi, di = Tuvdi
+    Tin, uin, vin, din = Tuvdin
+
+    # Triangular solution.
+    l = np.hypot(uin - uip, vin - vip)  # noqa
+    x = (dip ** 2 - din ** 2 + l ** 2) / (2 * l)
+    T = Tip + (Tin - Tip) * (x / l)
+
+    vtx = vip + (vin - vip) * (x / l)
+    sign = np.where(vx - vtx >= 0, 1, -1)
+    D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
+
+    # Parabolic solution.
+    parabolic = np.abs(D_uv) >= 0.002
+    if np.any(parabolic):
+        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+               (di - dip)) * X ** -1)
+        c = (-(dip * (Tin - Ti) * Ti * Tin + di *
+               (Tip - Tin) * Tip * Tin + din *
+               (Ti - Tip) * Tip * Ti) * X ** -1)
+
+        T_p = -b / (2 * a)
+
+        T = np.where(parabolic, T_p, T)
+        D_uv = np.where(parabolic, sign * (a * T_p ** 2 + b * T_p + c), D_uv)
+
+    return tstack([T, D_uv])
+
+
 def uv_to_CCT_Ohno2013(
         uv,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
@@ -306,7 +450,8 @@ def uv_to_CCT_Ohno2013(
     Parameters
     ----------
     uv : array_like
-        *CIE UCS* colourspace *uv* chromaticity coordinates.
+        *CIE UCS* colourspace *uv* chromaticity coordinates, the last axis is
+        expected to be of size 2, e.g. (N, 2).
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
     start : numeric, optional
@@ -323,6 +468,13 @@ def uv_to_CCT_Ohno2013(
     ndarray
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
 
+    Notes
+    -----
+    -   The planckian tables of all the given *uv* chromaticity coordinates are
+        generated at once for each cascade expansion iteration, the planckian
+        radiators chromaticity coordinates being computed with a single matrix
+        product against the colour matching functions.
+
     References
     ----------
     :cite:`Ohno2014a`
@@ -334,60 +486,56 @@ def uv_to_CCT_Ohno2013(
     >>> uv = np.array([0.1978, 0.3122])
     >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
     array([  6.5074738...e+03,   3.2233461...e-03])
+    >>> uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+    >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
+    array([[  6.5074738...e+03,   3.2233461...e-03],
+           [  1.0416831...e+03,  -6.7378021...e-02]])
     """
 
+    uv = as_float_array(uv)
+
+    shape = uv.shape
+    ux, vx = tsplit(np.reshape(uv, [-1, 2]))
+
+    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+
     # Ensuring we do at least one iteration to initialise variables.
     iterations = max(iterations, 1)
 
-    # Planckian table creation through cascade expansion.
+    start = np.full(ux.shape, start, dtype=np.float_)
+    end = np.full(ux.shape, end, dtype=np.float_)
+    samples = np.arange(ux.shape[0])
+
+    # Planckian tables creation through cascade expansion, the tables of all
+    # the samples are generated at once.
     for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+        Ti = np.linspace(0, 1, count) * (end - start)[..., np.newaxis]
+        Ti += start[..., np.newaxis]
+        Ti[..., -1] = end
+        ui, vi = tsplit(_planckian_uv(Ti, cmfs))
+        di = np.hypot(ux[..., np.newaxis] - ui, vx[..., np.newaxis] - vi)
+
+        index = np.argmin(di, axis=-1)
+        if np.any(index == 0):
             warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+        if np.any(index == count - 1):
             warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
+        index = np.clip(index, 1, count - 2)
 
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+        start = Ti[samples, index - 1]
+        end = Ti[samples, index + 1]
 
-    _ux, vx = uv
+    Tuvdip, Tuvdi, Tuvdin = [
+        tuple(x[samples, index + i] for x in (Ti, ui, vi, di))
+        for i in (-1, 0, 1)
+    ]
 
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
-
-    # Triangular solution.
-    l = np.hypot(uin - uip, vin - vip)  # noqa
-    x = (dip ** 2 - din ** 2 + l ** 2) / (2 * l)
-    T = Tip + (Tin - Tip) * (x / l)
-
-    vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
-    D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
-
-    # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (-(dip * (Tin - Ti) * Ti * Tin + di *
-               (Tip - Tin) * Tip * Tin + din *
-               (Ti - Tip) * Tip * Ti) * X ** -1)
-
-        T = -b / (2 * a)
-
-        D_uv = sign * (a * T ** 2 + b * T + c)
-
-    return np.array([T, D_uv])
+    return np.reshape(
+        _planckian_table_solution(vx, Tuvdip, Tuvdi, Tuvdin), shape)
 
 
 def CCT_to_uv_Ohno2013(
@@ -401,9 +549,9 @@ def CCT_to_uv_Ohno2013(
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric, optional
+    D_uv : numeric or array_like, optional
         :math:`\\Delta_{uv}`.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -427,34 +575,368 @@ def CCT_to_uv_Ohno2013(
     array([ 0.1977999...,  0.3122004...])
     """
 
-    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+    CCT = as_float_array(CCT)
+    D_uv = as_float_array(D_uv)
 
-    shape = cmfs.shape
+    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
 
     delta = 0.01
 
-    spd = blackbody_spd(CCT, shape)
-    XYZ = spectral_to_XYZ(spd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
-    UVW = XYZ_to_UCS(XYZ)
-    u0, v0 = UCS_to_uv(UVW)
+    u0, v0 = tsplit(_planckian_uv(CCT, cmfs))
+    u1, v1 = tsplit(_planckian_uv(CCT + delta, cmfs))
 
-    if D_uv == 0:
-        return np.array([u0, v0])
-    else:
-        spd = blackbody_spd(CCT + delta, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        u1, v1 = UCS_to_uv(UVW)
+    du = u0 - u1
+    dv = v0 - v1
 
-        du = u0 - u1
-        dv = v0 - v1
+    u = u0 - D_uv * (dv / np.hypot(du, dv))
+    v = v0 + D_uv * (du / np.hypot(du, dv))
 
-        u = u0 - D_uv * (dv / np.hypot(du, dv))
-        v = v0 + D_uv * (du / np.hypot(du, dv))
+    return tstack([u, v])
 
-        return np.array([u, v])
+
+class PlanckianLocus(object):
+    """
+    Defines a planckian locus densely sampled in temperature and indexed
+    spatially in the *CIE UCS* colourspace *uv* chromaticity diagram so that
+    the correlated colour temperature :math:`T_{cp}` and :math:`\\Delta_{uv}`
+    of given *uv* chromaticity coordinates are computed with a nearest
+    neighbour lookup instead of the *Ohno (2013)* method planckian tables
+    generation.
+
+    Parameters
+    ----------
+    table : array_like
+        Planckian locus table, i.e. :math:`T_i`, :math:`u_i`, :math:`v_i`
+        samples sorted by temperature, with shape (n, 3).
+    name : unicode, optional
+        Planckian locus name.
+
+    Attributes
+    ----------
+    table
+    name
+    nbytes
+
+    Methods
+    -------
+    __repr__
+    uv_to_CCT
+
+    Notes
+    -----
+    -   The nearest sample is located with a :class:`scipy.spatial.cKDTree`
+        class instance in :math:`O(\\log n)`, the triangular and parabolic
+        solutions of *Ohno (2013)* method are then applied to the samples
+        surrounding it.
+    -   The precision is defined by the samples density, see
+        :func:`colour.temperature.planckian_locus` definition.
+
+    References
+    ----------
+    :cite:`Ohno2014a`
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> locus = planckian_locus(cmfs)
+    >>> locus.table.shape
+    (16384, 3)
+    >>> locus.uv_to_CCT(np.array([0.1978, 0.3122]))  # doctest: +ELLIPSIS
+    array([  6.5074...e+03,   3.2233...e-03])
+    """
+
+    def __init__(self, table, name=None):
+        self._table = None
+        self._tree = None
+        self.table = table
+
+        self._name = '{0} ({1})'.format(self.__class__.__name__, id(self))
+        self.name = name
+
+    @property
+    def table(self):
+        """
+        Getter and setter property for the planckian locus table.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the planckian locus table with.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus table.
+        """
+
+        return self._table
+
+    @table.setter
+    def table(self, value):
+        """
+        Setter for the **self.table** property.
+        """
+
+        value = as_float_array(value)
+
+        assert value.ndim == 2 and value.shape[-1] == 3, (
+            '"{0}" attribute: "{1}" shape is not (n, 3)!'.format(
+                'table', value.shape))
+
+        assert value.shape[0] >= 3, (
+            '"{0}" attribute: at least 3 samples are required!'.format(
+                'table'))
+
+        self._table = value
+        self._tree = cKDTree(value[..., 1:])
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the planckian locus name.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the planckian locus name with.
+
+        Returns
+        -------
+        unicode
+            Planckian locus name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for the **self.name** property.
+        """
+
+        if value is not None:
+            assert is_string(value), (('"{0}" attribute: "{1}" type is not '
+                                       '"str" or "unicode"!').format(
+                                           'name', value))
+            self._name = value
+
+    @property
+    def nbytes(self):
+        """
+        Getter property for the planckian locus table bytes size.
+
+        Returns
+        -------
+        int
+            Planckian locus table bytes size.
+        """
+
+        return self._table.nbytes
+
+    def __repr__(self):
+        """
+        Returns a formatted string representation of the planckian locus.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return '{0}(name="{1}", samples={2})'.format(
+            self.__class__.__name__, self._name, self._table.shape[0])
+
+    def uv_to_CCT(self, uv):
+        """
+        Returns the correlated colour temperature :math:`T_{cp}` and
+        :math:`\\Delta_{uv}` from given *CIE UCS* colourspace *uv*
+        chromaticity coordinates.
+
+        Parameters
+        ----------
+        uv : array_like
+            *CIE UCS* colourspace *uv* chromaticity coordinates.
+
+        Returns
+        -------
+        ndarray
+            Correlated colour temperature :math:`T_{cp}`,
+            :math:`\\Delta_{uv}`.
+
+        Examples
+        --------
+        >>> from colour import STANDARD_OBSERVERS_CMFS
+        >>> cmfs = STANDARD_OBSERVERS_CMFS[
+        ...     'CIE 1931 2 Degree Standard Observer']
+        >>> locus = planckian_locus(cmfs)
+        >>> uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+        >>> locus.uv_to_CCT(uv)  # doctest: +ELLIPSIS
+        array([[  6.5074...e+03,   3.2233...e-03],
+               [  1.0416...e+03,  -6.7378...e-02]])
+        """
+
+        uv = as_float_array(uv)
+
+        shape = uv.shape
+        ux, vx = tsplit(np.reshape(uv, [-1, 2]))
+
+        _distance, index = self._tree.query(tstack([ux, vx]))
+        index = np.clip(index, 1, self._table.shape[0] - 2)
+
+        Ti, ui, vi = tsplit(self._table)
+        Tuvdip, Tuvdi, Tuvdin = [(Ti[index + i], ui[index + i], vi[index + i],
+                                  np.hypot(ux - ui[index + i],
+                                           vx - vi[index + i]))
+                                 for i in (-1, 0, 1)]
+
+        return np.reshape(
+            _planckian_table_solution(vx, Tuvdip, Tuvdi, Tuvdin), shape)
+
+
+def planckian_locus(
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        start=CCT_MINIMAL,
+        end=CCT_MAXIMAL,
+        samples=PLANCKIAN_LOCUS_SAMPLES):
+    """
+    Returns the planckian locus for given colour matching functions and
+    temperature range.
+
+    The planckian locus is sampled uniformly in reciprocal temperature, i.e.
+    mireds, and cached so that it is built only once for given colour matching
+    functions and parameters.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    start : numeric, optional
+        Temperature range start in kelvins.
+    end : numeric, optional
+        Temperature range end in kelvins.
+    samples : int, optional
+        Planckian locus samples count.
+
+    Returns
+    -------
+    PlanckianLocus
+        Planckian locus.
+
+    Notes
+    -----
+    -   The planckian loci are stored in
+        :attr:`colour.temperature.PLANCKIAN_LOCUS_CACHE` attribute keyed by a
+        digest of the colour matching functions spectral data and the given
+        parameters.
+    -   With default parameters, the correlated colour temperature
+        :math:`T_{cp}` relative error is lower than 5e-5 and the
+        :math:`\\Delta_{uv}` absolute error lower than 1e-6 compared to
+        :func:`colour.temperature.uv_to_CCT_Ohno2013` definition for
+        temperatures in domain [1100, 90000]. The error decreases with the
+        samples count.
+
+    References
+    ----------
+    :cite:`Ohno2014a`
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> locus = planckian_locus(cmfs, samples=1024)
+    >>> print(locus.name)
+    CIE 1931 2 Degree Standard Observer - 1000K - 100000K
+    >>> locus.table[0]  # doctest: +ELLIPSIS
+    array([  1.0000000...e+03,   4.4796288...e-01,   3.5462962...e-01])
+    """
+
+    digest = hashlib.sha1()
+    for array in (cmfs.wavelengths, cmfs.values, start, end, samples):
+        digest.update(np.ascontiguousarray(array, np.float64).tobytes())
+    key = digest.hexdigest()
+
+    locus = PLANCKIAN_LOCUS_CACHE.get(key)
+    if locus is None:
+        cmfs_t = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+
+        Ti = 1e6 / np.linspace(1e6 / start, 1e6 / end, samples)
+        ui, vi = tsplit(_planckian_uv(Ti, cmfs_t))
+        locus = PlanckianLocus(
+            tstack([Ti, ui, vi]), '{0} - {1}K - {2}K'.format(
+                cmfs.name, start, end))
+
+        PLANCKIAN_LOCUS_CACHE[key] = locus
+
+    return locus
+
+
+def write_planckian_locus(locus, path):
+    """
+    Writes given planckian locus to given *.npz* file path.
+
+    Parameters
+    ----------
+    locus : PlanckianLocus
+        Planckian locus to write.
+    path : unicode
+        File path.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> locus = planckian_locus(cmfs, samples=1024)
+    >>> path = os.path.join(tempfile.mkdtemp(), 'locus.npz')
+    >>> write_planckian_locus(locus, path)
+    True
+    """
+
+    with open(path, 'wb') as file_:
+        np.savez(file_, table=locus.table, name=np.array(locus.name))
+
+    return True
+
+
+def read_planckian_locus(path):
+    """
+    Reads the planckian locus from given *.npz* file path.
+
+    Parameters
+    ----------
+    path : unicode
+        File path.
+
+    Returns
+    -------
+    PlanckianLocus
+        Planckian locus.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> path = os.path.join(tempfile.mkdtemp(), 'locus.npz')
+    >>> write_planckian_locus(planckian_locus(cmfs, samples=1024), path)
+    True
+    >>> locus = read_planckian_locus(path)
+    >>> print(locus.name)
+    CIE 1931 2 Degree Standard Observer - 1000K - 100000K
+    >>> locus.table.shape
+    (1024, 3)
+    """
+
+    with np.load(path) as data:
+        return PlanckianLocus(data['table'], text_type(data['name']))
 
 
 def uv_to_CCT_Robertson1968(uv):
@@ -473,6 +955,13 @@ def uv_to_CCT_Robertson1968(uv):
     ndarray
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
 
+    Notes
+    -----
+    -   The signed distances to all the iso-temperature lines are computed
+        at once for all the given *uv* chromaticity coordinates, the
+        bracketing iso-temperature lines being located with vector
+        operations.
+
     References
     ----------
     :cite:`AdobeSystems2013`, :cite:`Wyszecki2000y`
@@ -484,57 +973,51 @@ def uv_to_CCT_Robertson1968(uv):
     array([  6.5000162...e+03,   8.3333289...e-03])
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
-
-        length = np.hypot(1, dv)
+    uv = as_float_array(uv)
 
-        du /= length
-        dv /= length
+    shape = uv.shape
+    u, v = tsplit(np.reshape(uv, [-1, 2]))
+    samples = np.arange(u.shape[0])
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    r_l, u_l, v_l, t_l = tsplit(ROBERTSON_ISOTEMPERATURE_LINES_ARRAY)
 
-        dt = -uu * dv + vv * du
+    # Iso-temperature lines unit direction vectors.
+    length = np.hypot(1, t_l)
+    du_l = 1 / length
+    dv_l = t_l / length
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    # Signed distances to the iso-temperature lines "1" to "30" computed with a
+    # single matrix product, the first non-positive distance locates the
+    # bracketing iso-temperature lines.
+    dt_l = np.dot(
+        tstack([u, v, np.ones(u.shape)]),
+        np.vstack([-dv_l, du_l, u_l * dv_l - v_l * du_l])[..., 1:])
+    crossed = dt_l <= 0
+    i = np.where(np.any(crossed, axis=-1), np.argmax(crossed, axis=-1) + 1, 30)
 
-            dt = -dt
+    dt = dt_l[samples, i - 1]
+    dt = -np.where(dt > 0, 0, dt)
+    last_dt = dt_l[samples, np.maximum(i - 2, 0)]
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.where(i == 1, 0, dt / (last_dt + dt))
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    T = 1.0e6 / (r_l[i - 1] * f + r_l[i] * (1 - f))
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    uu = u - (u_l[i - 1] * f + u_l[i] * (1 - f))
+    vv = v - (v_l[i - 1] * f + v_l[i] * (1 - f))
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    du = du_l[i] * (1 - f) + du_l[i - 1] * f
+    dv = dv_l[i] * (1 - f) + dv_l[i - 1] * f
 
-            length = np.hypot(du, dv)
+    length = np.hypot(du, dv)
 
-            du /= length
-            dv /= length
+    du /= length
+    dv /= length
 
-            D_uv = uu * du + vv * dv
+    D_uv = uu * du + vv * dv
 
-            break
-
-        last_dt = dt
-        last_du = du
-        last_dv = dv
-
-    return np.array([T, -D_uv])
+    return np.reshape(tstack([T, -D_uv]), shape)
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
@@ -545,9 +1028,9 @@ def CCT_to_uv_Robertson1968(CCT, D_uv=0):
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric
+    D_uv : numeric or array_like
         :math:`\\Delta_{uv}`.
 
     Returns
@@ -555,6 +1038,11 @@ def CCT_to_uv_Robertson1968(CCT, D_uv=0):
     ndarray
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
+    Notes
+    -----
+    -   The bracketing iso-temperature lines are located with
+        :func:`numpy.searchsorted` definition.
+
     References
     ----------
     :cite:`AdobeSystems2013a`, :cite:`Wyszecki2000y`
@@ -567,42 +1055,37 @@ def CCT_to_uv_Robertson1968(CCT, D_uv=0):
     array([ 0.1937413...,  0.3152210...])
     """
 
-    r = 1.0e6 / CCT
-
-    for i in range(30):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_next = ROBERTSON_ISOTEMPERATURE_LINES[i + 1]
+    CCT = as_float_array(CCT)
+    D_uv = as_float_array(D_uv)
 
-        if r < wr_ruvt_next.r or i == 29:
-            f = (wr_ruvt_next.r - r) / (wr_ruvt_next.r - wr_ruvt.r)
+    r = 1.0e6 / CCT
 
-            u = wr_ruvt.u * f + wr_ruvt_next.u * (1 - f)
-            v = wr_ruvt.v * f + wr_ruvt_next.v * (1 - f)
+    r_l, u_l, v_l, t_l = tsplit(ROBERTSON_ISOTEMPERATURE_LINES_ARRAY)
 
-            uu1 = uu2 = 1.0
-            vv1, vv2 = wr_ruvt.t, wr_ruvt_next.t
+    # Bracketing iso-temperature lines "i" and "i + 1".
+    i = np.clip(np.searchsorted(r_l[1:], r, side='right'), 0, 29)
 
-            length1 = np.hypot(1, vv1)
-            length2 = np.hypot(1, vv2)
+    f = (r_l[i + 1] - r) / (r_l[i + 1] - r_l[i])
 
-            uu1 /= length1
-            vv1 /= length1
+    u = u_l[i] * f + u_l[i + 1] * (1 - f)
+    v = v_l[i] * f + v_l[i + 1] * (1 - f)
 
-            uu2 /= length2
-            vv2 /= length2
+    length = np.hypot(1, t_l)
+    du_l = 1 / length
+    dv_l = t_l / length
 
-            uu3 = uu1 * f + uu2 * (1 - f)
-            vv3 = vv1 * f + vv2 * (1 - f)
+    uu3 = du_l[i] * f + du_l[i + 1] * (1 - f)
+    vv3 = dv_l[i] * f + dv_l[i + 1] * (1 - f)
 
-            len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
+    len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
 
-            uu3 /= len3
-            vv3 /= len3
+    uu3 /= len3
+    vv3 /= len3
 
-            u += uu3 * -D_uv
-            v += vv3 * -D_uv
+    u += uu3 * -D_uv
+    v += vv3 * -D_uv
 
-            return np.array([u, v])
+    return tstack([u, v])
 
 
 def CCT_to_uv_Krystek1985(CCT):
@@ -6,6 +6,9 @@ Defines unit tests for :mod:`colour.temperature.cct` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 from itertools import permutations
 
@@ -14,6 +17,9 @@ from colour.temperature import (
     CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968, CCT_to_uv_Krystek1985,
     uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968, CCT_to_xy_Kang2002,
     CCT_to_xy_CIE_D, xy_to_CCT_McCamy1992, xy_to_CCT_Hernandez1999)
+from colour.temperature import (PLANCKIAN_LOCUS_CACHE, PlanckianLocus,
+                                planckian_locus, read_planckian_locus,
+                                write_planckian_locus)
 from colour.temperature.cct import (planckian_table,
                                     planckian_table_minimal_distance_index)
 from colour.utilities import ignore_numpy_errors
@@ -27,7 +33,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestPlanckianTable', 'TestPlanckianTableMinimalDistanceIndex',
-    'Testuv_to_CCT_Ohno2013', 'TestCCT_to_uv_Ohno2013',
+    'Testuv_to_CCT_Ohno2013', 'TestCCT_to_uv_Ohno2013', 'TestPlanckianLocus',
+    'TestPlanckianLocusDefinition', 'TestReadWritePlanckianLocus',
     'Testuv_to_CCT_Robertson1968', 'TestCCT_to_uv_Robertson1968',
     'TestCCT_to_uv_Krystek1985', 'Testxy_to_CCT_McCamy1992',
     'Testxy_to_CCT_Hernandez1999', 'TestCCT_to_xy_Kang2002',
@@ -216,6 +223,40 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.15316417, -0.08437064]),
             decimal=7)
 
+    def test_n_dimensional_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+        CCT_D_uv = np.array([uv_to_CCT_Ohno2013(x, cmfs) for x in uv])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
+        uv = np.tile(uv, (3, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (3, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            uv_to_CCT_Ohno2013(case)
+
 
 class TestCCT_to_uv_Ohno2013(unittest.TestCase):
     """
@@ -244,6 +285,172 @@ class TestCCT_to_uv_Ohno2013(unittest.TestCase):
             np.array([0.29247364, 0.27215157]),
             decimal=7)
 
+    def test_n_dimensional_CCT_to_uv_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        CCT = np.array([6507.47380460, 1041.68315360])
+        D_uv = np.array([0.00322335, -0.06737802])
+        uv = np.array([
+            CCT_to_uv_Ohno2013(CCT_i, D_uv_i, cmfs)
+            for CCT_i, D_uv_i in zip(CCT, D_uv)
+        ])
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv, cmfs), uv, decimal=7)
+
+        CCT = np.tile(CCT, 3)
+        D_uv = np.tile(D_uv, 3)
+        uv = np.tile(uv, (3, 1))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv, cmfs), uv, decimal=7)
+
+        CCT = np.reshape(CCT, (2, 3))
+        D_uv = np.reshape(D_uv, (2, 3))
+        uv = np.reshape(uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv, cmfs), uv, decimal=7)
+
+
+class TestPlanckianLocus(unittest.TestCase):
+    """
+    Defines :class:`colour.temperature.cct.PlanckianLocus` class units tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'name', 'nbytes')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PlanckianLocus))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__repr__', 'uv_to_CCT')
+
+        for method in required_methods:
+            self.assertIn(method, dir(PlanckianLocus))
+
+    def test_table(self):
+        """
+        Tests :attr:`colour.temperature.cct.PlanckianLocus.table` property.
+        """
+
+        self.assertRaises(AssertionError, PlanckianLocus, np.ones([8, 2]))
+        self.assertRaises(AssertionError, PlanckianLocus, np.ones([2, 3]))
+
+    def test_uv_to_CCT(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocus.uv_to_CCT` method.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        locus = planckian_locus(cmfs)
+
+        uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883],
+                       [0.2927, 0.2722]])
+        CCT_D_uv = uv_to_CCT_Ohno2013(uv, cmfs)
+        CCT_D_uv_l = locus.uv_to_CCT(uv)
+
+        np.testing.assert_allclose(
+            CCT_D_uv_l[..., 0], CCT_D_uv[..., 0], rtol=0.00005)
+        np.testing.assert_allclose(
+            CCT_D_uv_l[..., 1], CCT_D_uv[..., 1], atol=0.000001)
+
+        uv = np.reshape(np.tile(uv, (2, 1)), (2, 3, 2))
+        CCT_D_uv_l = np.reshape(np.tile(CCT_D_uv_l, (2, 1)), (2, 3, 2))
+        np.testing.assert_almost_equal(
+            locus.uv_to_CCT(uv), CCT_D_uv_l, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocus.uv_to_CCT` method
+        nan support.
+        """
+
+        locus = planckian_locus(samples=1024)
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            locus.uv_to_CCT(case)
+
+
+class TestPlanckianLocusDefinition(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.planckian_locus` definition units
+    tests methods.
+    """
+
+    def test_planckian_locus(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus` definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        locus = planckian_locus(cmfs, 1000, 1010, 10)
+
+        np.testing.assert_almost_equal(
+            locus.table[0], PLANCKIAN_TABLE[0, :3], decimal=7)
+        np.testing.assert_almost_equal(
+            locus.table[-1], PLANCKIAN_TABLE[-1, :3], decimal=7)
+
+        self.assertIs(planckian_locus(cmfs, 1000, 1010, 10), locus)
+        self.assertIsNot(planckian_locus(cmfs, 1000, 1020, 10), locus)
+
+        PLANCKIAN_LOCUS_CACHE.clear()
+        self.assertIsNot(planckian_locus(cmfs, 1000, 1010, 10), locus)
+
+
+class TestReadWritePlanckianLocus(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.read_planckian_locus` and
+    :func:`colour.temperature.cct.write_planckian_locus` definitions units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_write_planckian_locus(self):
+        """
+        Tests :func:`colour.temperature.cct.read_planckian_locus` and
+        :func:`colour.temperature.cct.write_planckian_locus` definitions.
+        """
+
+        locus = planckian_locus(samples=1024)
+        path = os.path.join(self._temporary_directory, 'locus.npz')
+
+        self.assertTrue(write_planckian_locus(locus, path))
+
+        locus_r = read_planckian_locus(path)
+        self.assertEqual(locus_r.name, locus.name)
+        np.testing.assert_equal(locus_r.table, locus.table)
+
+        uv = np.array([0.1978, 0.3122])
+        np.testing.assert_equal(locus_r.uv_to_CCT(uv), locus.uv_to_CCT(uv))
+
 
 class Testuv_to_CCT_Robertson1968(unittest.TestCase):
     """
@@ -261,6 +468,34 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
             np.testing.assert_allclose(
                 uv_to_CCT_Robertson1968(value), key, atol=0.25)
 
+    def test_n_dimensional_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968` definition
+        n-dimensional arrays support.
+        """
+
+        uv = np.array(list(TEMPERATURE_DUV_TO_UV.values()))
+        CCT_D_uv = np.array([uv_to_CCT_Robertson1968(x) for x in uv])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv), CCT_D_uv, decimal=7)
+
+        uv = np.reshape(uv[:6], (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv[:6], (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv), CCT_D_uv, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            uv_to_CCT_Robertson1968(case)
+
 
 class TestCCT_to_uv_Robertson1968(unittest.TestCase):
     """
@@ -278,6 +513,35 @@ class TestCCT_to_uv_Robertson1968(unittest.TestCase):
             np.testing.assert_almost_equal(
                 CCT_to_uv_Robertson1968(*key), value, decimal=7)
 
+    def test_n_dimensional_CCT_to_uv_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Robertson1968` definition
+        n-dimensional arrays support.
+        """
+
+        CCT, D_uv = np.transpose(list(TEMPERATURE_DUV_TO_UV.keys()))
+        uv = np.array(list(TEMPERATURE_DUV_TO_UV.values()))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(CCT, D_uv), uv, decimal=7)
+
+        CCT = np.reshape(CCT[:6], (2, 3))
+        D_uv = np.reshape(D_uv[:6], (2, 3))
+        uv = np.reshape(uv[:6], (2, 3, 2))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(CCT, D_uv), uv, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_CCT_to_uv_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Robertson1968` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            CCT_to_uv_Robertson1968(*case)
+
 
 class TestCCT_to_uv_Krystek1985(unittest.TestCase):
     """
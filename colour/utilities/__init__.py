@@ -2,7 +2,8 @@
 
 from __future__ import absolute_import
 
-from .data_structures import Lookup, Structure, CaseInsensitiveMapping
+from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
+                              LRUCache)
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
@@ -11,7 +12,8 @@ from .common import (
     first_item, get_domain_range_scale, set_domain_range_scale,
     domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
     to_domain_degrees, to_domain_int, from_range_1, from_range_10,
-    from_range_100, from_range_degrees, from_range_int)
+    from_range_100, from_range_degrees, from_range_int,
+    get_default_float_dtype, set_default_float_dtype, default_float_dtype)
 from .array import (as_array, as_int_array, as_float_array, as_numeric, as_int,
                     as_float, as_namedtuple, closest_indexes, closest,
                     normalise_maximum, interval, is_uniform, in_array, tstack,
@@ -24,7 +26,7 @@ from .verbose import (ColourWarning, message_box, show_warning, warning,
                       ANCILLARY_RUNTIME_PACKAGES,
                       ANCILLARY_DEVELOPMENT_PACKAGES, describe_environment)
 
-__all__ = ['Lookup', 'Structure', 'CaseInsensitiveMapping']
+__all__ = ['Lookup', 'Structure', 'CaseInsensitiveMapping', 'LRUCache']
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
@@ -34,7 +36,8 @@ __all__ += [
     'set_domain_range_scale', 'domain_range_scale', 'to_domain_1',
     'to_domain_10', 'to_domain_100', 'to_domain_degrees', 'to_domain_int',
     'from_range_1', 'from_range_10', 'from_range_100', 'from_range_degrees',
-    'from_range_int'
+    'from_range_int', 'get_default_float_dtype', 'set_default_float_dtype',
+    'default_float_dtype'
 ]
 __all__ += [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
@@ -23,7 +23,8 @@ import numpy as np
 from collections import Mapping
 from contextlib import contextmanager
 
-from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE, EPSILON
+from colour.constants import DEFAULT_INT_DTYPE, EPSILON
+from colour.utilities.common import get_default_float_dtype
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -41,7 +42,7 @@ __all__ = [
 ]
 
 
-def as_array(a, dtype=DEFAULT_FLOAT_DTYPE):
+def as_array(a, dtype=None):
     """
     Converts given :math:`a` variable to *ndarray* with given type.
 
@@ -50,7 +51,8 @@ def as_array(a, dtype=DEFAULT_FLOAT_DTYPE):
     a : object
         Variable to convert.
     dtype : object
-        Type to use for conversion.
+        Type to use for conversion, default to the current *Colour* default
+        floating point number dtype.
 
     Returns
     -------
@@ -65,6 +67,9 @@ def as_array(a, dtype=DEFAULT_FLOAT_DTYPE):
     array([1, 2, 3])
     """
 
+    if dtype is None:
+        dtype = get_default_float_dtype()
+
     return np.asarray(a, dtype)
 
 
@@ -94,8 +99,10 @@ def as_int_array(a):
 
 def as_float_array(a):
     """
-    Converts given :math:`a` variable to *ndarray* using the type defined by
-    :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    Converts given :math:`a` variable to *ndarray* using the current *Colour*
+    default floating point number dtype, i.e.
+    :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute unless changed with
+    :func:`colour.utilities.set_default_float_dtype` definition.
 
     Parameters
     ----------
@@ -113,10 +120,10 @@ def as_float_array(a):
     array([ 1.,  2.,  3.])
     """
 
-    return as_array(a, DEFAULT_FLOAT_DTYPE)
+    return as_array(a, get_default_float_dtype())
 
 
-def as_numeric(a, dtype=DEFAULT_FLOAT_DTYPE):
+def as_numeric(a, dtype=None):
     """
     Converts given :math:`a` variable to *numeric*. In the event where
     :math:`a` cannot be converted, it is passed as is.
@@ -126,7 +133,8 @@ def as_numeric(a, dtype=DEFAULT_FLOAT_DTYPE):
     a : object
         Variable to convert.
     dtype : object
-        Type to use for conversion.
+        Type to use for conversion, default to the current *Colour* default
+        floating point number dtype.
 
     Returns
     -------
@@ -141,6 +149,9 @@ def as_numeric(a, dtype=DEFAULT_FLOAT_DTYPE):
     array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
     """
 
+    if dtype is None:
+        dtype = get_default_float_dtype()
+
     try:
         return dtype(a)
     except TypeError:
@@ -222,7 +233,7 @@ def as_float(a):
     """
 
     try:
-        return DEFAULT_FLOAT_DTYPE(a)
+        return get_default_float_dtype()(a)
     except TypeError:
         return as_float_array(a)
 
@@ -495,7 +506,7 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a, dtype=DEFAULT_FLOAT_DTYPE):
+def tstack(a, dtype=None):
     """
     Stacks arrays in sequence along the last axis (tail).
 
@@ -506,7 +517,8 @@ def tstack(a, dtype=DEFAULT_FLOAT_DTYPE):
     a : array_like
         Array to perform the stacking.
     dtype : object
-        Type to use for initial conversion to *ndarray*.
+        Type to use for initial conversion to *ndarray*, default to the
+        current *Colour* default floating point number dtype.
 
     Returns
     -------
@@ -548,7 +560,7 @@ def tstack(a, dtype=DEFAULT_FLOAT_DTYPE):
     return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
 
 
-def tsplit(a, dtype=DEFAULT_FLOAT_DTYPE):
+def tsplit(a, dtype=None):
     """
     Splits arrays in sequence along the last axis (tail).
 
@@ -557,7 +569,8 @@ def tsplit(a, dtype=DEFAULT_FLOAT_DTYPE):
     a : array_like
         Array to perform the splitting.
     dtype : object
-        Type to use for initial conversion to *ndarray*.
+        Type to use for initial conversion to *ndarray*, default to the
+        current *Colour* default floating point number dtype.
 
     Returns
     -------
@@ -11,6 +11,8 @@ Defines various data structures classes:
     retrieve keys by values.
 -   :class:`colour.utilities.CaseInsensitiveMapping`: A case insensitive
     mapping allowing values retrieving from keys while ignoring the key case.
+-   :class:`colour.utilities.LRUCache`: A mapping bounded by entries count
+    and / or bytes size, discarding the least recently used items first.
 
 References
 ----------
@@ -27,7 +29,9 @@ structures.py#L37
 
 from __future__ import division, unicode_literals
 
-from collections import Mapping, MutableMapping
+import sys
+import threading
+from collections import Mapping, MutableMapping, OrderedDict
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,7 +40,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['Structure', 'Lookup', 'CaseInsensitiveMapping']
+__all__ = ['Structure', 'Lookup', 'CaseInsensitiveMapping', 'LRUCache']
 
 
 class Structure(dict):
@@ -388,3 +392,401 @@ class CaseInsensitiveMapping(MutableMapping):
         """
 
         return ((item, value[1]) for (item, value) in self._data.items())
+
+
+class LRUCache(MutableMapping):
+    """
+    Implements a mutable mapping / *dict* object bounded by entries count
+    and / or bytes size, discarding the least recently used items first when
+    the bounds are exceeded.
+
+    The bytes size of an item value is given by its ``nbytes`` attribute,
+    e.g. :class:`numpy.ndarray` class instances, or by :func:`sys.getsizeof`
+    definition otherwise.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum items count, *None* meaning unbounded.
+    maximum_bytes : int, optional
+        Maximum items values bytes size, *None* meaning unbounded.
+
+    Attributes
+    ----------
+    maximum_size
+    maximum_bytes
+    nbytes
+    hits
+    misses
+    evictions
+    statistics
+
+    Methods
+    -------
+    __setitem__
+    __getitem__
+    __delitem__
+    __contains__
+    __iter__
+    __len__
+    __repr__
+    clear
+
+    Notes
+    -----
+    -   Item retrieval with :meth:`colour.utilities.LRUCache.__getitem__`
+        method, and thus :meth:`dict.get` method, updates the items recency
+        and the hits and misses statistics whereas
+        :meth:`colour.utilities.LRUCache.__contains__` method does not.
+    -   The items mutations, retrievals and the statistics are guarded by a
+        re-entrant lock, allowing the cache to be shared between threads.
+
+    Examples
+    --------
+    >>> cache = LRUCache(maximum_size=2)
+    >>> cache['John'] = 'Doe'
+    >>> cache['Jane'] = 'Doe'
+    >>> cache['John']
+    'Doe'
+    >>> cache['Luke'] = 'Skywalker'
+    >>> sorted(cache.keys())
+    ['John', 'Luke']
+    >>> cache.get('Jane') is None
+    True
+    >>> cache.hits, cache.misses, cache.evictions
+    (1, 1, 1)
+    """
+
+    def __init__(self, maximum_size=None, maximum_bytes=None):
+        self._lock = threading.RLock()
+
+        self._data = OrderedDict()
+        self._nbytes = 0
+
+        self._maximum_size = None
+        self._maximum_bytes = None
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self.maximum_size = maximum_size
+        self.maximum_bytes = maximum_bytes
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the maximum items count.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum items count with, *None* meaning
+            unbounded.
+
+        Returns
+        -------
+        int
+            Maximum items count.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for **self.maximum_size** property.
+        """
+
+        if value is not None:
+            assert value >= 0, (
+                '"{0}" attribute: "{1}" is not a positive number!'.format(
+                    'maximum_size', value))
+
+        with self._lock:
+            self._maximum_size = value
+
+            self._evict()
+
+    @property
+    def maximum_bytes(self):
+        """
+        Getter and setter property for the maximum items values bytes size.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum items values bytes size with, *None*
+            meaning unbounded.
+
+        Returns
+        -------
+        int
+            Maximum items values bytes size.
+        """
+
+        return self._maximum_bytes
+
+    @maximum_bytes.setter
+    def maximum_bytes(self, value):
+        """
+        Setter for **self.maximum_bytes** property.
+        """
+
+        if value is not None:
+            assert value >= 0, (
+                '"{0}" attribute: "{1}" is not a positive number!'.format(
+                    'maximum_bytes', value))
+
+        with self._lock:
+            self._maximum_bytes = value
+
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """
+        Getter property for the items values bytes size.
+
+        Returns
+        -------
+        int
+            Items values bytes size.
+        """
+
+        return self._nbytes
+
+    @property
+    def hits(self):
+        """
+        Getter property for the successful items retrievals count.
+
+        Returns
+        -------
+        int
+            Successful items retrievals count.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Getter property for the unsuccessful items retrievals count.
+
+        Returns
+        -------
+        int
+            Unsuccessful items retrievals count.
+        """
+
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        Getter property for the count of items discarded to satisfy the
+        bounds.
+
+        Returns
+        -------
+        int
+            Discarded items count.
+        """
+
+        return self._evictions
+
+    @property
+    def statistics(self):
+        """
+        Getter property for the cache statistics.
+
+        Returns
+        -------
+        Structure
+            Cache statistics, i.e. *size*, *nbytes*, *maximum_size*,
+            *maximum_bytes*, *hits*, *misses* and *evictions*.
+        """
+
+        with self._lock:
+            return Structure(
+                size=len(self),
+                nbytes=self._nbytes,
+                maximum_size=self._maximum_size,
+                maximum_bytes=self._maximum_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions)
+
+    @staticmethod
+    def _sizeof(value):
+        """
+        Returns the bytes size of given value.
+
+        Parameters
+        ----------
+        value : object
+            Value to return the bytes size of.
+
+        Returns
+        -------
+        int
+            Value bytes size.
+        """
+
+        nbytes = getattr(value, 'nbytes', None)
+
+        return sys.getsizeof(value) if nbytes is None else nbytes
+
+    def _evict(self):
+        """
+        Discards the least recently used items until the bounds are
+        satisfied.
+        """
+
+        while self._data and (
+            (self._maximum_size is not None and
+             len(self._data) > self._maximum_size) or
+            (self._maximum_bytes is not None and
+             self._nbytes > self._maximum_bytes)):
+            _item, (_value, nbytes) = self._data.popitem(last=False)
+            self._nbytes -= nbytes
+            self._evictions += 1
+
+    def __setitem__(self, item, value):
+        """
+        Sets given item with given value and marks it as the most recently
+        used item.
+
+        Parameters
+        ----------
+        item : object
+            Item, must be hashable.
+        value : object
+            Value.
+        """
+
+        nbytes = self._sizeof(value)
+
+        with self._lock:
+            if item in self._data:
+                del self[item]
+
+            self._data[item] = (value, nbytes)
+            self._nbytes += nbytes
+
+            self._evict()
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item and marks it as the most recently used
+        item.
+
+        Parameters
+        ----------
+        item : object
+            Item.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        with self._lock:
+            try:
+                entry = self._data.pop(item)
+            except KeyError:
+                self._misses += 1
+                raise
+
+            self._data[item] = entry
+            self._hits += 1
+
+        return entry[0]
+
+    def __delitem__(self, item):
+        """
+        Deletes given item.
+
+        Parameters
+        ----------
+        item : object
+            Item.
+        """
+
+        with self._lock:
+            _value, nbytes = self._data.pop(item)
+            self._nbytes -= nbytes
+
+    def __contains__(self, item):
+        """
+        Returns if the mapping contains given item.
+
+        Parameters
+        ----------
+        item : object
+            Item.
+
+        Returns
+        -------
+        bool
+            Is item in mapping.
+        """
+
+        return item in self._data
+
+    def __iter__(self):
+        """
+        Iterates over the items from the least to the most recently used.
+
+        Returns
+        -------
+        generator
+            Items.
+        """
+
+        with self._lock:
+            return iter(list(self._data.keys()))
+
+    def __len__(self):
+        """
+        Returns the items count.
+
+        Returns
+        -------
+        int
+            Items count.
+        """
+
+        return len(self._data)
+
+    def __repr__(self):
+        """
+        Returns the mapping representation.
+
+        Returns
+        -------
+        unicode
+            Mapping representation.
+        """
+
+        with self._lock:
+            return ('{0}(size={1}, nbytes={2}, maximum_size={3}, '
+                    'maximum_bytes={4}, hits={5}, misses={6})').format(
+                        self.__class__.__name__, len(self), self._nbytes,
+                        self._maximum_size, self._maximum_bytes, self._hits,
+                        self._misses)
+
+    def clear(self):
+        """
+        Deletes all the items and resets the statistics.
+        """
+
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -15,7 +15,7 @@ from colour.utilities import (
     as_namedtuple, closest_indexes, closest, normalise_maximum, interval,
     is_uniform, in_array, tstack, tsplit, row_as_diagonal, dot_vector,
     dot_matrix, orient, centroid, linear_conversion, lerp, fill_nan,
-    ndarray_write)
+    ndarray_write, default_float_dtype)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -87,6 +87,9 @@ class TestAsFloatArray(unittest.TestCase):
 
         self.assertEqual(as_float_array([1, 2, 3]).dtype, DEFAULT_FLOAT_DTYPE)
 
+        with default_float_dtype(np.float32):
+            self.assertEqual(as_float_array([1, 2, 3]).dtype, np.float32)
+
 
 class TestAsNumeric(unittest.TestCase):
     """
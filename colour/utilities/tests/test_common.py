@@ -12,7 +12,8 @@ from collections import OrderedDict
 from colour.utilities import (
     batch, is_iterable, is_string, is_numeric, is_integer, is_sibling,
     filter_kwargs, filter_mapping, first_item, get_domain_range_scale,
-    set_domain_range_scale, domain_range_scale, to_domain_1, to_domain_10,
+    set_domain_range_scale, domain_range_scale, get_default_float_dtype,
+    set_default_float_dtype, default_float_dtype, to_domain_1, to_domain_10,
     to_domain_100, to_domain_int, to_domain_degrees, from_range_1,
     from_range_10, from_range_100, from_range_int, from_range_degrees)
 
@@ -393,6 +394,88 @@ class TestDomainRangeScale(unittest.TestCase):
         self.assertEqual(get_domain_range_scale(), 'reference')
 
 
+class TestGetDefaultFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.get_default_float_dtype` definition
+    units tests methods.
+    """
+
+    def test_get_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.common.get_default_float_dtype`
+        definition.
+        """
+
+        self.assertIs(get_default_float_dtype(), np.float64)
+
+        with default_float_dtype(np.float32):
+            self.assertIs(get_default_float_dtype(), np.float32)
+
+        with default_float_dtype(np.float16):
+            self.assertIs(get_default_float_dtype(), np.float16)
+
+
+class TestSetDefaultFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.set_default_float_dtype` definition
+    units tests methods.
+    """
+
+    def test_set_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.common.set_default_float_dtype`
+        definition.
+        """
+
+        with default_float_dtype(np.float64):
+            set_default_float_dtype(np.float32)
+            self.assertIs(get_default_float_dtype(), np.float32)
+
+        with default_float_dtype(np.float64):
+            set_default_float_dtype('float32')
+            self.assertIs(get_default_float_dtype(), np.float32)
+
+        with default_float_dtype(np.float32):
+            set_default_float_dtype()
+            self.assertIs(get_default_float_dtype(), np.float64)
+
+        self.assertRaises(AssertionError,
+                          lambda: set_default_float_dtype(np.int_))
+
+
+class TestDefaultFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.default_float_dtype` definition
+    units tests methods.
+    """
+
+    def test_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.common.default_float_dtype` definition.
+        """
+
+        self.assertIs(get_default_float_dtype(), np.float64)
+
+        with default_float_dtype(np.float32):
+            self.assertIs(get_default_float_dtype(), np.float32)
+            self.assertEqual(to_domain_1([1, 2, 3]).dtype, np.float32)
+            self.assertEqual(
+                to_domain_int(1, dtype=np.float16).dtype, np.float16)
+
+        self.assertIs(get_default_float_dtype(), np.float64)
+
+        @default_float_dtype(np.float32)
+        def dtype():
+            """
+            Returns the current *Colour* default floating point number dtype.
+            """
+
+            return get_default_float_dtype()
+
+        self.assertIs(dtype(), np.float32)
+        self.assertIs(get_default_float_dtype(), np.float64)
+
+
 class TestToDomain1(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.to_domain_1` definition units
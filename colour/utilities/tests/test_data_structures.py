@@ -7,9 +7,11 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import pickle
+import threading
 import unittest
 
-from colour.utilities import Structure, Lookup, CaseInsensitiveMapping
+from colour.utilities import (Structure, Lookup, CaseInsensitiveMapping,
+                              LRUCache)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +20,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping']
+__all__ = [
+    'TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping', 'TestLRUCache'
+]
 
 
 class TestStructure(unittest.TestCase):
@@ -277,5 +281,153 @@ CaseInsensitiveMapping.lower_items` method.
             [('jane', 'Doe'), ('john', 'Doe')])
 
 
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.LRUCache` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('maximum_size', 'maximum_bytes', 'nbytes',
+                               'hits', 'misses', 'evictions', 'statistics')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__setitem__', '__getitem__',
+                            '__delitem__', '__contains__', '__iter__',
+                            '__len__', '__repr__', 'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.LRUCache.maximum_size`
+        attribute.
+        """
+
+        cache = LRUCache(maximum_size=2)
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+        self.assertEqual(cache['John'], 'Doe')
+
+        cache['Luke'] = 'Skywalker'
+        self.assertListEqual(list(cache), ['John', 'Luke'])
+        self.assertEqual(cache.evictions, 1)
+
+        cache.maximum_size = 1
+        self.assertListEqual(list(cache), ['Luke'])
+        self.assertEqual(cache.evictions, 2)
+
+    def test_maximum_bytes(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.LRUCache.maximum_bytes`
+        attribute.
+        """
+
+        cache = LRUCache(maximum_bytes=64)
+        cache['a'] = np.zeros(4)
+        cache['b'] = np.zeros(4)
+        self.assertEqual(cache.nbytes, 64)
+
+        cache['c'] = np.zeros(2)
+        self.assertListEqual(list(cache), ['b', 'c'])
+        self.assertEqual(cache.nbytes, 48)
+
+        cache['d'] = np.zeros(16)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+        cache['b'] = np.zeros(2)
+        cache['b'] = np.zeros(4)
+        self.assertEqual(cache.nbytes, 32)
+
+    def test_statistics(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.LRUCache.statistics`
+        attribute.
+        """
+
+        cache = LRUCache()
+        cache['John'] = 'Doe'
+        self.assertEqual(cache['John'], 'Doe')
+        self.assertIsNone(cache.get('Jane'))
+        self.assertIn('John', cache)
+        self.assertNotIn('Jane', cache)
+
+        statistics = cache.statistics
+        self.assertEqual(statistics.size, 1)
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+        self.assertEqual(statistics.evictions, 0)
+
+    def test__delitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__delitem__`
+        method.
+        """
+
+        cache = LRUCache()
+        cache['a'] = np.zeros(4)
+        del cache['a']
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.clear` method.
+        """
+
+        cache = LRUCache()
+        cache['a'] = np.zeros(4)
+        cache.get('a')
+        cache.get('b')
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_thread_safety(self):
+        """
+        Tests :class:`colour.utilities.data_structures.LRUCache` class thread
+        safety.
+        """
+
+        cache = LRUCache(maximum_size=8)
+
+        def worker(offset):
+            """
+            Sets and retrieves items from the cache.
+            """
+
+            for i in range(1000):
+                cache[(offset + i) % 16] = np.zeros(4)
+                cache.get((offset + i + 1) % 16)
+
+        threads = [
+            threading.Thread(target=worker, args=(i, )) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 8)
+        self.assertEqual(cache.nbytes, 8 * np.zeros(4).nbytes)
+        self.assertEqual(cache.hits + cache.misses, 4000)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -27,8 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'APPLICATION_NAME', 'PYTHON_PACKAGE_NAME', 'PYPI_PACKAGE_NAME', 'clean',
-    'formatting', 'tests', 'quality', 'examples', 'docs', 'todo', 'preflight',
-    'build', 'virtualise', 'tag', 'release', 'sha256'
+    'formatting', 'tests', 'benchmarks', 'quality', 'examples', 'docs', 'todo',
+    'preflight', 'build', 'virtualise', 'tag', 'release', 'sha256'
 ]
 
 APPLICATION_NAME = colour.__application_name__
@@ -130,6 +130,32 @@ def tests(ctx, nose=True):
         ctx.run('pytest -W ignore')
 
 
+@task
+def benchmarks(ctx, quick=False, bench=None):
+    """
+    Runs the benchmarks with *Airspeed Velocity* in the current environment.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+    quick : bool, optional
+        Whether to run each benchmark only once.
+    bench : unicode, optional
+        Regular expression of the benchmarks to run.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    message_box('Running "Airspeed Velocity" benchmarks...')
+    ctx.run('asv run --python=same{0}{1}'.format(
+        ' --quick' if quick else '',
+        ' --bench "{0}"'.format(bench) if bench else ''))
+
+
 @task
 def quality(ctx, flake8=True, rstlint=True):
     """